@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM 분석 요청/토큰 예산 관리기
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_budget_days (
+    day TEXT PRIMARY KEY,
+    requests INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS llm_budget_window (
+    ticket_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    granted_at REAL NOT NULL,
+    tokens INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_budget_window_time ON llm_budget_window(granted_at);
+"""
+
+
+class BudgetTicket:
+    """예산에서 미리 잡아 둔 요청 1건 (실제 사용량으로 정산)"""
+
+    __slots__ = ('ticket_id', 'day', 'tokens')
+
+    def __init__(self, ticket_id, day, tokens):
+        self.ticket_id = ticket_id
+        self.day = day
+        self.tokens = tokens
+
+
+class BudgetGovernor:
+    """분당/일일 요청 수와 토큰 수 한도 안에서만 LLM 호출을 허용
+
+    일반 항목은 각 한도의 (1 - reserve_ratio)까지만 쓰고 나머지는 고위험
+    후보용으로 남겨 둔다. 분당 한도에 걸리면 창이 비워질 때까지 최대
+    max_wait초 기다려 지속 가능한 최대 속도를 유지하고, 그보다 오래
+    기다려야 하거나 일일 한도를 다 쓰면 호출을 거절해 로컬 분석으로
+    대체하게 한다.
+
+    사용량은 db_path의 SQLite 저장소에 기록하므로 재시작해도 오늘 사용량이
+    이어지고, 같은 저장소를 쓰는 모든 워커 프로세스가 한도를 나눠 쓴다.
+    db_path가 없으면 이 프로세스 안에서만 집계한다.
+    """
+
+    def __init__(self, requests_per_minute, tokens_per_minute, requests_per_day, tokens_per_day,
+                 reserve_ratio=0.2, max_wait=20.0, db_path=None, busy_timeout=30):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_day = requests_per_day
+        self.tokens_per_day = tokens_per_day
+        self.reserve_ratio = reserve_ratio
+        self.max_wait = max_wait
+
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+        # 분석 스레드가 여럿일 수 있으므로 연결 하나를 잠금으로 보호해 공유
+        self.conn = sqlite3.connect(
+            db_path or ':memory:', timeout=busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        self.conn.row_factory = sqlite3.Row
+        if db_path:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(
+            "DELETE FROM llm_budget_days WHERE day < ?", ((date.today() - timedelta(days=7)).isoformat(),)
+        )
+        self._lock = threading.Lock()
+        self.stats = {'granted': 0, 'waited': 0.0, 'denied_minute': 0, 'denied_day': 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성"""
+        return cls(
+            requests_per_minute=config.openai_requests_per_minute,
+            tokens_per_minute=config.openai_tokens_per_minute,
+            requests_per_day=config.openai_requests_per_day,
+            tokens_per_day=config.openai_tokens_per_day,
+            reserve_ratio=config.openai_reserve_ratio,
+            max_wait=config.openai_budget_max_wait,
+            db_path=config.db_path
+        )
+
+    def acquire(self, estimated_tokens, high_priority=False):
+        """예상 토큰만큼 예산 확보 - 성공하면 BudgetTicket, 예산이 없으면 None"""
+        share = 1.0 if high_priority else 1.0 - self.reserve_ratio
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                ticket, wait = self._try_acquire(estimated_tokens, share)
+                if ticket is not None:
+                    self.stats['granted'] += 1
+                    self.stats['waited'] += waited
+                    return ticket
+                if wait is None:
+                    self.stats['denied_day'] += 1
+                    return None
+
+            if waited + wait > self.max_wait:
+                with self._lock:
+                    self.stats['denied_minute'] += 1
+                return None
+            time.sleep(wait)
+            waited += wait
+
+    def _try_acquire(self, estimated_tokens, share):
+        """공유 저장소에서 한도를 확인하고 예산 기록 - (ticket, None), (None, 대기할 초), 일일 한도 초과면 (None, None)"""
+        now = time.time()
+        today = date.today().isoformat()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 60초가 지난 요청은 분당 창에서 제외
+            self.conn.execute("DELETE FROM llm_budget_window WHERE granted_at <= ?", (now - 60.0,))
+            day = self.conn.execute(
+                "SELECT requests, tokens FROM llm_budget_days WHERE day = ?", (today,)
+            ).fetchone()
+            day_requests, day_tokens = (day['requests'], day['tokens']) if day else (0, 0)
+            if (day_requests + 1 > self.requests_per_day * share
+                    or day_tokens + estimated_tokens > self.tokens_per_day * share):
+                self.conn.execute("COMMIT")
+                return None, None
+
+            window = self.conn.execute(
+                "SELECT COUNT(*) AS requests, COALESCE(SUM(tokens), 0) AS tokens, MIN(granted_at) AS oldest "
+                "FROM llm_budget_window"
+            ).fetchone()
+            if (window['requests'] + 1 > self.requests_per_minute * share
+                    or window['tokens'] + estimated_tokens > self.tokens_per_minute * share):
+                self.conn.execute("COMMIT")
+                # 가장 오래된 요청이 분당 창에서 빠질 때까지 대기
+                wait = (window['oldest'] + 60.0 - now) if window['oldest'] is not None else 1.0
+                return None, max(wait, 0.05)
+
+            cursor = self.conn.execute(
+                "INSERT INTO llm_budget_window (granted_at, tokens) VALUES (?, ?)", (now, estimated_tokens)
+            )
+            self.conn.execute(
+                "INSERT INTO llm_budget_days (day, requests, tokens) VALUES (?, 1, ?) "
+                "ON CONFLICT(day) DO UPDATE SET requests = requests + 1, tokens = tokens + excluded.tokens",
+                (today, estimated_tokens)
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return BudgetTicket(cursor.lastrowid, today, estimated_tokens), None
+
+    def settle(self, ticket, actual_tokens):
+        """호출 후 실제 사용 토큰으로 정산 (사용량을 모르면 예상치 유지)"""
+        if ticket is None or actual_tokens is None:
+            return
+        with self._lock:
+            delta = actual_tokens - ticket.tokens
+            ticket.tokens = actual_tokens
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute(
+                    "UPDATE llm_budget_days SET tokens = tokens + ? WHERE day = ?", (delta, ticket.day)
+                )
+                # 아직 분당 창에 있는 요청만 갱신 (이미 빠졌으면 0건)
+                self.conn.execute(
+                    "UPDATE llm_budget_window SET tokens = ? WHERE ticket_id = ?", (actual_tokens, ticket.ticket_id)
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def usage(self):
+        """오늘 사용량(모든 프로세스 합계) 및 이 프로세스의 거절 건수"""
+        with self._lock:
+            day = self.conn.execute(
+                "SELECT requests, tokens FROM llm_budget_days WHERE day = ?", (date.today().isoformat(),)
+            ).fetchone()
+            return {
+                'day_requests': day['requests'] if day else 0,
+                'day_tokens': day['tokens'] if day else 0,
+                **self.stats
+            }
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self.conn.close()
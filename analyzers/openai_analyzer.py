@@ -1,15 +1,36 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-OpenAI 기반 텍스트 분석기 - 디버깅 강화 버전
+OpenAI 기반 텍스트 분석기
 """
 
-import openai
+import json
+import threading
+import time
+
 import logging
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG)
+import openai
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# 로깅 설정은 진입점(utils.logging_setup)에서 한 번만 - 게시글 단위 로그는 샘플링되는 별도 로거 사용
 logger = logging.getLogger(__name__)
+item_logger = logging.getLogger(__name__ + ".items")
+
+# compact 모드 고정 시스템 메시지 - 매 호출 동일하므로 사용자 메시지에는 게시글만 보냄
+COMPACT_SYSTEM_PROMPT = (
+    "너는 자살유발정보 판별기다. 기준: 1)자살동반자 모집 2)구체적 자살 방법 "
+    "3)자살 실행·유도 4)자살위해물건 판매·활용. 사용자 메시지는 게시글이다. "
+    'JSON만 출력: {"score":0.0~1.0,"risky":"Y"|"N","reason":"한 문장 근거"}'
+)
+
+
+class ResponseFormatError(Exception):
+    """compact 모드 응답이 JSON 스키마와 맞지 않음"""
 
 
 class OpenAIAnalyzer:
@@ -18,11 +39,22 @@ class OpenAIAnalyzer:
     def __init__(self, config):
         """OpenAI 분석기 초기화"""
         self.config = config
+        self.model = getattr(config, 'openai_model', 'gpt-3.5-turbo')
+        self.prompt_mode = getattr(config, 'openai_prompt_mode', 'compact')
+        self._encoding = self._load_encoding()
+        self.stats = {
+            'calls': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'latency': 0.0,
+            'parse_failures': 0
+        }
+        self._local = threading.local()  # 스레드별 마지막 호출 사용량 - 재분석 스레드 풀에서 섞이지 않도록
 
         # API 키 상태 상세 로깅
         if config.has_openai_config():
             api_key = config.openai_api_key
-            logger.info(f"OpenAI API 키 감지됨: {api_key[:10]}...{api_key[-4:] if len(api_key) > 14 else ''}")
+            logger.info("OpenAI API 키 감지됨: %s...%s", api_key[:10], api_key[-4:] if len(api_key) > 14 else '')
 
             try:
                 self.client = openai.OpenAI(api_key=config.openai_api_key)
@@ -32,7 +64,7 @@ class OpenAIAnalyzer:
                 self._test_connection()
 
             except Exception as e:
-                logger.error(f"OpenAI 클라이언트 초기화 실패: {e}")
+                logger.error("OpenAI 클라이언트 초기화 실패: %s", e)
                 self.client = None
         else:
             logger.warning("OpenAI API 키가 설정되지 않음")
@@ -42,67 +74,198 @@ class OpenAIAnalyzer:
         """OpenAI API 연결 테스트"""
         try:
             test_response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.model,
                 messages=[{"role": "user", "content": "Hello"}],
                 max_tokens=5
             )
             logger.info("OpenAI API 연결 테스트 성공")
             return True
         except Exception as e:
-            logger.error(f"OpenAI API 연결 테스트 실패: {e}")
+            logger.error("OpenAI API 연결 테스트 실패: %s", e)
             self.client = None
             return False
 
     def analyze(self, text):
         """텍스트 분석"""
-        logger.debug(f"분석 시작 - 텍스트 길이: {len(text)}자")
+        item_logger.debug("분석 시작 - 텍스트 길이: %d자", len(text))
 
         if not self.client:
-            logger.warning("OpenAI 클라이언트가 없음 - 예외 발생")
+            item_logger.warning("OpenAI 클라이언트가 없음 - 예외 발생")
             raise Exception("OpenAI API 설정이 없습니다.")
 
+        if self.prompt_mode == 'compact':
+            return self._analyze_compact(text)
+
         prompt = self._create_analysis_prompt(text)
-        logger.debug(f"프롬프트 생성 완료 - 길이: {len(prompt)}자")
+        item_logger.debug("프롬프트 생성 완료 - 길이: %d자", len(prompt))
 
         try:
-            logger.info("OpenAI API 호출 시작...")
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            response = self._request(
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
-                temperature=0.1
+                max_tokens=300
             )
 
             result = response.choices[0].message.content
-
-            # 강화된 응답 로깅
-            print("=" * 50)
-            print("OpenAI API 응답:")
-            print(result)
-            print("=" * 50)
-
-            logger.info("OpenAI API 호출 성공")
-            logger.debug(f"응답 내용: {result}")
+            item_logger.debug("OpenAI API 응답: %s", result)
 
             parsed_result = self._parse_result(result)
-            logger.debug(f"파싱 결과: {parsed_result}")
+            item_logger.debug("파싱 결과: %s", parsed_result)
 
             return parsed_result
 
         except openai.AuthenticationError as e:
-            logger.error(f"OpenAI 인증 오류: {e}")
+            item_logger.error("OpenAI 인증 오류: %s", e)
             raise Exception(f"OpenAI 인증 실패: API 키를 확인해주세요")
         except openai.RateLimitError as e:
-            logger.error(f"OpenAI 요청 한도 초과: {e}")
+            item_logger.error("OpenAI 요청 한도 초과: %s", e)
             raise Exception(f"OpenAI 요청 한도 초과: 잠시 후 다시 시도해주세요")
         except openai.APIError as e:
-            logger.error(f"OpenAI API 오류: {e}")
+            item_logger.error("OpenAI API 오류: %s", e)
             raise Exception(f"OpenAI API 오류: {e}")
         except Exception as e:
-            logger.error(f"예상치 못한 오류: {e}")
+            item_logger.error("예상치 못한 오류: %s", e)
             raise Exception(f"OpenAI 분석 중 오류: {e}")
 
+    def _analyze_compact(self, text):
+        """토큰 예산 내 JSON 응답 모드 분석"""
+        post = self._truncate_tokens(text, self.config.openai_input_tokens)
+
+        try:
+            response = self._request(
+                messages=[
+                    {"role": "system", "content": COMPACT_SYSTEM_PROMPT},
+                    {"role": "user", "content": post}
+                ],
+                max_tokens=self.config.openai_max_output_tokens,
+                response_format={"type": "json_object"}
+            )
+            return self._parse_json_result(response.choices[0].message.content)
+
+        except ResponseFormatError as e:
+            self.stats['parse_failures'] += 1
+            item_logger.warning("OpenAI 응답 형식 오류: %s", e)
+            raise Exception(f"OpenAI 응답 형식 오류: {e}")
+        except openai.AuthenticationError as e:
+            item_logger.error("OpenAI 인증 오류: %s", e)
+            raise Exception(f"OpenAI 인증 실패: API 키를 확인해주세요")
+        except openai.RateLimitError as e:
+            item_logger.error("OpenAI 요청 한도 초과: %s", e)
+            raise Exception(f"OpenAI 요청 한도 초과: 잠시 후 다시 시도해주세요")
+        except openai.APIError as e:
+            item_logger.error("OpenAI API 오류: %s", e)
+            raise Exception(f"OpenAI API 오류: {e}")
+
+    @property
+    def last_usage(self):
+        """이 스레드에서 마지막으로 호출한 요청의 입력+출력 토큰 수 (실패 시 None)"""
+        return getattr(self._local, 'usage', None)
+
+    @last_usage.setter
+    def last_usage(self, tokens):
+        self._local.usage = tokens
+
+    def _request(self, messages, max_tokens, **kwargs):
+        """chat completion 호출 - 토큰 사용량과 지연 시간 집계"""
+        self.last_usage = None
+        started = time.perf_counter()
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.1,
+            **kwargs
+        )
+        self.stats['latency'] += time.perf_counter() - started
+        self.stats['calls'] += 1
+
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            self.stats['prompt_tokens'] += usage.prompt_tokens or 0
+            self.stats['completion_tokens'] += usage.completion_tokens or 0
+            self.last_usage = (usage.prompt_tokens or 0) + (usage.completion_tokens or 0)
+        return response
+
+    def estimate_tokens(self, text):
+        """호출 1건의 예상 토큰 수 (입력 + 최대 출력) - 예산 확보용"""
+        if self.prompt_mode == 'compact':
+            post = self._truncate_tokens(text, self.config.openai_input_tokens)
+            prompt_tokens = self._count_tokens(COMPACT_SYSTEM_PROMPT) + self._count_tokens(post)
+            return prompt_tokens + 10 + self.config.openai_max_output_tokens
+        return self._count_tokens(self._create_analysis_prompt(text)) + 10 + 300
+
+    def _count_tokens(self, text):
+        """토큰 수 계산 (tiktoken이 없으면 근사)"""
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return int(sum(1.0 if ord(char) > 0x7F else 0.25 for char in text)) + 1
+
+    def _load_encoding(self):
+        """모델 토크나이저 로드 - tiktoken이 없으면 None"""
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(self.model)
+        except Exception:
+            try:
+                return tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                return None
+
+    def _truncate_tokens(self, text, max_tokens):
+        """텍스트를 최대 토큰 수 이내로 자르기"""
+        text = ' '.join(text.split())
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            return self._encoding.decode(tokens[:max_tokens])
+
+        # tiktoken이 없으면 한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰으로 근사
+        budget = float(max_tokens)
+        for index, char in enumerate(text):
+            budget -= 1.0 if ord(char) > 0x7F else 0.25
+            if budget < 0:
+                return text[:index]
+        return text
+
+    def _parse_json_result(self, result):
+        """compact 모드 JSON 응답 검증 및 변환"""
+        try:
+            data = json.loads(result)
+        except (TypeError, ValueError):
+            raise ResponseFormatError(f"JSON 아님: {str(result)[:80]}")
+
+        if not isinstance(data, dict):
+            raise ResponseFormatError("JSON 객체가 아님")
+
+        score = data.get('score')
+        if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0.0 <= score <= 1.0:
+            raise ResponseFormatError(f"score 값 오류: {score!r}")
+
+        risky = data.get('risky')
+        if not isinstance(risky, str) or risky.strip().upper() not in ('Y', 'N'):
+            raise ResponseFormatError(f"risky 값 오류: {risky!r}")
+
+        reason = data.get('reason', '')
+        if not isinstance(reason, str):
+            raise ResponseFormatError(f"reason 값 오류: {reason!r}")
+
+        reason = ' '.join(reason.split())[:self.config.openai_reason_max_chars]
+        return float(score), risky.strip().upper(), reason
+
+    def usage_summary(self):
+        """호출당 평균 토큰/지연 시간 및 파싱 실패 수"""
+        calls = self.stats['calls']
+        if calls == 0:
+            return None
+        return {
+            'calls': calls,
+            'avg_prompt_tokens': self.stats['prompt_tokens'] / calls,
+            'avg_completion_tokens': self.stats['completion_tokens'] / calls,
+            'avg_latency': self.stats['latency'] / calls,
+            'parse_failures': self.stats['parse_failures']
+        }
+
     def _create_analysis_prompt(self, text):
         """분석 프롬프트 생성"""
         return f"""
@@ -125,8 +288,6 @@ class OpenAIAnalyzer:
 
     def _parse_result(self, result):
         """결과 파싱 - 개선된 버전"""
-        logger.debug(f"파싱 시작: {result}")
-
         lines = result.split('\n')
         risk_score = 0.0
         is_risky = 'N'
@@ -134,34 +295,30 @@ class OpenAIAnalyzer:
 
         for line in lines:
             line = line.strip()
-            logger.debug(f"파싱 중인 라인: {line}")
 
             if '위험도:' in line or '위험도 :' in line:
                 try:
                     # 콜론 이후의 텍스트에서 숫자 추출
                     score_text = line.split(':')[1].strip()
                     risk_score = float(score_text)
-                    logger.debug(f"위험도 파싱 성공: {risk_score}")
                 except (ValueError, IndexError) as e:
-                    logger.warning(f"위험도 파싱 실패: {line}, 오류: {e}")
+                    item_logger.warning("위험도 파싱 실패: %s, 오류: %s", line, e)
 
             elif '판정:' in line or '판정 :' in line:
                 try:
                     judgment_text = line.split(':')[1].strip()
                     is_risky = judgment_text.upper()
-                    logger.debug(f"판정 파싱 성공: {is_risky}")
                 except IndexError as e:
-                    logger.warning(f"판정 파싱 실패: {line}, 오류: {e}")
+                    item_logger.warning("판정 파싱 실패: %s, 오류: %s", line, e)
 
             elif '근거:' in line or '근거 :' in line:
                 try:
                     reason_text = line.split(':')[1].strip()
                     reason = reason_text
-                    logger.debug(f"근거 파싱 성공: {reason}")
                 except IndexError as e:
-                    logger.warning(f"근거 파싱 실패: {line}, 오류: {e}")
+                    item_logger.warning("근거 파싱 실패: %s, 오류: %s", line, e)
 
-        logger.info(f"최종 파싱 결과 - 위험도: {risk_score}, 판정: {is_risky}, 근거: {reason}")
+        item_logger.debug("최종 파싱 결과 - 위험도: %s, 판정: %s, 근거: %s", risk_score, is_risky, reason)
         return risk_score, is_risky, reason
 
     def is_available(self):
@@ -30,13 +30,164 @@ class Config:
         self.request_delay = 1.5
         self.timeout = 10
 
+        # 공유 HTTP 전송 계층 설정
+        self.http_connect_timeout = 3.05  # 연결 타임아웃 (읽기 타임아웃은 timeout)
+        self.http_pool_size = 10  # 호스트별 기본 연결 풀 크기
+        self.http_host_pool_sizes = {  # 호스트별 연결 풀 크기
+            'search.dcinside.com': 4,
+            'gall.dcinside.com': 8,
+            'openapi.naver.com': 4,
+            'api.twitter.com': 4
+        }
+        self.dns_cache_ttl = 300  # DNS 조회 결과 재사용 시간 (초, 0이면 사용 안 함)
+        self.stream_post_fetch = True  # 게시글 본문을 스트리밍으로 읽고 조기 종료
+        self.post_byte_cap = 256 * 1024  # 게시글 1건당 최대 수신 바이트
+        self.parse_workers = max(1, min(4, (os.cpu_count() or 2) - 1))  # HTML 파싱 프로세스 수 (0이면 같은 프로세스)
+
+        # 재시도/서킷 브레이커 설정
+        self.retry_max_attempts = 3
+        self.retry_base_delay = 1.0
+        self.retry_max_delay = 30.0
+        self.breaker_failure_threshold = 5
+        self.breaker_recovery_timeout = 60.0
+        self.host_retry_budget = 20  # 호스트별 분당 최대 재시도 횟수
+
+        # 디시인사이드 갤러리 감시 모드 (갤러리 ID, 마이너 갤러리는 'mgallery/ID')
+        self.watch_galleries = [
+            gallery.strip() for gallery in os.getenv("DCINSIDE_WATCH_GALLERIES", "").split(",") if gallery.strip()
+        ]
+        self.watch_interval = 300  # 감시 주기 (초)
+        self.watch_max_pages = 5  # 주기당 갤러리별 최대 목록 페이지 요청 수
+        self.watch_max_posts = 50  # 주기당 갤러리별 최대 본문 요청 수
+
+        # Twitter 필터 스트림 모드 (로컬 테스트 서버를 쓰려면 TWITTER_API_BASE_URL 변경)
+        self.twitter_api_base_url = os.getenv("TWITTER_API_BASE_URL") or "https://api.twitter.com"
+        self.stream_keywords = [
+            keyword.strip() for keyword in os.getenv("TWITTER_STREAM_KEYWORDS", "").split(",") if keyword.strip()
+        ]
+        self.twitter_stream_read_timeout = 90  # 하트비트(약 20초) 없이 이 시간이 지나면 재연결
+        self.stream_flush_interval = 60  # 스트림 결과 저장 주기 (초)
+        self.stream_flush_size = 100  # 이 개수가 쌓이면 주기와 관계없이 저장
+
+        # 위험 게시글 작성 계정 감시 (--watch-accounts)
+        self.watch_account_half_life_days = 30  # 계정 점수 반감기
+        self.watch_account_min_score = 0.1  # 이 점수 아래로 줄어든 계정은 폴링하지 않음
+        self.watch_account_base_interval_hours = 24  # 점수 1인 계정의 폴링 간격 (점수에 반비례)
+        self.watch_account_min_interval_hours = 1
+        self.watch_account_max_interval_hours = 168
+        self.watch_account_max_polls = 30  # 주기당 최대 폴링 계정 수
+        self.watch_account_max_posts = 20  # 요청 1회에 가져올 최대 게시글 수
+        self.watch_account_max_pages = 3  # Twitter 계정 폴링 1회의 최대 요청 수 (남은 구간은 다음 폴링에서)
+        self.watch_account_lookback_days = 7  # 처음 폴링하는 계정은 이 기간의 글부터 수집
+        self.watch_account_cycle_seconds = 900  # 감시 주기 (초)
+
+        # 디시인사이드 검색 결과 요약 점수로 본문 요청 여부 결정 (--lazy-fetch 또는 DCINSIDE_LAZY_FETCH=1)
+        self.lazy_fetch = os.getenv("DCINSIDE_LAZY_FETCH", "").strip().lower() in ('1', 'true', 'yes', 'on')
+        self.lazy_fetch_threshold = 0.2  # 지연 모드에서 본문을 가져올 최소 키워드 점수
+
         # 분석 설정
         self.risk_threshold = 0.3
         self.content_max_length = 1000
+        self.stats_window_hours = 24
+
+        # 분석 우선순위 설정 (키워드 사전 점수 + 최신 글 가산점 + 플랫폼 가중치)
+        self.priority_aging_per_minute = 0.05  # 대기 1분당 올라가는 우선순위
+        self.priority_recency_hours = 24
+        self.priority_recency_bonus = 0.2
+        self.priority_platform_weights = {}  # 예: {'DCInside': 0.1}
+        self.priority_high_threshold = 0.4  # 고위험 후보로 집계할 사전 우선순위
+
+        # 고위험 게시글 알림 설정
+        self.alert_threshold = 0.7  # 이 위험 점수 이상이면 즉시 알림
+        self.alert_webhook_url = os.getenv("ALERT_WEBHOOK_URL")
+        self.alert_file_path = os.path.join("results", "alerts.jsonl")
+        self.alert_batch_size = 20
+        self.alert_flush_interval = 2.0  # 첫 알림 후 묶음 전송까지 최대 대기 (초)
+        self.alert_max_retries = 3
+        self.alert_max_deliveries = 10  # 발송하지 못한 알림을 다음 실행에서 다시 보낼 최대 횟수
+        self.alert_lease_seconds = 300  # 발송 중 알림의 임대 시간 (지나면 다른 프로세스가 다시 보냄)
+        self.alert_slo_seconds = 60.0  # 수집→알림 목표 지연 시간
+
+        # OpenAI 프롬프트 설정
+        self.openai_model = "gpt-3.5-turbo"
+        self.openai_prompt_mode = "compact"  # 'compact' (JSON 응답) 또는 'legacy' (자유 형식)
+        self.openai_input_tokens = 400  # compact 모드에서 게시글 본문에 쓰는 최대 토큰 수
+        self.openai_max_output_tokens = 80
+        self.openai_reason_max_chars = 120
+
+        # OpenAI 요청/토큰 예산 (워커 모드에서는 프로세스마다 적용)
+        self.openai_requests_per_minute = 60
+        self.openai_tokens_per_minute = 40000
+        self.openai_requests_per_day = 10000
+        self.openai_tokens_per_day = 2000000
+        self.openai_reserve_ratio = 0.2  # 고위험 후보 전용으로 남겨 두는 한도 비율
+        self.openai_budget_max_wait = 20.0  # 분당 한도에 걸렸을 때 최대 대기 (초)
 
         # 파일 설정
         self.output_dir = "results"
         self.log_dir = "logs"
+        self.db_path = os.path.join(self.output_dir, "monitoring.db")
+        self.journal_path = os.path.join(self.log_dir, "run_journal.jsonl")
+
+        # 로깅 설정 (LOG_LEVELS 예: "analyzers.openai_analyzer=DEBUG,openai=INFO")
+        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+        self.log_console_level = "INFO"
+        self.log_file = os.path.join(self.log_dir, "monitor.log")
+        self.log_file_max_bytes = 10 * 1024 * 1024
+        self.log_file_backups = 5
+        self.log_queue_size = 10000  # 가득 차면 새 로그를 버림 (분석 루프는 기다리지 않음)
+        self.log_levels = {  # 모듈(로거)별 수준
+            'openai': 'WARNING',
+            'httpx': 'WARNING',
+            'httpcore': 'WARNING',
+            'urllib3': 'WARNING'
+        }
+        self.log_levels.update(self._parse_log_levels(os.getenv("LOG_LEVELS", "")))
+        self.log_sampled_loggers = ['monitor.items', 'analyzers.openai_analyzer.items']  # 게시글 단위 로거
+        self.log_sample_every = 50  # 게시글 단위 로그는 이 건수마다 1건만 출력
+
+        # 단계별 프로파일 설정 (--profile)
+        self.profile_dir = os.path.join(self.log_dir, "profiles")
+        self.profile_top = 15  # 요약에 표시할 상위 함수/메모리 위치 수
+        self.profile_trace_frames = 1  # tracemalloc이 할당마다 기록하는 호출 스택 깊이
+
+        # 층화 표본 모드 설정 (--sample)
+        self.sampling_score_bands = [0.1, 0.3]  # 키워드 사전 점수 구간 경계
+        self.sampling_margin = 0.05  # 플랫폼/키워드별 위험비율 추정 오차 한계
+        self.sampling_confidence = 0.95  # 신뢰수준
+        self.sampling_min_per_stratum = 10  # 층별 최소 표본 수
+        self.sampling_report_every = 25  # 추정치 출력/저장 간격 (표본 수)
+
+        # 적응형 수집량 설정 (--adaptive-quota)
+        self.quota_min_share = 0.2  # 모든 (키워드, 플랫폼)에 고르게 나누는 탐색 예산 비율
+        self.quota_history_days = 30  # 위험 수율 계산에 쓰는 기간 (0이면 전체)
+        self.quota_cost_weights = {'requests': 1.0, 'seconds': 0.1, 'tokens': 0.001}  # 게시글당 비용 가중치
+        self.quota_cost_decay = 0.8  # 수집할 때마다 이전 비용 기록에 곱하는 값
+        self.quota_max_per_pair = 1000
+        self.quota_min_per_pair = 5
+
+        # 원문 아카이브/재분석 설정
+        self.archive_enabled = True  # 분석한 게시글 본문을 압축 아카이브에 보관
+        self.archive_dir = os.path.join(self.output_dir, "archive")
+        self.archive_segment_bytes = 256 * 1024 * 1024  # 세그먼트 파일 최대 크기
+        self.archive_compress_level = 6  # zlib 압축 수준 (1~9)
+        self.reanalyze_workers = os.cpu_count() or 2  # 재분석 동시 처리 수
+        self.reanalyze_batch_size = 500  # 재분석 묶음 크기
+
+        # 작업 큐/워커 설정
+        self.queue_path = os.path.join(self.output_dir, "work_queue.db")
+        self.queue_pages_per_job = 2
+        self.queue_lease_seconds = 600
+        self.queue_max_attempts = 3
+        self.worker_idle_timeout = 30
+        self.analysis_batch_size = 20
+
+        # 워커 전체에 적용되는 플랫폼별 초당 요청 수
+        self.platform_rate_limits = {
+            'Twitter': 1.0,
+            'Naver Blog': 10.0,
+            'DCInside': 1 / self.request_delay
+        }
 
         # 플랫폼별 설정
         self.platform_config = {
@@ -46,10 +197,12 @@ class Config:
             },
             'naver': {
                 'max_results': 50,
+                'page_size': 100,
                 'enabled': self.has_naver_config()
             },
             'dcinside': {
                 'max_results': 30,
+                'page_size': 20,
                 'enabled': True
             }
         }
@@ -57,6 +210,15 @@ class Config:
         # 설정 검증
         self.validate_config()
 
+    def _parse_log_levels(self, value):
+        """'모듈=수준,모듈=수준' 형식의 모듈별 로그 수준"""
+        levels = {}
+        for entry in value.split(","):
+            name, _, level = entry.partition("=")
+            if name.strip() and level.strip():
+                levels[name.strip()] = level.strip().upper()
+        return levels
+
     def _debug_environment_variables(self):
         """환경변수 디버깅 정보 출력"""
         print("=" * 60)
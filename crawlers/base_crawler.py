@@ -6,6 +6,13 @@
 
 from abc import ABC, abstractmethod
 import time
+import urllib.parse
+import requests
+from datetime import datetime, timedelta
+from models.data_models import PostData
+from .parse_pool import clean_text
+from .resilience import RequestFailure, RetryableError, RETRYABLE_STATUS, get_resilience, parse_retry_after
+from .transport import get_transport
 
 
 class BaseCrawler(ABC):
@@ -15,6 +22,13 @@ class BaseCrawler(ABC):
         """기본 크롤러 초기화"""
         self.config = config
         self.platform_name = "Unknown"
+        self.journal = None  # 실행 저널 (체크포인트/재개용)
+        self.rate_limiter = None  # 워커 간 공유 요청 속도 제한기
+        self.request_count = 0  # 실행 중 보낸 HTTP/API 요청 수
+        self.resilience = get_resilience(config)  # 크롤러 간 공유 재시도/서킷 브레이커
+        self.hosts = []  # 이 크롤러가 요청하는 호스트 (서킷 상태 조회용)
+        self.transport = get_transport(config)  # 크롤러 간 공유 HTTP 연결 풀
+        self.search_error = None  # 마지막 search()를 중간에 멈추게 한 예외 (끝까지 수행했으면 None)
 
     @abstractmethod
     def search(self, keyword, start_date=None, end_date=None):
@@ -23,29 +37,89 @@ class BaseCrawler(ABC):
 
     def _clean_text(self, text):
         """텍스트 정리 공통 메서드"""
-        if not text:
-            return ""
+        return clean_text(text)
 
-        # HTML 태그 제거
-        import re
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'&[a-zA-Z0-9#]+;', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+    def _http_get(self, url, blocked_status=(), **kwargs):
+        """공유 전송 계층으로 보내는 재시도/서킷 브레이커 적용 GET 요청"""
+        return self._http_request('GET', url, blocked_status, **kwargs)
 
-        return text.strip()
+    def _http_request(self, method, url, blocked_status=(), **kwargs):
+        """공유 전송 계층으로 보내는 재시도/서킷 브레이커 적용 HTTP 요청
 
-    def _delay_request(self):
-        """요청 간격 조절"""
-        time.sleep(self.config.request_delay)
+        재시도 대상 상태 코드와 blocked_status(차단 응답)는 실패로 집계한다.
+        """
+        host = urllib.parse.urlsplit(url).netloc
 
-    def _create_data_item(self, url, title, content, keyword, created_at=None):
+        def request():
+            self.request_count += 1
+            try:
+                response = self.transport.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                raise RetryableError(f"연결 오류: {e}")
+
+            if response.status_code in RETRYABLE_STATUS or response.status_code in blocked_status:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                response.close()
+                error_class = RetryableError if response.status_code in RETRYABLE_STATUS else RequestFailure
+                raise error_class(f"HTTP {response.status_code}", response.status_code, retry_after)
+
+            response.raise_for_status()
+            return response
+
+        return self.resilience.call(host, request)
+
+    def circuit_state(self):
+        """요청 호스트들의 서킷 상태 ('closed', 'half_open', 'open')"""
+        return self.resilience.state_for(self.hosts)
+
+    def circuit_retry_in(self):
+        """서킷이 다시 요청을 허용할 때까지 남은 초"""
+        return self.resilience.retry_in(self.hosts)
+
+    def _window_position(self, created_at, start_date=None, end_date=None):
+        """작성일시가 수집 기간 이전('before')/이후('after')/안('in')인지 판정
+
+        종료일은 그날 하루 전체를 포함하며, 작성일시를 모르면 'in'으로 본다.
+        """
+        if not isinstance(created_at, datetime):
+            return 'in'
+        if start_date is not None and created_at < start_date:
+            return 'before'
+        if end_date is not None and created_at >= end_date + timedelta(days=1):
+            return 'after'
+        return 'in'
+
+    def _completed_page(self, keyword, page):
+        """저널에 완료 기록이 있는 페이지면 (items, cursor) 반환"""
+        if self.journal is None:
+            return None
+        return self.journal.get_page(keyword, self.platform_name, page)
+
+    def _record_page(self, keyword, page, items, cursor=None):
+        """페이지 수집 완료를 저널에 기록"""
+        if self.journal is not None:
+            self.journal.record_page(keyword, self.platform_name, page, items, cursor)
+
+    def _delay_request(self, delay=None):
+        """요청 간격 조절 - 공유 속도 제한기가 있으면 전체 워커 기준으로 조절"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.platform_name)
+        else:
+            time.sleep(self.config.request_delay if delay is None else delay)
+
+    def _create_data_item(self, url, title, content, keyword, created_at=None, author='', author_link='',
+                          fetch_status='fetched'):
         """표준 데이터 아이템 생성"""
-        return {
-            'platform': self.platform_name,
-            'url': url,
-            'title': self._clean_text(title),
-            'content': self._clean_text(content)[:self.config.content_max_length],
-            'keyword': keyword,
-            'created_at': created_at,
-            'crawl_success': len(content.strip()) > 0
-        }
+        return PostData(
+            platform=self.platform_name,
+            url=url,
+            title=self._clean_text(title),
+            content=self._clean_text(content)[:self.config.content_max_length],
+            keyword=keyword,
+            created_at=created_at,
+            crawl_success=len(content.strip()) > 0,
+            author=author,
+            author_link=author_link,
+            fetch_status=fetch_status,
+            fetched_at=datetime.now()
+        )
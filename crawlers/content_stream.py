@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 HTML 본문 추출기
+"""
+
+import codecs
+from html.parser import HTMLParser
+
+
+# 값이 없는 태그 (닫는 태그가 오지 않으므로 깊이 계산에서 제외)
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+
+# 텍스트를 수집하지 않는 태그
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+def supported_accept_encoding():
+    """설치된 디코더 기준으로 가장 강한 압축 방식을 포함한 Accept-Encoding 값"""
+    encodings = []
+
+    try:
+        import zstandard  # noqa: F401
+        from urllib3.response import ZstdDecoder  # noqa: F401
+        encodings.append('zstd')
+    except ImportError:
+        pass
+
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+
+    encodings.extend(['gzip', 'deflate'])
+    return ', '.join(encodings)
+
+
+class ContentExtractor(HTMLParser):
+    """본문 컨테이너의 텍스트만 점진적으로 추출하는 파서
+
+    feed()로 응답 조각을 넘기다가 컨테이너가 닫히거나 필요한 길이만큼
+    텍스트가 모이면 done이 True가 되어 나머지 응답은 읽지 않아도 된다.
+    date_classes가 주어지면 본문보다 앞에 오는 작성일시 요소의 title 속성
+    (없으면 텍스트)을 date_text에 담는다.
+    """
+
+    def __init__(self, container_classes, max_chars=None, date_classes=None):
+        super().__init__(convert_charrefs=True)
+        self.container_classes = set(container_classes)
+        self.max_chars = max_chars
+        self.date_classes = set(date_classes or ())
+        self.date_text = None
+        self._capture_date = False
+        self.done = False
+        self._depth = 0  # 컨테이너 내부 태그 깊이 (0이면 컨테이너 밖)
+        self._skip_depth = 0
+        self._parts = []
+        self._length = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+
+        if self._depth == 0:
+            attrs = dict(attrs)
+            classes = (attrs.get('class') or '').split()
+            if self.date_text is None and self.date_classes.intersection(classes):
+                self.date_text = attrs.get('title')
+                self._capture_date = not self.date_text
+            if self.container_classes.intersection(classes):
+                self._depth = 1
+            return
+
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        if tag not in VOID_TAGS:
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if self.done or self._depth == 0 or tag in VOID_TAGS:
+            return
+
+        if tag in SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+
+        self._depth -= 1
+        if self._depth == 0:
+            # 내용이 너무 짧은 컨테이너(빈 래퍼 등)면 다음 컨테이너를 계속 탐색
+            if len(self.text) > 10:
+                self.done = True
+            else:
+                self._parts = []
+                self._length = 0
+
+    def handle_data(self, data):
+        if self._capture_date and data.strip():
+            self.date_text = data.strip()
+            self._capture_date = False
+
+        if self.done or self._depth == 0 or self._skip_depth > 0:
+            return
+
+        data = data.strip()
+        if not data:
+            return
+
+        self._parts.append(data)
+        self._length += len(data)
+        if self.max_chars and self._length >= self.max_chars:
+            self.done = True
+
+    @property
+    def text(self):
+        """지금까지 추출된 본문 텍스트"""
+        return ''.join(self._parts)
+
+
+def wire_bytes(response, decoded_bytes=0):
+    """지금까지 네트워크로 받은 (압축 해제 전) 바이트 수
+
+    urllib3 응답의 tell()을 쓰고, 알 수 없으면 decoded_bytes(압축 해제 후
+    길이)로 대신한다.
+    """
+    tell = getattr(response.raw, 'tell', None)
+    try:
+        received = tell() if tell is not None else 0
+    except Exception:
+        received = 0
+    return received or decoded_bytes
+
+
+def extract_streaming(response, container_classes, byte_cap, max_chars=None, chunk_size=8192,
+                      date_classes=None):
+    """응답 본문을 조각 단위로 읽으며 본문 추출 - (text, 수신 바이트 수, 작성일시 텍스트) 반환
+
+    수신 바이트와 byte_cap은 압축 해제 전 네트워크 바이트 기준이다.
+    """
+    parser = ContentExtractor(container_classes, max_chars, date_classes)
+    # charset이 없는 text/html 응답에 requests가 붙이는 ISO-8859-1 기본값은 무시
+    encoding = response.encoding
+    if not encoding or encoding.upper() == 'ISO-8859-1':
+        encoding = 'utf-8'
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    decoded = 0
+    bytes_read = 0
+
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if not chunk:
+            continue
+        decoded += len(chunk)
+        bytes_read = wire_bytes(response, decoded)
+        parser.feed(decoder.decode(chunk))
+        if parser.done or bytes_read >= byte_cap:
+            break
+
+    text = parser.text
+    return (text if len(text) > 10 else ''), bytes_read, parser.date_text
@@ -4,11 +4,20 @@
 디시인사이드 크롤러
 """
 
-import requests
+import time
 import urllib.parse
-from bs4 import BeautifulSoup
-from datetime import datetime
+from concurrent.futures import Future
 from .base_crawler import BaseCrawler
+from .content_stream import extract_streaming, wire_bytes
+from .dcinside_parsing import (
+    CONTENT_CLASSES, POST_DATE_CLASSES, parse_board_page, parse_post_date, parse_post_page, parse_search_page
+)
+from .parse_pool import ParsePool
+from .resilience import CircuitOpenError
+
+
+# 차단 응답으로 보고 서킷 브레이커에 집계할 상태 코드
+BLOCKED_STATUS = {403}
 
 
 class DCInsideCrawler(BaseCrawler):
@@ -18,146 +27,280 @@ class DCInsideCrawler(BaseCrawler):
         """디시인사이드 크롤러 초기화"""
         super().__init__(config)
         self.platform_name = "DCInside"
-        self._setup_session()
-
-    def _setup_session(self):
-        """HTTP 세션 설정"""
-        self.session = requests.Session()
-
-        headers = {
+        self.hosts = ['search.dcinside.com', 'gall.dcinside.com']
+        self.fetch_stats = {'posts': 0, 'bytes': 0, 'seconds': 0.0, 'deferred': 0, 'out_of_window': 0}
+        self.prescorer = None  # 지연 모드에서 처음 쓸 때 생성
+        self.parse_pool = ParsePool(config.parse_workers)
+        # 브라우저 요청 헤더 (압축 형식/keep-alive는 공유 전송 계층에서 설정)
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
 
-        self.session.headers.update(headers)
+    def search(self, keyword, max_results=None, start_page=1, end_page=None, start_date=None, end_date=None):
+        """디시인사이드 검색 - start_page/end_page로 검색 페이지 범위 지정 가능
 
-    def search(self, keyword, max_results=None):
+        start_date/end_date가 주어지면 수집 기간 밖의 게시글은 본문 요청과 분석
+        없이 건너뛰고, 목록의 작성일시가 모두 시작일 이전인 페이지에서 검색을 멈춘다.
+        """
         if max_results is None:
             max_results = 30
 
+        self.search_error = None
+        results = []
         try:
             print(f"디시인사이드 검색 시작 - 키워드: {keyword}, 목표: {max_results}개")
-            results = []
-            page = 1
+            page = start_page
+
+            while len(results) < max_results and (end_page is None or page <= end_page):
+                # 이전 실행에서 완료된 페이지는 다시 요청하지 않음
+                checkpoint = self._completed_page(keyword, page)
+                if checkpoint is not None:
+                    page_items, cursor = checkpoint
+                    results.extend(page_items[:max_results - len(results)])
+                    if cursor == 'end':
+                        break
+                    page += 1
+                    continue
 
-            while len(results) < max_results:
                 search_url = f"https://search.dcinside.com/combine/q/{urllib.parse.quote(keyword)}/p/{page}"
-                response = self.session.get(search_url, timeout=self.config.timeout)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                links = self._extract_links(soup)
-                if not links:
+                hits = self.parse_pool.run(parse_search_page, self._get(search_url).content)
+                if not hits:
+                    self._record_page(keyword, page, [], cursor='end')
                     break  # 더 이상 결과 없음
 
-                for link in links:
-                    if len(results) >= max_results:
+                # 본문 응답은 파싱 풀에 넘기고 다음 게시글을 바로 요청 (파싱과 네트워크 대기를 겹침)
+                pending = []
+                dated = 0
+                before_window = 0
+                for hit in hits:
+                    if len(results) + len(pending) >= max_results:
                         break
-                    post_url, post_title = self._process_link(link)
-                    if not post_url:
+
+                    # 목록의 작성일시가 수집 기간 밖이면 본문을 요청하지 않음
+                    listed_at = hit['listed_at']
+                    if listed_at is not None:
+                        dated += 1
+                        position = self._window_position(listed_at, start_date, end_date)
+                        if position != 'in':
+                            before_window += position == 'before'
+                            self.fetch_stats['out_of_window'] += 1
+                            continue
+
+                    # 지연 모드: 검색 결과의 제목/요약만으로 점수가 낮으면 본문 요청 생략
+                    if self.config.lazy_fetch and not self._should_fetch(hit['title'], hit['snippet']):
+                        pending.append((hit, None))
+                        self.fetch_stats['deferred'] += 1
+                        continue
+
+                    pending.append((hit, self._fetch_post(hit['url'])))
+                    self._delay_request()
+
+                page_items = []
+                for hit, future in pending:
+                    if future is None:
+                        page_items.append(self._create_data_item(
+                            url=hit['url'],
+                            title=hit['title'],
+                            content=hit['snippet'],
+                            keyword=keyword,
+                            created_at=hit['listed_at'],
+                            fetch_status='deferred'
+                        ))
+                        continue
+
+                    content, posted_at = self._post_result(future)
+
+                    # 목록에 날짜가 없던 게시글은 본문 페이지의 작성일시로 판정
+                    created_at = hit['listed_at'] or posted_at
+                    if self._window_position(created_at, start_date, end_date) != 'in':
+                        self.fetch_stats['out_of_window'] += 1
                         continue
-                    content = self._crawl_post_content(post_url)
-                    data_item = self._create_data_item(
-                        url=post_url,
-                        title=post_title,
+
+                    page_items.append(self._create_data_item(
+                        url=hit['url'],
+                        title=hit['title'],
                         content=content,
                         keyword=keyword,
-                        created_at=datetime.now().strftime("%Y-%m-%d")
-                    )
-                    results.append(data_item)
-                    self._delay_request()
+                        created_at=created_at
+                    ))
+
+                results.extend(page_items)
+
+                # 날짜가 확인된 목록이 모두 시작일 이전이면 이후 페이지도 기간 밖으로 보고 중단
+                if dated and before_window == dated:
+                    print(f"  {page}페이지 게시글이 모두 수집 기간 이전 - 검색 중단")
+                    self._record_page(keyword, page, page_items, cursor='end')
+                    break
 
+                self._record_page(keyword, page, page_items)
                 page += 1  # 다음 페이지로
 
-            successful_crawls = len([d for d in results if d['crawl_success']])
+            successful_crawls = len([d for d in results if d.crawl_success])
             success_rate = (successful_crawls / len(results) * 100) if results else 0
 
             print(f"디시인사이드에서 {len(results)}개 게시글 수집 완료")
             print(f"크롤링 성공률: {success_rate:.1f}% ({successful_crawls}/{len(results)})")
+            self._print_fetch_stats()
             return results
 
+        except CircuitOpenError as e:
+            self.search_error = e
+            print(f"디시인사이드 검색 중단: {e}")
+            print(f"- 현재까지 수집된 결과: {len(results)}건")
+            return results
         except Exception as e:
+            self.search_error = e
             print(f"디시인사이드 검색 중 오류: {e}")
-            return []
-
-    def _extract_links(self, soup):
-        """링크 추출"""
-        links = soup.find_all('a', class_='tit')
-
-        if not links:
-            # 대안 선택자들
-            alternative_selectors = [
-                'a[href*="/board/view/"]',
-                '.gall_tit a',
-                '.title a',
-                'a.title',
-                '.ub-word a'
-            ]
-
-            for selector in alternative_selectors:
-                try:
-                    links = soup.select(selector)
-                    if links:
-                        print(f"대안 선택자 '{selector}'로 {len(links)}개 링크 발견")
-                        break
-                except Exception:
-                    continue
+            print(f"- 현재까지 수집된 결과: {len(results)}건")
+            return results
+
+    def watch_gallery(self, gallery, last_no=None, max_pages=5, max_posts=50):
+        """갤러리 목록을 최신 페이지부터 훑어 last_no 이후 새 게시글만 수집
+
+        게시글 번호(no)는 갤러리 안에서 단조 증가하므로 last_no보다 큰 번호만
+        새 글이다. 첫 감시(last_no=None)는 1페이지만 기준점으로 삼는다.
+        새 글이 max_posts를 넘으면 오래된 번호부터 처리하고 나머지는 다음
+        주기로 넘기므로 주기당 요청 수가 max_pages + max_posts로 제한된다.
+        본문 요청에 실패한 번호가 있으면 그 앞까지만 돌려주고 기준점도 거기서
+        멈추므로, 실패한 글은 다음 주기에 다시 수집한다.
+        (수집 게시글 목록, 새 last_no) 반환
+        """
+        board = 'mgallery/board' if gallery.startswith('mgallery/') else 'board'
+        gallery_id = gallery.split('/')[-1]
+        keyword = f"갤러리:{gallery_id}"
+
+        new_rows = {}
+        results = []
+        cursor = last_no
+        caught_up = last_no is None
+        try:
+            for page in range(1, (1 if last_no is None else max_pages) + 1):
+                list_url = f"https://gall.dcinside.com/{board}/lists/?id={urllib.parse.quote(gallery_id)}&page={page}"
+                rows = self.parse_pool.run(parse_board_page, self._get(list_url).content, board, gallery_id)
+                self._delay_request()
+                if not rows:
+                    caught_up = True
+                    break
+
+                for row in rows:
+                    if last_no is None or row['no'] > last_no:
+                        new_rows[row['no']] = row
+
+                # 이 페이지에 이미 처리한 번호가 있으면 그 이후 페이지는 모두 이전 글
+                if last_no is not None and min(row['no'] for row in rows) <= last_no:
+                    caught_up = True
+                    break
 
-        return links
+            if not caught_up:
+                print(f"  {gallery}: {max_pages}페이지 안에 이전 기준점이 없음 - 일부 게시글이 누락될 수 있습니다.")
 
-    def _process_link(self, link):
-        """링크 처리"""
-        href = link.get('href', '')
+            pending = []
+            for no in sorted(new_rows)[:max_posts]:
+                pending.append((no, self._fetch_post(new_rows[no]['url'])))
+                self._delay_request()
 
-        if href.startswith('/'):
-            post_url = 'https://gall.dcinside.com' + href
-        elif href.startswith('http'):
-            post_url = href
-        else:
-            return None, None
+            for no, future in pending:
+                # 본문 요청/파싱에 실패한 번호에서 멈춤 - 기준점은 연속으로 성공한 마지막 번호
+                if future.exception() is not None:
+                    print(f"  {gallery}: {no}번 게시글 수집 실패 ({future.exception()}) - 다음 주기에 다시 시도")
+                    break
+                row = new_rows[no]
+                content, posted_at = self._post_result(future)
+                results.append(self._create_data_item(
+                    url=row['url'],
+                    title=row['title'],
+                    content=content,
+                    keyword=keyword,
+                    created_at=row['created_at'] or posted_at,
+                    author=row['author']
+                ))
+                cursor = no
 
-        post_title = link.text.strip()
-        return post_url, post_title
+            if len(new_rows) > max_posts:
+                print(f"  {gallery}: 새 게시글 {len(new_rows)}개 중 {max_posts}개 처리 - 나머지는 다음 주기에 수집")
+            return results, cursor
 
-    def _crawl_post_content(self, url):
-        """게시글 내용 크롤링"""
+        except CircuitOpenError as e:
+            # 처리한 게시글까지만 기준점을 옮기고 나머지는 다음 주기에 다시 시도
+            print(f"  {gallery} 감시 중단: {e}")
+            return results, cursor
+
+    def _should_fetch(self, title, snippet):
+        """제목+요약 사전 점수가 기준 이상인지 확인"""
+        if self.prescorer is None:
+            from analyzers.keyword_analyzer import KeywordAnalyzer
+            self.prescorer = KeywordAnalyzer()
+        score, _, _ = self.prescorer.analyze(f"{title} {snippet}")
+        return score >= self.config.lazy_fetch_threshold
+
+    def _fetch_post(self, url):
+        """게시글 페이지 요청 - (본문, 작성일시)를 돌려줄 Future 반환
+
+        스트리밍 모드는 받는 즉시 조기 종료 파서로 처리하고, 그 외에는 응답
+        바이트를 파싱 풀에 넘긴다. 요청 오류는 예외를 담은 Future로 돌려준다.
+        """
+        started = time.perf_counter()
         try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 다양한 선택자로 내용 추출 시도
-            content_selectors = [
-                'div.writing_view_box',
-                '.write_div',
-                '.view_content_wrap',
-                '.gallery_re_cont',
-                '.dccon_wrapper',
-                '.writing_view_box .inner',
-                '.view_content',
-                '.usertxt'
-            ]
-
-            for selector in content_selectors:
-                try:
-                    content_div = soup.select_one(selector)
-                    if content_div:
-                        extracted_text = content_div.get_text(strip=True)
-                        if extracted_text and len(extracted_text) > 10:
-                            return extracted_text
-                except Exception:
-                    continue
+            if self.config.stream_post_fetch:
+                future = Future()
+                future.set_result(self._crawl_post_content_streaming(url))
+                return future
+
+            response = self._get(url)
+            self.fetch_stats['bytes'] += wire_bytes(response, len(response.content))
+            return self.parse_pool.submit(parse_post_page, response.content, self.config.content_max_length)
 
-            return ""
+        except CircuitOpenError:
+            # 차단 상태에서는 남은 게시글 요청을 멈추도록 상위로 전달
+            raise
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+        finally:
+            self.fetch_stats['posts'] += 1
+            self.fetch_stats['seconds'] += time.perf_counter() - started
 
+    def _post_result(self, future):
+        """게시글 파싱 결과 - 요청/파싱 오류는 빈 본문으로 처리"""
+        try:
+            return future.result()
         except Exception:
-            return ""
+            return "", None
+
+    def _crawl_post_content_streaming(self, url):
+        """게시글 내용 스트리밍 크롤링 - 본문 컨테이너가 닫히거나 바이트 상한에 도달하면 중단"""
+        with self._get(url, stream=True) as response:
+            text, bytes_read, date_text = extract_streaming(
+                response,
+                CONTENT_CLASSES,
+                byte_cap=self.config.post_byte_cap,
+                max_chars=self.config.content_max_length,
+                date_classes=POST_DATE_CLASSES
+            )
+        self.fetch_stats['bytes'] += bytes_read
+        self.transport.record_bytes(url, bytes_read)
+        return text, parse_post_date(date_text)
+
+    def _get(self, url, **kwargs):
+        """공유 전송 계층으로 보내는 GET 요청 (403은 차단으로 집계)"""
+        return self._http_get(url, blocked_status=BLOCKED_STATUS, headers=self.headers, **kwargs)
+
+    def _print_fetch_stats(self):
+        """게시글 본문 요청 통계 출력"""
+        stats = self.fetch_stats
+        if stats['out_of_window']:
+            print(f"수집 기간 밖 게시글 제외 {stats['out_of_window']}건")
+        if stats['deferred']:
+            print(f"지연 모드: 요약 점수 미달로 본문 요청 생략 {stats['deferred']}건")
+        if not stats['posts']:
+            return
+        print(f"본문 요청 {stats['posts']}건 - 평균 {stats['bytes'] / stats['posts'] / 1024:.1f}KB, "
+              f"평균 {stats['seconds'] / stats['posts'] * 1000:.0f}ms")
 
     def close(self):
-        """세션 정리"""
-        if hasattr(self, 'session'):
-            self.session.close()
+        """파싱 풀 정리 (HTTP 연결 풀은 크롤러 간 공유)"""
+        self.parse_pool.close()
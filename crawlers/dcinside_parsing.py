@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+디시인사이드 HTML 파싱 함수
+
+파싱 프로세스 풀에서 실행되므로 모두 모듈 최상위 함수이며, 응답 바이트를
+받아 필요한 필드만 담은 작은 dict/tuple을 돌려준다.
+"""
+
+import re
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from .parse_pool import clean_text
+
+
+# 게시글 본문 컨테이너 선택자 (우선순위 순)
+CONTENT_SELECTORS = [
+    'div.writing_view_box',
+    '.write_div',
+    '.view_content_wrap',
+    '.gallery_re_cont',
+    '.dccon_wrapper',
+    '.writing_view_box .inner',
+    '.view_content',
+    '.usertxt'
+]
+
+# 스트리밍 추출 시 본문 컨테이너로 인식할 class
+CONTENT_CLASSES = [
+    'writing_view_box', 'write_div', 'view_content_wrap', 'gallery_re_cont',
+    'dccon_wrapper', 'view_content', 'usertxt'
+]
+
+# 검색 결과 목록/게시글 페이지의 작성일시 요소
+LISTING_DATE_SELECTOR = '.date_time'
+POST_DATE_SELECTOR = '.gall_date'
+POST_DATE_CLASSES = ['gall_date']
+
+# 2024.01.15 13:45 / 2024-01-15 13:45:12 / 01.15 / 13:45 형식
+DATE_PATTERN = re.compile(
+    r'(?:(?P<year>\d{4})[.\-/])?(?P<month>\d{1,2})[.\-/](?P<day>\d{1,2})'
+    r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?)?'
+)
+TIME_ONLY_PATTERN = re.compile(r'^(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?$')
+
+
+def parse_post_date(text, now=None):
+    """디시인사이드 작성일시 문자열을 datetime으로 변환 - 해석할 수 없으면 None
+
+    연도가 없으면 올해(미래가 되면 작년), 시각만 있으면 오늘 날짜로 본다.
+    """
+    if not text:
+        return None
+    text = text.strip()
+    now = now or datetime.now()
+
+    match = TIME_ONLY_PATTERN.match(text)
+    if match:
+        try:
+            return now.replace(
+                hour=int(match.group('hour')), minute=int(match.group('minute')),
+                second=int(match.group('second') or 0), microsecond=0
+            )
+        except ValueError:
+            return None
+
+    match = DATE_PATTERN.search(text)
+    if not match:
+        return None
+
+    try:
+        parsed = datetime(
+            int(match.group('year') or now.year),
+            int(match.group('month')),
+            int(match.group('day')),
+            int(match.group('hour') or 0),
+            int(match.group('minute') or 0),
+            int(match.group('second') or 0)
+        )
+    except ValueError:
+        return None
+
+    if match.group('year') is None and parsed > now:
+        parsed = parsed.replace(year=parsed.year - 1)
+    return parsed
+
+
+# 검색 결과 링크 대안 선택자 ('a.tit'가 없을 때)
+ALTERNATIVE_LINK_SELECTORS = [
+    'a[href*="/board/view/"]',
+    '.gall_tit a',
+    '.title a',
+    'a.title',
+    '.ub-word a'
+]
+
+
+def parse_search_page(content):
+    """검색 결과 페이지 파싱 - [{'url', 'title', 'snippet', 'listed_at'}]"""
+    soup = BeautifulSoup(content, 'html.parser')
+    links = soup.find_all('a', class_='tit')
+
+    if not links:
+        for selector in ALTERNATIVE_LINK_SELECTORS:
+            try:
+                links = soup.select(selector)
+                if links:
+                    break
+            except Exception:
+                continue
+
+    hits = []
+    for link in links:
+        href = link.get('href', '')
+        if href.startswith('/'):
+            url = 'https://gall.dcinside.com' + href
+        elif href.startswith('http'):
+            url = href
+        else:
+            continue
+
+        container = link.find_parent('li') or link.parent
+        hits.append({
+            'url': url,
+            'title': clean_text(link.text),
+            'snippet': clean_text(_snippet_of(link, container)),
+            'listed_at': _listing_date_of(container)
+        })
+    return hits
+
+
+def _snippet_of(link, container):
+    """검색 결과 항목의 요약문"""
+    if container is None:
+        return ""
+    snippet = container.select_one('.link_dsc_txt, .txt, .desc')
+    if snippet is not None:
+        return snippet.get_text(" ", strip=True)
+    return container.get_text(" ", strip=True).replace(link.get_text(strip=True), '', 1)
+
+
+def _listing_date_of(container):
+    """검색 결과 항목의 작성일시"""
+    if container is None:
+        return None
+    date_element = container.select_one(LISTING_DATE_SELECTOR)
+    if date_element is None:
+        return None
+    return parse_post_date(date_element.get_text(strip=True))
+
+
+def parse_post_page(content, max_chars=None):
+    """게시글 페이지 파싱 - (정리된 본문, 작성일시)"""
+    soup = BeautifulSoup(content, 'html.parser')
+
+    posted_at = None
+    date_element = soup.select_one(POST_DATE_SELECTOR)
+    if date_element is not None:
+        # title 속성에 초 단위까지의 전체 일시가 있음
+        posted_at = parse_post_date(date_element.get('title') or date_element.get_text(strip=True))
+
+    # 다양한 선택자로 내용 추출 시도
+    for selector in CONTENT_SELECTORS:
+        try:
+            content_div = soup.select_one(selector)
+            if content_div:
+                extracted_text = content_div.get_text(strip=True)
+                if extracted_text and len(extracted_text) > 10:
+                    return clean_text(extracted_text)[:max_chars], posted_at
+        except Exception:
+            continue
+
+    return "", posted_at
+
+
+def parse_board_page(content, board, gallery_id):
+    """갤러리 목록 페이지의 일반 게시글 행 파싱 (공지/광고 제외)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    rows = []
+    for tr in soup.select('tr.ub-content'):
+        number = tr.select_one('td.gall_num')
+        no = tr.get('data-no') or ''
+        if number is None or not number.get_text(strip=True).isdigit() or not no.isdigit():
+            continue
+
+        link = tr.select_one('td.gall_tit a')
+        if link is None:
+            continue
+
+        date_cell = tr.select_one('td.gall_date')
+        writer = tr.select_one('td.gall_writer')
+        rows.append({
+            'no': int(no),
+            'url': f"https://gall.dcinside.com/{board}/view/?id={gallery_id}&no={no}",
+            'title': clean_text(link.get_text(strip=True)),
+            'created_at': parse_post_date(
+                (date_cell.get('title') or date_cell.get_text(strip=True)) if date_cell else None
+            ),
+            'author': writer.get('data-nick', '') if writer else ''
+        })
+    return rows
@@ -4,11 +4,15 @@
 네이버 블로그 API 크롤러
 """
 
-import urllib.request
 import urllib.parse
-import json
-import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 from .base_crawler import BaseCrawler
+from .resilience import CircuitOpenError
+
+NAVER_API_HOST = 'openapi.naver.com'
+NAVER_RSS_HOST = 'rss.blog.naver.com'
 
 
 class NaverCrawler(BaseCrawler):
@@ -18,10 +22,16 @@ class NaverCrawler(BaseCrawler):
         """네이버 크롤러 초기화"""
         super().__init__(config)
         self.platform_name = "Naver Blog"
+        self.hosts = [NAVER_API_HOST, NAVER_RSS_HOST]
         self.max_api_results = 1000  # API 최대 수집 가능 개수
+        self.page_size = 100  # API 1회 최대 요청 개수
+
+    def search(self, keyword, max_results=None, start_page=1, end_page=None):
+        """네이버 블로그 검색 - 전체 검색 결과 건수 표시 추가
 
-    def search(self, keyword, max_results=None):
-        """네이버 블로그 검색 - 전체 검색 결과 건수 표시 추가"""
+        start_page/end_page는 100건 단위 페이지 범위 (작업 큐 분할용)
+        """
+        self.search_error = None
         if not self.config.has_naver_config():
             print("네이버 API 설정이 없습니다. 네이버 블로그 검색을 건너뜁니다.")
             return []
@@ -31,25 +41,34 @@ class NaverCrawler(BaseCrawler):
         max_results = max(1, min(user_request, self.max_api_results))
 
         collected_items = []
-        start_position = 1
+        start_position = (start_page - 1) * self.page_size + 1
+        last_position = min(end_page * self.page_size, self.max_api_results) if end_page else self.max_api_results
         remaining = max_results
         total_results = 0  # 전체 검색 결과 건수 저장 변수
 
         try:
             print(f"\n[Naver Blog] 검색 시작 - 키워드: '{keyword}'")
 
-            while remaining > 0 and start_position <= self.max_api_results:
-                display_count = min(remaining, 100, self.max_api_results - start_position + 1)
+            while remaining > 0 and start_position <= last_position:
+                display_count = min(remaining, self.page_size, last_position - start_position + 1)
+
+                # 이전 실행에서 완료된 페이지는 다시 요청하지 않음 (cursor에 전체 건수 보관)
+                checkpoint = self._completed_page(keyword, start_position)
+                if checkpoint is not None:
+                    page_items, cursor = checkpoint
+                    total_results = cursor or total_results
+                    collected_items.extend(page_items)
+                    remaining -= len(page_items)
+                    start_position += display_count
+                    if len(page_items) < display_count:
+                        break
+                    continue
+
                 enc_text = urllib.parse.quote(keyword)
                 url = f"https://openapi.naver.com/v1/search/blog.json?query={enc_text}&display={display_count}&start={start_position}&sort=date"
 
                 # API 요청
-                request = urllib.request.Request(url)
-                request.add_header("X-Naver-Client-Id", self.config.naver_client_id)
-                request.add_header("X-Naver-Client-Secret", self.config.naver_client_secret)
-
-                response = urllib.request.urlopen(request)
-                data = json.loads(response.read().decode('utf-8'))
+                data = self._fetch_json(url)
                 items = data.get('items', [])
 
                 # 전체 검색 결과 건수 추출 (첫 번째 응답에서만)
@@ -59,17 +78,21 @@ class NaverCrawler(BaseCrawler):
                     print(f"※ API 최대 수집 가능량: {self.max_api_results}건")
 
                 # 결과 처리
+                page_items = []
                 for item in items:
                     data_item = self._create_data_item(
                         url=item['link'],
                         title=item['title'],
                         content=item['description'],
                         keyword=keyword,
-                        created_at=item['postdate']
+                        created_at=self._post_date(item.get('postdate')),
+                        author=item.get('bloggername', ''),
+                        author_link=item.get('bloggerlink', '')
                     )
-                    data_item['bloggername'] = item.get('bloggername', '')
-                    data_item['bloggerlink'] = item.get('bloggerlink', '')
-                    collected_items.append(data_item)
+                    page_items.append(data_item)
+
+                self._record_page(keyword, start_position, page_items, cursor=total_results)
+                collected_items.extend(page_items)
 
                 # 다음 페이지 설정
                 remaining -= len(items)
@@ -80,7 +103,7 @@ class NaverCrawler(BaseCrawler):
                     break
 
                 # API 호출 간격 유지 (초당 10회 이하)
-                time.sleep(0.1)
+                self._delay_request(0.1)
 
             actual_collected = len(collected_items)
             print(f"\n[Naver Blog] 수집 완료")
@@ -93,8 +116,75 @@ class NaverCrawler(BaseCrawler):
 
             return collected_items
 
+        except CircuitOpenError as e:
+            self.search_error = e
+            print(f"\n[Naver Blog] 검색 중단: {e}")
+            print(f"- 현재까지 수집된 결과: {len(collected_items)}건")
+            return collected_items
+
         except Exception as e:
+            self.search_error = e
             print(f"\n[Naver Blog] 검색 중 오류 발생: {e}")
             print(f"- 현재까지 수집된 결과: {len(collected_items)}건")
             print(f"- 전체 검색 결과: {total_results:,}건")
             return collected_items
+
+    def blog_feed(self, blog_id, keyword, since=None, max_results=20):
+        """블로그 RSS에서 since("YYYY-MM-DD HH:MM:SS") 이후 글 - (게시글 목록, 새 기준 시각)
+
+        RSS는 API 키 없이 요청 1회로 최근 글 목록을 주므로 검색 API 한도를 쓰지 않는다.
+        새 글이 max_results개보다 많으면 오래된 글부터 가져오고 기준 시각도 거기까지만
+        옮기므로 나머지는 다음 폴링에서 가져온다.
+        """
+        url = f"https://{NAVER_RSS_HOST}/{urllib.parse.quote(blog_id)}.xml"
+        root = ET.fromstring(self._http_get(url).content)
+        author = root.findtext('channel/title') or blog_id
+
+        entries = []
+        for item in root.iter('item'):
+            published = self._feed_time(item.findtext('pubDate'))
+            stamp = published.strftime("%Y-%m-%d %H:%M:%S") if published else None
+            if stamp is None or (since and stamp <= since):
+                continue
+            entries.append((stamp, published, item))
+        entries.sort(key=lambda entry: entry[0])
+        entries = entries[:max_results]
+
+        posts = [
+            self._create_data_item(
+                url=(item.findtext('link') or '').split('?')[0],
+                title=item.findtext('title') or '',
+                content=item.findtext('description') or '',
+                keyword=keyword,
+                created_at=published,
+                author=author,
+                author_link=f"https://blog.naver.com/{blog_id}"
+            )
+            for _, published, item in entries
+        ]
+        return posts, entries[-1][0] if entries else since
+
+    def _post_date(self, value):
+        """검색 API의 postdate('YYYYMMDD')를 datetime으로 변환 - 형식이 다르면 None"""
+        try:
+            return datetime.strptime(value, "%Y%m%d")
+        except (TypeError, ValueError):
+            return None
+
+    def _feed_time(self, value):
+        """RSS pubDate를 현지 시각(naive)으로 변환 - 형식이 다르면 None"""
+        try:
+            published = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if published.tzinfo is not None:
+            published = published.astimezone().replace(tzinfo=None)
+        return published
+
+    def _fetch_json(self, url):
+        """재시도/서킷 브레이커가 적용된 API 호출 (공유 연결 풀 사용)"""
+        headers = {
+            "X-Naver-Client-Id": self.config.naver_client_id,
+            "X-Naver-Client-Secret": self.config.naver_client_secret
+        }
+        return self._http_get(url, headers=headers).json()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 파싱/텍스트 정리 프로세스 풀
+"""
+
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from utils.stage_profiler import profile_stage, profiled, profiling_active
+
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+ENTITY_PATTERN = re.compile(r'&[a-zA-Z0-9#]+;')
+SPACE_PATTERN = re.compile(r'\s+')
+
+
+@profiled('clean')
+def clean_text(text):
+    """HTML 태그/엔티티 제거 및 공백 정리"""
+    if not text:
+        return ""
+    text = TAG_PATTERN.sub('', text)
+    text = ENTITY_PATTERN.sub(' ', text)
+    text = SPACE_PATTERN.sub(' ', text)
+    return text.strip()
+
+
+class ParsePool:
+    """응답 바이트를 받아 파싱 함수를 별도 프로세스에서 실행
+
+    BeautifulSoup 파싱과 정규식 정리는 CPU를 쓰므로 GIL 때문에 한 코어에
+    묶인다. 파싱 함수는 모듈 최상위 함수여야 하고, 결과는 필요한 필드만
+    담은 작은 값이어야 프로세스 간 전송 비용이 작다. workers가 0이면
+    같은 프로세스에서 바로 실행한다. 프로세스는 처음 사용할 때 만든다.
+    --profile 실행 중에는 파싱 단계가 프로파일에 잡히도록 항상 같은
+    프로세스에서 실행한다.
+    """
+
+    def __init__(self, workers=0):
+        self.workers = workers
+        self._executor = None
+
+    def submit(self, func, *args):
+        """파싱 작업 제출 - Future 반환"""
+        if self.workers <= 0 or profiling_active():
+            future = Future()
+            try:
+                with profile_stage('parse'):
+                    future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor.submit(func, *args)
+
+    def run(self, func, *args):
+        """파싱 작업을 실행하고 결과를 기다림"""
+        return self.submit(func, *args).result()
+
+    def close(self):
+        """워커 프로세스 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
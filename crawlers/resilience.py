@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+플랫폼 요청 복원력 계층 - 재시도, 지수 백오프, 서킷 브레이커
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 요청을 보내지 않음"""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"{host} 서킷 브레이커 열림 - {retry_in:.0f}초 후 재시도 가능")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RequestFailure(Exception):
+    """서킷 브레이커 실패로 집계되는 요청 오류 (예: 차단 응답 403)"""
+
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RetryableError(RequestFailure):
+    """재시도할 수 있는 요청 실패 (429/5xx, 연결 오류 등)"""
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """연속 실패 시 요청을 차단하고 일정 시간 후 반개방(half-open) 상태로 한 번 시험 요청"""
+
+    def __init__(self, failure_threshold=5, recovery_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        """요청 가능 여부 - 열린 상태에서 복구 시간이 지나면 시험 요청 1건 허용"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def retry_in(self):
+        """다시 요청 가능해질 때까지 남은 초"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def current_state(self):
+        """현재 상태 (복구 시간이 지난 OPEN은 HALF_OPEN으로 표시)"""
+        if self.state == OPEN and self.retry_in() == 0:
+            return HALF_OPEN
+        return self.state
+
+
+class RetryBudget:
+    """호스트별 재시도 예산 - 일정 시간 창 안에서 허용되는 재시도 횟수 제한"""
+
+    def __init__(self, max_retries, window_seconds=60.0):
+        self.max_retries = max_retries
+        self.window_seconds = window_seconds
+        self.window_start = time.monotonic()
+        self.used = 0
+
+    def try_spend(self):
+        now = time.monotonic()
+        if now - self.window_start >= self.window_seconds:
+            self.window_start = now
+            self.used = 0
+        if self.used >= self.max_retries:
+            return False
+        self.used += 1
+        return True
+
+
+class ReconnectBackoff:
+    """장시간 연결(스트림) 재연결 대기 시간
+
+    오류 종류별로 따로 늘린다: 네트워크 오류는 base_network초씩 선형으로
+    max_network초까지, HTTP 오류는 base_http초부터 두 배씩 max_http초까지,
+    429는 base_rate_limit초부터 두 배씩 늘린다(Retry-After가 있으면 우선).
+    연결이 정상적으로 수립되면 reset()으로 초기화한다.
+    """
+
+    def __init__(self, base_network=0.25, max_network=16.0, base_http=5.0, max_http=320.0,
+                 base_rate_limit=60.0, max_rate_limit=960.0):
+        self.base_network = base_network
+        self.max_network = max_network
+        self.base_http = base_http
+        self.max_http = max_http
+        self.base_rate_limit = base_rate_limit
+        self.max_rate_limit = max_rate_limit
+        self.reset()
+
+    def reset(self):
+        self._network = 0
+        self._http = 0
+        self._rate_limit = 0
+
+    def network(self):
+        """연결 끊김/타임아웃 후 대기 시간"""
+        self._network += 1
+        return min(self.max_network, self.base_network * self._network)
+
+    def http(self, status, retry_after=None):
+        """HTTP 오류 응답 후 대기 시간"""
+        if status == 429:
+            self._rate_limit += 1
+            delay = min(self.max_rate_limit, self.base_rate_limit * (2 ** (self._rate_limit - 1)))
+            return max(delay, retry_after or 0.0)
+        self._http += 1
+        return min(self.max_http, self.base_http * (2 ** (self._http - 1)))
+
+
+class ResilienceManager:
+    """호스트별 서킷 브레이커와 재시도 예산을 관리하고 요청을 감싸 실행"""
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0,
+                 failure_threshold=5, recovery_timeout=60.0, retry_budget=20):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.retry_budget = retry_budget
+        self._breakers = {}
+        self._budgets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성"""
+        return cls(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            failure_threshold=config.breaker_failure_threshold,
+            recovery_timeout=config.breaker_recovery_timeout,
+            retry_budget=config.host_retry_budget
+        )
+
+    def breaker(self, host):
+        """호스트의 서킷 브레이커"""
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+                self._budgets[host] = RetryBudget(self.retry_budget)
+            return self._breakers[host]
+
+    def backoff(self, attempt, retry_after=None):
+        """지터가 적용된 지수 백오프 대기 시간 (Retry-After가 있으면 우선)"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay * 4)
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(cap / 2, cap)
+
+    def call(self, host, func):
+        """func()를 재시도/서킷 브레이커 정책으로 실행
+
+        func는 재시도 대상 실패에 RetryableError를, 재시도하지 않지만 브레이커에
+        집계할 실패에 RequestFailure를 발생시켜야 한다.
+        """
+        breaker = self.breaker(host)
+        attempt = 0
+
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(host, breaker.retry_in())
+
+            try:
+                result = func()
+            except RetryableError as e:
+                breaker.record_failure()
+                attempt += 1
+                if attempt >= self.max_attempts or not self._budgets[host].try_spend():
+                    raise
+                delay = self.backoff(attempt, e.retry_after)
+                print(f"  {host} 요청 실패 ({e}) - {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts - 1})")
+                time.sleep(delay)
+                continue
+            except RequestFailure:
+                breaker.record_failure()
+                raise
+            except Exception:
+                # 그 밖의 오류(404 등)는 호스트가 응답한 것이므로 실패로 집계하지 않음
+                breaker.record_success()
+                raise
+
+            breaker.record_success()
+            return result
+
+    def host_states(self):
+        """호스트별 서킷 상태"""
+        return {host: breaker.current_state() for host, breaker in self._breakers.items()}
+
+    def state_for(self, hosts):
+        """여러 호스트 중 가장 나쁜 서킷 상태"""
+        states = [self._breakers[host].current_state() for host in hosts if host in self._breakers]
+        if OPEN in states:
+            return OPEN
+        if HALF_OPEN in states:
+            return HALF_OPEN
+        return CLOSED
+
+    def retry_in(self, hosts):
+        """여러 호스트 중 가장 늦게 다시 열리는 시간 (초)"""
+        return max([self._breakers[host].retry_in() for host in hosts if host in self._breakers] or [0.0])
+
+
+_shared_manager = None
+
+
+def get_resilience(config):
+    """모든 크롤러가 공유하는 ResilienceManager"""
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = ResilienceManager.from_config(config)
+    return _shared_manager
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 공용 HTTP 전송 계층
+"""
+
+import socket
+import threading
+import time
+import urllib.parse
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import allowed_gai_family
+
+from utils.stage_profiler import profiled
+from .content_stream import supported_accept_encoding, wire_bytes
+
+
+class DnsCache:
+    """호스트 이름 조회 결과를 ttl초 동안 재사용하는 DNS 캐시
+
+    DnsCachingAdapter를 마운트한 세션의 연결에만 적용되며, 전역
+    socket.getaddrinfo는 건드리지 않으므로 OpenAI 클라이언트나 알림 웹훅
+    같은 다른 라이브러리의 이름 조회에는 영향이 없다. 조회 실패는 캐시하지
+    않고, 캐시한 주소로 연결하지 못하면 그 항목을 버려 다음 연결에서 다시
+    조회한다.
+    """
+
+    def __init__(self, ttl=300.0):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._pool_classes = None
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def resolve(self, host, port):
+        """연결에 쓸 주소 - IP 주소는 그대로 반환"""
+        if _is_ip_address(host):
+            return host
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.stats['hits'] += 1
+                return entry[1]
+
+        address = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)[0][4][0]
+        with self._lock:
+            self.stats['misses'] += 1
+            self._entries[key] = (now + self.ttl, address)
+        return address
+
+    def forget(self, host, port):
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def pool_classes(self):
+        """이 캐시로 주소를 조회하는 연결 풀 클래스 - PoolManager.pool_classes_by_scheme 형식"""
+        if self._pool_classes is None:
+            attrs = {'dns_cache': self}
+            http_conn = type('CachedHTTPConnection', (_CachedResolveMixin, HTTPConnection), attrs)
+            https_conn = type('CachedHTTPSConnection', (_CachedResolveMixin, HTTPSConnection), attrs)
+            self._pool_classes = {
+                'http': type('CachedHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http_conn}),
+                'https': type('CachedHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https_conn})
+            }
+        return self._pool_classes
+
+
+class _CachedResolveMixin:
+    """새 연결을 열 때 호스트 이름 대신 DNS 캐시의 주소로 접속
+
+    TLS SNI/인증서 검증과 Host 헤더는 원래 호스트 이름을 그대로 쓴다.
+    """
+
+    dns_cache = None
+
+    def _new_conn(self):
+        host = self._dns_host
+        self._dns_host = self.dns_cache.resolve(host, self.port)
+        try:
+            return super()._new_conn()
+        except Exception:
+            self.dns_cache.forget(host, self.port)
+            raise
+        finally:
+            self._dns_host = host
+
+
+class DnsCachingAdapter(HTTPAdapter):
+    """DNS 캐시를 적용한 연결 풀을 쓰는 어댑터 (프록시 연결은 기본 조회 사용)"""
+
+    def __init__(self, dns_cache, **kwargs):
+        self.dns_cache = dns_cache  # HTTPAdapter.__init__에서 init_poolmanager()를 호출하므로 먼저 설정
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.dns_cache is not None:
+            self.poolmanager.pool_classes_by_scheme = self.dns_cache.pool_classes()
+
+
+def _is_ip_address(host):
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, host.strip('[]'))
+            return True
+        except (OSError, ValueError):
+            continue
+    return False
+
+
+class HostStats:
+    """호스트별 요청 수/오류 수/수신 바이트/소요 시간"""
+
+    __slots__ = ('requests', 'errors', 'bytes', 'seconds', 'latencies')
+
+    def __init__(self, window=1000):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=window)  # 최근 요청 소요 시간 (백분위 계산용)
+
+
+class HttpTransport(requests.Session):
+    """모든 크롤러가 공유하는 연결 풀 기반 HTTP 세션
+
+    호스트별 크기를 지정한 연결 풀과 keep-alive로 연결을 재사용하고,
+    지원하는 압축 형식(zstd/br/gzip/deflate)을 요청하며, 연결/읽기 타임아웃을
+    한곳에서 정한다. dns_cache가 주어지면 이 세션의 연결에만 DNS 캐시를
+    적용한다. 요청마다 소요 시간과 수신 바이트(압축 상태 기준)를
+    호스트별로 집계한다. 재시도는 ResilienceManager가 맡으므로 어댑터
+    수준 재시도는 하지 않는다. tweepy 같은 외부 클라이언트에는 adopt()로
+    그 클라이언트의 세션 설정을 유지한 세션을 넘긴다.
+    """
+
+    def __init__(self, pool_size=10, host_pool_sizes=None, connect_timeout=3.05, read_timeout=10, dns_cache=None):
+        super().__init__()
+        self.dns_cache = dns_cache
+        self.timeout = (connect_timeout, read_timeout)
+        self.headers.update({
+            'Accept-Encoding': supported_accept_encoding(),
+            'Connection': 'keep-alive'
+        })
+
+        self.mount('https://', DnsCachingAdapter(dns_cache, pool_connections=pool_size, pool_maxsize=pool_size,
+                                                 max_retries=0))
+        self.mount('http://', DnsCachingAdapter(dns_cache, pool_connections=pool_size, pool_maxsize=pool_size,
+                                                max_retries=0))
+        for host, size in (host_pool_sizes or {}).items():
+            self.mount(f"https://{host}/", DnsCachingAdapter(dns_cache, pool_connections=1, pool_maxsize=size,
+                                                            max_retries=0))
+
+        self.host_stats = {}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성"""
+        return cls(
+            pool_size=config.http_pool_size,
+            host_pool_sizes=config.http_host_pool_sizes,
+            connect_timeout=config.http_connect_timeout,
+            read_timeout=config.timeout,
+            dns_cache=DnsCache(config.dns_cache_ttl) if config.dns_cache_ttl > 0 else None
+        )
+
+    def adopt(self, session):
+        """session의 헤더/인증/쿠키 등은 그대로 두고 이 전송 계층의 연결 풀,
+        DNS 캐시, 타임아웃, 요청 통계를 함께 쓰는 세션 반환
+
+        공유 세션 자체를 넘기면 클라이언트가 자기 세션에 둔 User-Agent 같은
+        헤더가 사라지고, 반대로 공유 세션에 복사하면 다른 크롤러 요청에
+        섞이므로 클라이언트마다 따로 만든다. 압축 형식은 이 전송 계층 기준.
+        """
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        for attr in requests.Session.__attrs__:
+            if attr != 'adapters':
+                setattr(view, attr, getattr(session, attr))
+        view.headers = session.headers.copy()
+        view.headers['Accept-Encoding'] = self.headers['Accept-Encoding']
+        return view
+
+    @profiled('network')
+    def request(self, method, url, *args, **kwargs):
+        """공통 타임아웃을 적용하고 소요 시간/수신 바이트 기록"""
+        kwargs.setdefault('timeout', self.timeout)
+        host = urllib.parse.urlsplit(url).netloc
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            self._record(host, time.perf_counter() - started, 0, error=True)
+            raise
+
+        # 스트리밍 응답은 본문을 읽은 쪽에서 record_bytes()로 바이트를 더함
+        received = 0 if kwargs.get('stream') else wire_bytes(response, len(response.content))
+        self._record(host, time.perf_counter() - started, received, error=response.status_code >= 400)
+        return response
+
+    def _record(self, host, seconds, received, error=False):
+        with self._stats_lock:
+            stats = self.host_stats.get(host)
+            if stats is None:
+                stats = self.host_stats[host] = HostStats()
+            stats.requests += 1
+            stats.errors += error
+            stats.bytes += received
+            stats.seconds += seconds
+            stats.latencies.append(seconds)
+
+    def record_bytes(self, url, received):
+        """스트리밍으로 읽은 바이트 추가"""
+        host = urllib.parse.urlsplit(url).netloc
+        with self._stats_lock:
+            stats = self.host_stats.get(host)
+            if stats is not None:
+                stats.bytes += received
+
+    def summary(self):
+        """호스트별 요약 - {호스트: {requests, errors, bytes, avg_ms, p50_ms, p95_ms}}"""
+        with self._stats_lock:
+            snapshot = {host: (stats.requests, stats.errors, stats.bytes, stats.seconds, sorted(stats.latencies))
+                        for host, stats in self.host_stats.items()}
+
+        summary = {}
+        for host, (count, errors, received, seconds, latencies) in snapshot.items():
+            if not count:
+                continue
+            summary[host] = {
+                'requests': count,
+                'errors': errors,
+                'bytes': received,
+                'avg_ms': seconds / count * 1000,
+                'p50_ms': latencies[len(latencies) // 2] * 1000,
+                'p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+            }
+        return summary
+
+
+_shared_transport = None
+
+
+def get_transport(config):
+    """모든 크롤러가 공유하는 HttpTransport"""
+    global _shared_transport
+    if _shared_transport is None:
+        _shared_transport = HttpTransport.from_config(config)
+    return _shared_transport
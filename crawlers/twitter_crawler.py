@@ -4,10 +4,29 @@
 Twitter API 크롤러
 """
 
+import json
+import time
+import urllib.parse
 import tweepy
 import pytz
+import requests
 from datetime import datetime, timedelta
 from .base_crawler import BaseCrawler
+from .resilience import CircuitOpenError, ReconnectBackoff, RetryableError, parse_retry_after
+
+TWITTER_API_HOST = 'api.twitter.com'
+
+# 모니터링 키워드로 만든 필터 스트림 규칙의 태그 접두어 (다른 규칙은 건드리지 않음)
+STREAM_RULE_TAG_PREFIX = 'monitor:'
+
+
+class StreamHttpError(Exception):
+    """필터 스트림 연결이 오류 응답으로 거절됨"""
+
+    def __init__(self, status, retry_after=None, detail=''):
+        super().__init__(f"HTTP {status} {detail}".strip())
+        self.status = status
+        self.retry_after = retry_after
 
 
 class TwitterCrawler(BaseCrawler):
@@ -17,17 +36,23 @@ class TwitterCrawler(BaseCrawler):
         """Twitter 크롤러 초기화"""
         super().__init__(config)
         self.platform_name = "Twitter"
+        self.api_base_url = config.twitter_api_base_url.rstrip('/')
+        self.hosts = sorted({TWITTER_API_HOST, urllib.parse.urlsplit(self.api_base_url).netloc})
+        self.stream_stats = {'connects': 0, 'reconnects': 0, 'tweets': 0, 'heartbeats': 0}
 
         if config.has_twitter_config():
             self.client = tweepy.Client(
                 bearer_token=config.twitter_bearer_token,
                 wait_on_rate_limit=True
             )
+            # tweepy 요청도 공유 연결 풀/타임아웃/요청 통계를 사용 (tweepy 세션의 헤더는 유지)
+            self.client.session = self.transport.adopt(self.client.session)
         else:
             self.client = None
 
     def search(self, keyword, start_date=None, end_date=None, max_results=None):
         """Twitter 검색 - 수집량 매개변수 추가"""
+        self.search_error = None
         if not self.client:
             print("Twitter API 설정이 없습니다. Twitter 검색을 건너뜁니다.")
             return []
@@ -36,40 +61,261 @@ class TwitterCrawler(BaseCrawler):
         if max_results is None:
             max_results = self.config.max_results_per_platform
 
+        results = []
         try:
             # 안전한 시간 계산
             end_time = self._get_safe_end_time(end_date)
             start_time = start_date.strftime("%Y-%m-%dT00:00:00Z") if start_date else None
 
-            # 검색 실행
+            # 검색 실행 - 페이지 단위로 저널에 기록 (cursor는 다음 페이지 토큰)
             query = f"{keyword} -is:retweet lang:ko"
-            tweets = tweepy.Paginator(
-                self.client.search_recent_tweets,
-                query=query,
-                start_time=start_time,
-                end_time=end_time,
-                tweet_fields=['created_at', 'author_id'],
-                max_results=10
-            ).flatten(limit=max_results)
-
-            # 결과 처리
-            results = []
-            for tweet in tweets:
-                item = self._create_data_item(
+            page = 1
+            next_token = None
+
+            while len(results) < max_results:
+                checkpoint = self._completed_page(keyword, page)
+                if checkpoint is None:
+                    break
+                page_items, next_token = checkpoint
+                results.extend(page_items[:max_results - len(results)])
+                page += 1
+                if not next_token:
+                    break
+
+            if len(results) < max_results and (page == 1 or next_token):
+                pages = tweepy.Paginator(
+                    self.client.search_recent_tweets,
+                    query=query,
+                    start_time=start_time,
+                    end_time=end_time,
+                    tweet_fields=['created_at', 'author_id'],
+                    max_results=10,
+                    pagination_token=next_token
+                )
+
+                page_iterator = iter(pages)
+                while True:
+                    try:
+                        response = self._next_page(page_iterator)
+                    except StopIteration:
+                        break
+
+                    page_items = []
+                    for tweet in response.data or []:
+                        if len(results) + len(page_items) >= max_results:
+                            break
+                        item = self._create_data_item(
+                            url=f"https://twitter.com/user/status/{tweet.id}",
+                            title="",
+                            content=tweet.text,
+                            keyword=keyword,
+                            created_at=tweet.created_at,
+                            author=str(tweet.author_id or '')
+                        )
+                        page_items.append(item)
+
+                    next_token = response.meta.get('next_token')
+                    self._record_page(keyword, page, page_items, cursor=next_token)
+                    results.extend(page_items)
+                    page += 1
+
+                    if len(results) >= max_results or not next_token:
+                        break
+
+            print(f"Twitter에서 {len(results)}개 게시글 수집 완료")
+            return results
+
+        except CircuitOpenError as e:
+            self.search_error = e
+            print(f"Twitter 검색 중단: {e} (현재까지 {len(results)}개 수집)")
+            return results
+        except Exception as e:
+            self.search_error = e
+            print(f"Twitter 검색 중 오류: {str(e)} (현재까지 {len(results)}개 수집)")
+            return results
+
+    def user_timeline(self, user_id, keyword, since_id=None, start_time=None, max_results=20, max_pages=3):
+        """사용자 타임라인에서 since_id 이후 트윗 (리트윗 제외) - (게시글 목록, 다음 폴링 커서)
+
+        API는 최근 글부터 돌려주므로 since_id에 닿을 때까지 페이지(페이지당
+        max_results개, 5~100)를 넘긴다. max_pages 안에 닿지 못하면 가져온 글 중
+        가장 오래된 ID를 until_id로 커서에 남겨, 다음 폴링에서 그 사이 구간부터
+        이어서 가져온다(구간을 다 읽으면 커서는 가장 최근 ID가 된다).
+        커서 형식: '최근 ID' 또는 '구간을 다 읽은 뒤의 최근 ID:since_id:until_id'.
+        """
+        if not self.client:
+            return [], since_id
+
+        resume_newest, until_id = None, None
+        if since_id and ':' in since_id:
+            resume_newest, since_id, until_id = since_id.split(':')
+
+        params = {
+            'id': user_id,
+            'max_results': max(5, min(100, max_results)),
+            'tweet_fields': ['created_at', 'author_id'],
+            'exclude': ['retweets']
+        }
+        if since_id:
+            params['since_id'] = since_id
+        elif start_time:
+            params['start_time'] = start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if until_id:
+            params['until_id'] = until_id
+
+        posts = []
+        newest_id = oldest_id = next_token = None
+        for _ in range(max(1, max_pages)):
+            response = self._call_api(lambda: self.client.get_users_tweets(**params))
+            meta = response.meta or {}
+            newest_id = newest_id or meta.get('newest_id')
+            oldest_id = meta.get('oldest_id') or oldest_id
+            for tweet in response.data or []:
+                posts.append(self._create_data_item(
                     url=f"https://twitter.com/user/status/{tweet.id}",
                     title="",
                     content=tweet.text,
                     keyword=keyword,
-                    created_at=tweet.created_at
+                    created_at=tweet.created_at,
+                    author=str(tweet.author_id or user_id)
+                ))
+            next_token = meta.get('next_token')
+            if not next_token:
+                break
+            params['pagination_token'] = next_token
+
+        newest = resume_newest or newest_id or since_id
+        if next_token and oldest_id:
+            return posts, f"{newest}:{since_id or ''}:{oldest_id}"
+        return posts, newest
+
+    def _next_page(self, page_iterator):
+        """재시도/서킷 브레이커를 적용해 다음 검색 결과 페이지 요청"""
+        return self._call_api(lambda: next(page_iterator))
+
+    def _call_api(self, request):
+        """재시도/서킷 브레이커를 적용한 tweepy API 호출"""
+        def call():
+            self.request_count += 1
+            try:
+                return request()
+            except tweepy.errors.TwitterServerError as e:
+                raise RetryableError(f"Twitter 서버 오류: {e}", getattr(e.response, 'status_code', None))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                raise RetryableError(f"연결 오류: {e}")
+
+        return self.resilience.call(TWITTER_API_HOST, call)
+
+    def sync_stream_rules(self, keywords):
+        """모니터링 키워드와 필터 스트림 규칙 동기화 - (추가 수, 삭제 수)
+
+        태그가 STREAM_RULE_TAG_PREFIX로 시작하는 규칙만 관리한다.
+        """
+        url = f"{self.api_base_url}/2/tweets/search/stream/rules"
+        existing = self._http_get(url, headers=self._auth_headers()).json().get('data') or []
+
+        desired = {f"{STREAM_RULE_TAG_PREFIX}{keyword}": self._stream_rule(keyword) for keyword in keywords}
+        managed = [rule for rule in existing if (rule.get('tag') or '').startswith(STREAM_RULE_TAG_PREFIX)]
+        stale = [rule['id'] for rule in managed if desired.get(rule['tag']) != rule['value']]
+        current = {rule['tag'] for rule in managed if rule['id'] not in stale}
+        additions = [{'value': value, 'tag': tag} for tag, value in desired.items() if tag not in current]
+
+        if stale:
+            self._http_request('POST', url, headers=self._auth_headers(), json={'delete': {'ids': stale}})
+        if additions:
+            response = self._http_request('POST', url, headers=self._auth_headers(), json={'add': additions})
+            for error in response.json().get('errors') or []:
+                print(f"  스트림 규칙 오류: {error.get('value', '')} - {error.get('title', '')}")
+        return len(additions), len(stale)
+
+    def stream(self, keywords, on_post, should_stop=None):
+        """필터 스트림 수신 - 도착한 트윗마다 on_post(PostData) 호출
+
+        연결이 끊기면 오류 종류별 백오프 후 다시 연결하며, should_stop()이
+        참이 되면(하트비트나 트윗을 받을 때 확인) 종료한다.
+        """
+        should_stop = should_stop or (lambda: False)
+        added, removed = self.sync_stream_rules(keywords)
+        print(f"필터 스트림 규칙 동기화: 추가 {added}개, 삭제 {removed}개 (키워드 {len(keywords)}개)")
+
+        backoff = ReconnectBackoff()
+        while not should_stop():
+            try:
+                self._consume_stream(on_post, should_stop, backoff)
+                if should_stop():
+                    break
+                delay = backoff.network()
+                reason = "서버가 연결을 닫음"
+            except StreamHttpError as e:
+                delay = backoff.http(e.status, e.retry_after)
+                reason = str(e)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                delay = backoff.network()
+                reason = f"연결 오류: {e}"
+
+            self.stream_stats['reconnects'] += 1
+            print(f"  필터 스트림 끊김 ({reason}) - {delay:.1f}초 후 재연결")
+            time.sleep(delay)
+
+    def _consume_stream(self, on_post, should_stop, backoff):
+        """스트림 연결 1회 - 서버가 닫거나 중단 요청이 있을 때까지 한 줄씩 처리"""
+        url = f"{self.api_base_url}/2/tweets/search/stream?tweet.fields=created_at,author_id"
+        timeout = (self.config.http_connect_timeout, self.config.twitter_stream_read_timeout)
+        self.request_count += 1
+
+        with self.transport.get(url, headers=self._auth_headers(), stream=True, timeout=timeout) as response:
+            if response.status_code != 200:
+                raise StreamHttpError(
+                    response.status_code, parse_retry_after(response.headers.get('Retry-After')), response.text[:200]
                 )
-                results.append(item)
+            self.stream_stats['connects'] += 1
+            backoff.reset()
 
-            print(f"Twitter에서 {len(results)}개 게시글 수집 완료")
-            return results
+            for line in response.iter_lines():
+                self.transport.record_bytes(url, len(line) + 2)
+                if should_stop():
+                    return
+                if not line:
+                    self.stream_stats['heartbeats'] += 1  # 약 20초마다 오는 keep-alive
+                    continue
 
-        except Exception as e:
-            print(f"Twitter 검색 중 오류: {str(e)}")
-            return []
+                post = self._stream_post(json.loads(line))
+                if post is not None:
+                    self.stream_stats['tweets'] += 1
+                    on_post(post)
+
+    def _stream_post(self, message):
+        """스트림 메시지를 PostData로 변환 - 트윗이 아니면 None"""
+        tweet = message.get('data')
+        if not tweet:
+            for error in message.get('errors') or []:
+                print(f"  필터 스트림 메시지 오류: {error.get('title', '')} {error.get('detail', '')}")
+            return None
+
+        tags = [rule.get('tag') or '' for rule in message.get('matching_rules') or []]
+        keywords = [tag[len(STREAM_RULE_TAG_PREFIX):] for tag in tags if tag.startswith(STREAM_RULE_TAG_PREFIX)]
+
+        created_at = None
+        if tweet.get('created_at'):
+            # 다른 플랫폼과 같이 로컬 시각(naive)으로 보관
+            created_at = datetime.fromisoformat(tweet['created_at'].replace('Z', '+00:00')).astimezone().replace(tzinfo=None)
+
+        return self._create_data_item(
+            url=f"https://twitter.com/user/status/{tweet['id']}",
+            title="",
+            content=tweet.get('text', ''),
+            keyword=keywords[0] if keywords else '',
+            created_at=created_at,
+            author=str(tweet.get('author_id') or '')
+        )
+
+    def _stream_rule(self, keyword):
+        """키워드 필터 규칙 (검색과 같은 조건)"""
+        term = f'"{keyword}"' if ' ' in keyword else keyword
+        return f"{term} -is:retweet lang:ko"
+
+    def _auth_headers(self):
+        return {'Authorization': f"Bearer {self.config.twitter_bearer_token}"}
 
     def _get_safe_end_time(self, end_date):
         """API 안전한 종료 시간 계산"""
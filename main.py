@@ -6,7 +6,14 @@
 
 import sys
 import os
-from datetime import datetime
+import time
+import socket
+import argparse
+import logging
+import threading
+import multiprocessing
+from queue import Queue, Empty
+from datetime import datetime, timedelta, timezone
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -15,10 +22,31 @@ from config.settings import Config
 from crawlers.twitter_crawler import TwitterCrawler
 from crawlers.naver_crawler import NaverCrawler
 from crawlers.dcinside_crawler import DCInsideCrawler
+from crawlers.resilience import CircuitOpenError
 from analyzers.openai_analyzer import OpenAIAnalyzer
 from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.budget_governor import BudgetGovernor
 from utils.data_processor import DataProcessor
 from utils.file_manager import FileManager
+from utils.stats_aggregator import StatsAggregator
+from utils.run_journal import RunJournal
+from utils.work_queue import WorkQueue, SharedRateLimiter
+from utils.alert_dispatcher import AlertDispatcher
+from utils.analysis_scheduler import AnalysisScheduler
+from utils.stratified_sampler import StratifiedSampler
+from utils.quota_allocator import QuotaAllocator
+from utils.watchlist import Watchlist, WATCH_KEYWORD
+from utils.result_store import ResultStore
+from utils.content_archive import ContentArchive
+from utils.reanalyzer import Reanalyzer
+from utils.lexicon_rescorer import LexiconRescorer
+from utils.stage_profiler import StageProfiler, profile_stage, profiled, restart_after_fork
+from utils.logging_setup import setup_logging, shutdown_logging
+from utils.report_generator import ReportGenerator, import_csv_results
+from models.data_models import post_to_dict, post_from_dict
+
+logger = logging.getLogger("monitor")
+item_logger = logging.getLogger("monitor.items")  # 게시글 단위 로그 (샘플링)
 
 
 class SuicideMonitoringSystem:
@@ -28,7 +56,10 @@ class SuicideMonitoringSystem:
         """시스템 초기화"""
         self.config = Config()
         self.data_processor = DataProcessor()
-        self.file_manager = FileManager()
+        self.file_manager = FileManager(db_path=self.config.db_path)
+        self.stats_aggregator = StatsAggregator(window_hours=self.config.stats_window_hours)
+        # 고위험 알림 발송기 (발송 대기 알림 기록용 결과 저장소 연결은 따로 염)
+        self.alert_dispatcher = AlertDispatcher.from_config(self.config)
 
         # 크롤러 초기화
         self.twitter_crawler = TwitterCrawler(self.config)
@@ -38,6 +69,18 @@ class SuicideMonitoringSystem:
         # 분석기 초기화
         self.openai_analyzer = OpenAIAnalyzer(self.config)
         self.keyword_analyzer = KeywordAnalyzer()
+        self.budget_governor = BudgetGovernor.from_config(self.config)
+
+        # (키워드, 플랫폼)별 수집량 배분기 - 비용 기록은 항상, 재배분은 --adaptive-quota일 때만
+        self.quota_allocator = QuotaAllocator.from_config(self.config, self.file_manager.result_store)
+        self.adaptive_quota = False
+        self.quota_plan = {}  # {키워드: {플랫폼 표시 이름: 수집량}}
+
+        # 위험 게시글 작성 계정 감시 목록 - 모든 모드에서 위험 판정을 기록
+        self.watchlist = Watchlist.from_config(self.config, self.file_manager.result_store)
+
+        # 재분석용 원문 아카이브
+        self.content_archive = ContentArchive.from_config(self.config) if self.config.archive_enabled else None
 
         # 결과 저장 리스트
         self.results = []
@@ -45,34 +88,48 @@ class SuicideMonitoringSystem:
         # 선택된 플랫폼 저장
         self.selected_platforms = []
 
-    def get_platform_selection(self):
-        """플랫폼 선택 기능"""
-        print("\n" + "=" * 50)
-        print("데이터 수집 플랫폼 선택")
-        print("=" * 50)
+        # 실행 저널 (체크포인트/재개) - 실행 ID는 표본 추출 시드로도 쓰임
+        self.journal = None
+        self.run_id = None
 
-        # 사용 가능한 플랫폼 정의
-        available_platforms = {
+        # 층화 표본 모드 (None, 'sample', 'sample_full_top')
+        self.sampling = None
+
+    def _platform_options(self):
+        """선택 가능한 플랫폼 정의"""
+        return {
             '1': {
                 'name': 'X(Twitter)',
                 'description': 'Twitter API를 통한 트윗 수집',
                 'available': self.config.has_twitter_config(),
-                'crawler': self.twitter_crawler
+                'crawler': self.twitter_crawler,
+                'config_key': 'twitter'
             },
             '2': {
                 'name': '네이버 블로그',
                 'description': '네이버 API를 통한 블로그 포스트 수집',
                 'available': self.config.has_naver_config(),
-                'crawler': self.naver_crawler
+                'crawler': self.naver_crawler,
+                'config_key': 'naver'
             },
             '3': {
                 'name': '디시인사이드',
                 'description': '크롤링을 통한 게시글 수집',
                 'available': True,  # 크롤링은 항상 가능
-                'crawler': self.dcinside_crawler
+                'crawler': self.dcinside_crawler,
+                'config_key': 'dcinside'
             }
         }
 
+    def get_platform_selection(self):
+        """플랫폼 선택 기능"""
+        print("\n" + "=" * 50)
+        print("데이터 수집 플랫폼 선택")
+        print("=" * 50)
+
+        # 사용 가능한 플랫폼 정의
+        available_platforms = self._platform_options()
+
         # 플랫폼 목록 출력
         print("사용 가능한 플랫폼:")
         for key, platform in available_platforms.items():
@@ -235,40 +292,170 @@ class SuicideMonitoringSystem:
         if not self.get_collection_settings():
             return False
 
+        self.plan_quotas()
         return True
 
+    def plan_quotas(self):
+        """적응형 수집량 - 같은 총비용 안에서 위험 수율이 높은 (키워드, 플랫폼)에 수집량을 더 배분"""
+        if not self.adaptive_quota:
+            return
+
+        names = {platform['crawler'].platform_name: platform['name'] for platform in self.selected_platforms}
+        base_counts = {
+            (keyword, platform['crawler'].platform_name): self.collection_settings.get(platform['name'], 50)
+            for keyword in self.keywords for platform in self.selected_platforms
+        }
+        counts = self.quota_allocator.allocate(base_counts)
+
+        self.quota_plan = {}
+        for (keyword, platform_name), count in counts.items():
+            self.quota_plan.setdefault(keyword, {})[names[platform_name]] = count
+
+        print(f"\n적응형 수집량 배분 (탐색 비율 {self.config.quota_min_share * 100:.0f}%):")
+        for line in self.quota_allocator.describe(base_counts, counts):
+            print(line)
+
+    def _target_count(self, keyword, platform_name):
+        """키워드/플랫폼별 목표 수집량 (적응형 배분이 없으면 플랫폼 설정값)"""
+        planned = self.quota_plan.get(keyword, {}).get(platform_name)
+        return planned if planned is not None else self.collection_settings.get(platform_name, 50)
+
+    def start_journal(self):
+        """새 실행 저널 생성 및 크롤러 연결"""
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        run_info = {
+            'run_id': self.run_id,
+            'sampling': self.sampling,
+            'keywords': self.keywords,
+            'platforms': [p['name'] for p in self.selected_platforms],
+            'start_date': self.start_date.strftime("%Y-%m-%d"),
+            'end_date': self.end_date.strftime("%Y-%m-%d"),
+            'collection_settings': self.collection_settings,
+            'quota_plan': self.quota_plan
+        }
+        self._attach_journal(RunJournal.start(self.config.journal_path, run_info))
+
+    def resume_from_journal(self):
+        """중단된 실행의 저널을 불러와 설정 복원"""
+        journal = RunJournal.load(self.config.journal_path)
+        if journal is None:
+            print("재개할 수 있는 중단된 실행이 없습니다.")
+            return False
+
+        run_info = journal.run_info
+        options = {p['name']: p for p in self._platform_options().values()}
+        self.selected_platforms = [
+            options[name] for name in run_info['platforms']
+            if name in options and options[name]['available']
+        ]
+        self.keywords = run_info['keywords']
+        self.start_date = datetime.strptime(run_info['start_date'], "%Y-%m-%d")
+        self.end_date = datetime.strptime(run_info['end_date'], "%Y-%m-%d")
+        self.collection_settings = run_info['collection_settings']
+        self.quota_plan = run_info.get('quota_plan', {})
+        self.run_id = run_info.get('run_id')
+        if 'sampling' in run_info:
+            # 재개 시 표본 모드와 시드를 원래 실행과 같게 맞춰 같은 표본을 뽑음
+            self.sampling = run_info['sampling']
+
+        print(f"중단된 실행을 재개합니다 - 완료 페이지 {len(journal.pages)}개, 분석 완료 {len(journal.analyses)}개")
+        self._attach_journal(journal)
+        return bool(self.selected_platforms)
+
+    def _attach_journal(self, journal):
+        """크롤러에 저널 연결"""
+        self.journal = journal
+        for crawler in (self.twitter_crawler, self.naver_crawler, self.dcinside_crawler):
+            crawler.journal = journal
+
     def collect_data(self):
         """선택된 플랫폼에서 설정된 개수만큼 데이터 수집"""
         print(f"\n선택된 {len(self.selected_platforms)}개 플랫폼에서 데이터 수집을 시작합니다...")
         all_data = []
 
+        deferred = []
+
         for keyword in self.keywords:
             print(f"\n키워드 '{keyword}' 검색 중...")
 
-            for platform in self.selected_platforms:
-                platform_name = platform['name']
-                count = self.collection_settings.get(platform_name, 50)
+            # 서킷이 정상인 플랫폼부터 수집하고, 열린 플랫폼은 마지막으로 미룸
+            for platform in self._platforms_by_health():
+                if platform['crawler'].circuit_state() == 'open':
+                    print(f"- {platform['name']}: 연속 실패로 요청 차단 중 - 다른 플랫폼을 먼저 수집합니다.")
+                    deferred.append((keyword, platform))
+                    continue
+                all_data.extend(self._collect_platform(keyword, platform))
 
-                print(f"- {platform_name} 검색 중... (목표: {count}개)")
+        for keyword, platform in deferred:
+            wait = platform['crawler'].circuit_retry_in()
+            if wait > 0:
+                print(f"\n{platform['name']} 서킷 복구 대기 중... ({wait:.0f}초)")
+                time.sleep(wait)
+            print(f"\n키워드 '{keyword}' 재시도 중...")
+            all_data.extend(self._collect_platform(keyword, platform))
 
-                try:
-                    if platform_name == 'X(Twitter)':
-                        data = self.twitter_crawler.search(keyword, self.start_date, self.end_date, max_results=count)
-                    elif platform_name == '네이버 블로그':
-                        data = self.naver_crawler.search(keyword, max_results=count)
-                    elif platform_name == '디시인사이드':
-                        data = self.dcinside_crawler.search(keyword, max_results=count)
-                    else:
-                        data = []
+        self.print_request_summary()
+        return all_data
 
-                    all_data.extend(data)
-                    print(f"  실제 수집: {len(data)}개")
+    def _platforms_by_health(self):
+        """서킷 상태 기준으로 정렬된 선택 플랫폼 (closed → half_open → open)"""
+        order = {'closed': 0, 'half_open': 1, 'open': 2}
+        return sorted(self.selected_platforms, key=lambda p: order[p['crawler'].circuit_state()])
 
-                except Exception as e:
-                    print(f"  {platform_name} 검색 중 오류 발생: {e}")
-                    continue
+    def _collect_platform(self, keyword, platform):
+        """플랫폼 1개에서 키워드 검색"""
+        platform_name = platform['name']
+        count = self._target_count(keyword, platform_name)
+        crawler = platform['crawler']
 
-        return all_data
+        print(f"- {platform_name} 검색 중... (목표: {count}개)")
+
+        try:
+            requests_before = crawler.request_count
+            started = time.time()
+            with profile_stage(f"collect:{crawler.platform_name}"):
+                data = self._search_platform(platform_name, keyword, count)
+            self.quota_allocator.record_collection(
+                keyword, crawler.platform_name, len(data), crawler.request_count - requests_before, time.time() - started
+            )
+            print(f"  실제 수집: {len(data)}개")
+            return data
+
+        except Exception as e:
+            print(f"  {platform_name} 검색 중 오류 발생: {e}")
+            return []
+
+    def print_request_summary(self):
+        """이번 실행의 플랫폼별 요청 수 출력"""
+        print("\n플랫폼별 요청 수:")
+        for platform in self.selected_platforms:
+            crawler = platform['crawler']
+            line = f"- {platform['name']}: {crawler.request_count}회 (서킷 상태: {crawler.circuit_state()})"
+            if crawler is self.dcinside_crawler and self.config.lazy_fetch:
+                line += f" (본문 요청 생략 {crawler.fetch_stats['deferred']}건)"
+            print(line)
+
+        transport = self.dcinside_crawler.transport
+        summary = transport.summary()
+        if summary:
+            print("\n호스트별 HTTP 요청:")
+            for host, stats in sorted(summary.items()):
+                print(f"- {host}: {stats['requests']}회 (오류 {stats['errors']}회), "
+                      f"수신 {stats['bytes'] / 1024:.1f}KB, 평균 {stats['avg_ms']:.0f}ms / "
+                      f"p50 {stats['p50_ms']:.0f}ms / p95 {stats['p95_ms']:.0f}ms")
+
+    def _search_platform(self, platform_name, keyword, count, start_page=1, end_page=None):
+        """플랫폼별 크롤러 검색 호출"""
+        if platform_name == 'X(Twitter)':
+            return self.twitter_crawler.search(keyword, self.start_date, self.end_date, max_results=count)
+        elif platform_name == '네이버 블로그':
+            return self.naver_crawler.search(keyword, max_results=count, start_page=start_page, end_page=end_page)
+        elif platform_name == '디시인사이드':
+            return self.dcinside_crawler.search(
+                keyword, max_results=count, start_page=start_page, end_page=end_page,
+                start_date=self.start_date, end_date=self.end_date
+            )
+        return []
 
     def analyze_data(self, data):
         """수집된 데이터 분석 - 개선된 오류 처리"""
@@ -278,41 +465,593 @@ class SuicideMonitoringSystem:
         openai_available = self.openai_analyzer.is_available()
         print(f"OpenAI 분석기 상태: {'사용 가능' if openai_available else '사용 불가'}")
 
-        for idx, item in enumerate(data, 1):
-            content = item.get('content', '').strip()
+        # 사전 점수가 높은 게시글부터 분석
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        for item in data:
+            content = item.content.strip()
             if not content:
                 continue
 
-            print(f"분석 중 ({idx}/{len(data)}): {item['platform']} - {item.get('title', '')[:50]}...")
+            # 이전 실행에서 분석이 끝난 게시글은 저널의 결과 재사용
+            if self.journal is not None:
+                previous = self.journal.get_analysis(item.url)
+                if previous is not None:
+                    self.results.append(previous)
+                    self.stats_aggregator.add(previous)
+                    continue
 
-            # 제목과 내용 결합
-            combined_text = f"{item.get('title', '')} {content}"
+            scheduler.push(item)
 
-            # 분석 방법 선택
-            analysis_method = "미확인"
-            try:
-                if openai_available:
+        total = len(scheduler)
+        for idx in range(1, total + 1):
+            item, priority = scheduler.pop()
+            item_logger.info("분석 중 (%d/%d, 우선순위 %.2f): %s - %s...", idx, total, priority, item.platform, item.title[:50])
+
+            result = self._analyze_item(item, openai_available, priority)
+            self._add_result(result)
+
+        print(f"분석 완료: {len(self.results)}개 항목이 처리되었습니다.")
+        if scheduler.summary():
+            print(scheduler.summary())
+        self.print_openai_usage()
+
+    def analyze_sampled(self, data):
+        """층화 표본만 LLM으로 분석하고 플랫폼/키워드별 위험비율 추정 - 나머지는 키워드 분석"""
+        print("\n층화 표본 분석 중...")
+        openai_available = self.openai_analyzer.is_available()
+        print(f"OpenAI 분석기 상태: {'사용 가능' if openai_available else '사용 불가'}")
+
+        sampler = StratifiedSampler.from_config(
+            self.config, self.keyword_analyzer, census_top=self.sampling == 'sample_full_top', seed=self.run_id
+        )
+        sample, rest = sampler.split([item for item in data if item.content.strip()])
+        print(f"게시글 {len(sample) + len(rest)}개를 {len(sampler.strata)}개 층으로 나눔 - "
+              f"LLM 표본 {len(sample)}개, 키워드 분석 {len(rest)}개")
+
+        # 표본이 아닌 게시글은 키워드 분석 결과만 기록 (재개 시 저널에 있는 결과는 재사용)
+        for item, _ in rest:
+            previous = self.journal.get_analysis(item.url) if self.journal is not None else None
+            if previous is not None:
+                self.results.append(previous)
+                self.stats_aggregator.add(previous)
+                continue
+            if self.content_archive is not None:
+                self.content_archive.add(item)
+            risk_score, is_risky, reason = self.keyword_analyzer.analyze(f"{item.title} {item.content.strip()}")
+            result = self.data_processor.create_result_record(item, risk_score, is_risky, reason, "키워드(비표본)")
+            self.alert_dispatcher.submit(result)
+            self.watchlist.record(result)
+            self._add_result(result)
+
+        # 표본은 층을 번갈아 분석하며 추정치를 바로 갱신
+        estimate_path = os.path.join(
+            self.config.output_dir, f"suicide_monitoring_prevalence_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        for idx, (item, key, score) in enumerate(sample, 1):
+            result = self.journal.get_analysis(item.url) if self.journal is not None else None
+            if result is None:
+                item_logger.info("표본 분석 중 (%d/%d): %s - %s...", idx, len(sample), item.platform, item.title[:50])
+                result = self._analyze_item(item, openai_available, score)
+                self._add_result(result)
+            else:
+                self.results.append(result)
+                self.stats_aggregator.add(result)
+            sampler.record(key, result.analysis_result.is_risky)
+
+            if idx % self.config.sampling_report_every == 0 or idx == len(sample):
+                print(sampler.progress_line())
+                sampler.write_csv(estimate_path)
+
+        print(f"\n=== 위험비율 추정 ({sampler.confidence * 100:.0f}% 신뢰구간) ===")
+        for row in sampler.estimates():
+            print(f"{row['플랫폼']} / {row['키워드']}: {row['추정_위험비율'] * 100:.1f}% "
+                  f"({row['신뢰구간_하한'] * 100:.1f}~{row['신뢰구간_상한'] * 100:.1f}%), "
+                  f"표본 {row['표본']}/{row['모집단']}개")
+        if sample:
+            print(f"추정치 저장: {estimate_path}")
+        self.print_openai_usage()
+
+    def _add_result(self, result):
+        """분석 결과 누적 및 저널 기록"""
+        self.results.append(result)
+        self.stats_aggregator.add(result)
+        if self.journal is not None:
+            self.journal.record_analysis(result)
+
+    def print_openai_usage(self):
+        """OpenAI 호출당 평균 토큰 수/지연 시간 출력"""
+        budget = self.budget_governor.usage()
+        if budget['denied_minute'] or budget['denied_day']:
+            print(f"OpenAI 예산 초과로 키워드 분석 대체: 분당 한도 {budget['denied_minute']}건, "
+                  f"일일 한도 {budget['denied_day']}건 (오늘 {budget['day_requests']}회 / {budget['day_tokens']}토큰 사용)")
+
+        usage = self.openai_analyzer.usage_summary()
+        if usage is None:
+            return
+        print(
+            f"OpenAI 사용량 ({self.openai_analyzer.prompt_mode} 모드): {usage['calls']}회 호출, "
+            f"평균 입력 {usage['avg_prompt_tokens']:.0f}토큰 / 출력 {usage['avg_completion_tokens']:.0f}토큰, "
+            f"평균 {usage['avg_latency']:.2f}초, 응답 파싱 실패 {usage['parse_failures']}건"
+        )
+
+    @profiled('analyze')
+    def _analyze_item(self, item, openai_available, priority=0.0):
+        """게시글 1건 분석 - OpenAI 실패 시 키워드 분석기로 대체"""
+        # 제목과 내용 결합
+        combined_text = f"{item.title} {item.content.strip()}"
+
+        # 본문을 가져오지 않은 지연 항목은 키워드 분석만 수행
+        if item.fetch_status == 'deferred':
+            risk_score, is_risky, reason = self.keyword_analyzer.analyze(combined_text)
+            return self.data_processor.create_result_record(
+                item, risk_score, is_risky, reason, "키워드(지연)"
+            )
+
+        # 재분석에 쓸 수 있도록 수집한 본문 보관
+        if self.content_archive is not None:
+            self.content_archive.add(item)
+
+        # 분석 방법 선택 - OpenAI 예산이 없으면 키워드 분석으로 대체하고 방법에 기록
+        analysis_method = "미확인"
+        try:
+            if not openai_available:
+                raise Exception("OpenAI 사용 불가")
+
+            estimated = self.openai_analyzer.estimate_tokens(combined_text)
+            ticket = self.budget_governor.acquire(
+                estimated, high_priority=priority >= self.config.priority_high_threshold
+            )
+            if ticket is None:
+                risk_score, is_risky, reason = self.keyword_analyzer.analyze(combined_text)
+                analysis_method = "키워드(예산초과)"
+            else:
+                try:
                     risk_score, is_risky, reason = self.openai_analyzer.analyze(combined_text)
                     analysis_method = "OpenAI"
+                    self.quota_allocator.add_tokens(item.keyword, item.platform, self.openai_analyzer.last_usage)
+                finally:
+                    self.budget_governor.settle(ticket, self.openai_analyzer.last_usage)
+        except Exception as e:
+            item_logger.warning("  OpenAI 분석 실패: %s - 키워드 분석기로 대체", e)
+            risk_score, is_risky, reason = self.keyword_analyzer.analyze(combined_text)
+            analysis_method = "키워드"
+
+        if is_risky == 'Y':
+            logger.info("위험 감지: 점수 %.2f (방법: %s)", risk_score, analysis_method)
+
+        result = self.data_processor.create_result_record(
+            item, risk_score, is_risky, reason, analysis_method
+        )
+        self.alert_dispatcher.submit(result)
+        self.watchlist.record(result)
+        return result
+
+    def _close_archive(self):
+        """원문 아카이브 기록 마무리"""
+        if self.content_archive is None:
+            return
+        self.content_archive.close()
+        stats = self.content_archive.stats
+        if stats['stored']:
+            print(f"원문 아카이브: {stats['posts']}건 보관 (새 본문 {stats['stored']}건, 중복 {stats['deduplicated']}건, "
+                  f"{stats['raw_bytes'] / 1024:.0f}KB → {stats['stored_bytes'] / 1024:.0f}KB)")
+        self.content_archive = None
+
+    def publish_jobs(self):
+        """수집 작업을 (키워드, 플랫폼, 페이지 범위) 단위로 작업 큐에 등록"""
+        queue = WorkQueue(self.config.queue_path)
+        run_tag = datetime.now().strftime("%Y%m%d_%H%M%S")
+        pages_per_job = self.config.queue_pages_per_job
+        published = 0
+
+        for keyword in self.keywords:
+            for platform in self.selected_platforms:
+                platform_name = platform['name']
+                count = self._target_count(keyword, platform_name)
+                page_size = self.config.platform_config[platform['config_key']].get('page_size')
+
+                # 페이지 범위로 나눌 수 없는 플랫폼(Twitter 커서 방식)은 작업 1건으로 등록
+                if not page_size:
+                    ranges = [(1, None, count)]
+                else:
+                    ranges = []
+                    total_pages = -(-count // page_size)
+                    for start_page in range(1, total_pages + 1, pages_per_job):
+                        end_page = min(start_page + pages_per_job - 1, total_pages)
+                        job_count = min(count - (start_page - 1) * page_size, (end_page - start_page + 1) * page_size)
+                        ranges.append((start_page, end_page, job_count))
+
+                for start_page, end_page, job_count in ranges:
+                    payload = {
+                        'keyword': keyword,
+                        'platform': platform_name,
+                        'start_page': start_page,
+                        'end_page': end_page,
+                        'count': job_count,
+                        'start_date': self.start_date.strftime("%Y-%m-%d"),
+                        'end_date': self.end_date.strftime("%Y-%m-%d")
+                    }
+                    job_key = f"collect:{run_tag}:{keyword}:{platform_name}:{start_page}-{end_page}"
+                    if queue.publish('collect', payload, job_key=job_key, max_attempts=self.config.queue_max_attempts):
+                        published += 1
+
+        print(f"\n작업 큐에 수집 작업 {published}개를 등록했습니다: {self.config.queue_path}")
+        print("'python main.py --worker --workers N'으로 워커를 실행하세요.")
+        queue.close()
+
+    def run_worker(self, worker_id=None):
+        """작업 큐에서 수집/분석 작업을 임대해 처리하는 워커 루프"""
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        queue = WorkQueue(self.config.queue_path)
+        rate_limiter = SharedRateLimiter(queue, self.config.platform_rate_limits)
+        for crawler in (self.twitter_crawler, self.naver_crawler, self.dcinside_crawler):
+            crawler.rate_limiter = rate_limiter
+
+        openai_available = self.openai_analyzer.is_available()
+        lease_seconds = self.config.queue_lease_seconds
+        idle_since = time.time()
+        processed = 0
+
+        print(f"[워커 {worker_id}] 시작")
+        try:
+            while True:
+                job = queue.lease(worker_id, lease_seconds=lease_seconds)
+                if job is None:
+                    if time.time() - idle_since > self.config.worker_idle_timeout and not queue.has_open_jobs():
+                        break
+                    time.sleep(1)
+                    continue
+
+                # 서킷이 열린 플랫폼의 수집 작업은 시도 횟수를 쓰지 않고 복구 시점으로 미룸
+                if job.kind == 'collect':
+                    crawler = self._crawler_for(job.payload['platform'])
+                    if crawler is not None and crawler.circuit_state() == 'open':
+                        queue.defer(job, worker_id, crawler.circuit_retry_in())
+                        continue
+
+                try:
+                    with queue.heartbeat(job, worker_id, lease_seconds):
+                        if job.kind == 'collect':
+                            self._run_collect_job(queue, job)
+                        elif job.kind == 'analyze':
+                            self._run_analyze_job(job, openai_available)
+                    queue.complete(job, worker_id)
+                    processed += 1
+                except CircuitOpenError as e:
+                    # 수집 도중 서킷이 열리면 시도 횟수를 쓰지 않고 복구 시점으로 미룸
+                    print(f"[워커 {worker_id}] 작업 {job.job_id} 미룸 - {e}")
+                    queue.defer(job, worker_id, e.retry_in)
+                except Exception as e:
+                    print(f"[워커 {worker_id}] 작업 {job.job_id} 실패 ({job.attempts}회차): {e}")
+                    queue.fail(job, worker_id, e)
+
+                idle_since = time.time()
+
+        except KeyboardInterrupt:
+            print(f"\n[워커 {worker_id}] 중단 - 처리 중이던 작업은 임대 만료 후 다시 배정됩니다.")
+        finally:
+            print(f"[워커 {worker_id}] 종료 - 처리한 작업 {processed}개, 큐 상태: {queue.counts()}")
+            queue.close()
+            self.dcinside_crawler.close()
+            self.alert_dispatcher.close()
+            self._close_archive()
+            self.quota_allocator.flush()
+            self.watchlist.flush()
+            self.budget_governor.close()
+            self.file_manager.close()
+
+    def _crawler_for(self, platform_name):
+        """플랫폼 표시 이름에 해당하는 크롤러"""
+        for platform in self._platform_options().values():
+            if platform['name'] == platform_name:
+                return platform['crawler']
+        return None
+
+    def _run_collect_job(self, queue, job):
+        """수집 작업 처리 - 수집한 게시글은 분석 작업으로 다시 등록"""
+        payload = job.payload
+        self.start_date = datetime.strptime(payload['start_date'], "%Y-%m-%d")
+        self.end_date = datetime.strptime(payload['end_date'], "%Y-%m-%d")
+
+        crawler = self._crawler_for(payload['platform'])
+        requests_before = crawler.request_count
+        started = time.time()
+        with profile_stage(f"collect:{crawler.platform_name}"):
+            data = self._search_platform(
+                payload['platform'], payload['keyword'], payload['count'],
+                start_page=payload['start_page'], end_page=payload['end_page']
+            )
+        # 중간에 멈춘 수집은 완료로 처리하지 않고 워커 루프의 미룸/재시도 경로로 넘김
+        if crawler.search_error is not None:
+            raise crawler.search_error
+        self.quota_allocator.record_collection(
+            payload['keyword'], crawler.platform_name, len(data), crawler.request_count - requests_before,
+            time.time() - started
+        )
+        data = [item for item in data if item.content.strip()]
+
+        # 사전 우선순위 순으로 묶어 고위험 후보가 담긴 분석 작업을 먼저 임대하게 함
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        for item in data:
+            scheduler.push(item)
+        ranked = [scheduler.pop() for _ in range(len(scheduler))]
+
+        batch_size = self.config.analysis_batch_size
+        for index in range(0, len(ranked), batch_size):
+            batch = ranked[index:index + batch_size]
+            queue.publish(
+                'analyze', {'posts': [post_to_dict(item) for item, _ in batch]},
+                job_key=f"analyze:{job.job_id}:{index}",
+                max_attempts=self.config.queue_max_attempts,
+                priority=batch[0][1]
+            )
+
+    def _run_analyze_job(self, job, openai_available):
+        """분석 작업 처리 - 결과는 공용 결과 저장소에 upsert"""
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        results = []
+        for post in job.payload['posts']:
+            item = post_from_dict(post)
+            results.append(self._analyze_item(item, openai_available, scheduler.priority(item)))
+        for result in results:
+            self.stats_aggregator.add(result)
+
+        store = self.file_manager.result_store
+        store.upsert_results(results)
+        self.stats_aggregator.flush(store)
+
+    def run_watch(self, galleries=None, once=False):
+        """디시인사이드 갤러리 감시 모드 - 주기마다 새 게시글만 수집/분석/저장"""
+        galleries = galleries or self.config.watch_galleries
+        if not galleries:
+            print("감시할 갤러리가 없습니다. --watch-gallery 또는 DCINSIDE_WATCH_GALLERIES를 설정하세요.")
+            return
+
+        store = self.file_manager.result_store
+        openai_available = self.openai_analyzer.is_available()
+        print(f"갤러리 감시 시작: {', '.join(galleries)} (주기 {self.config.watch_interval}초)")
+
+        try:
+            while True:
+                cycle_started = time.time()
+                requests_before = self.dcinside_crawler.request_count
+
+                for gallery in galleries:
+                    try:
+                        self._watch_gallery_cycle(gallery, store, openai_available)
+                    except Exception as e:
+                        print(f"  {gallery} 감시 중 오류: {e}")
+
+                print(f"감시 주기 완료 - 요청 {self.dcinside_crawler.request_count - requests_before}회, "
+                      f"{time.time() - cycle_started:.1f}초")
+                if self.content_archive is not None:
+                    self.content_archive.flush()
+                if once:
+                    break
+                time.sleep(max(0.0, self.config.watch_interval - (time.time() - cycle_started)))
+
+        except KeyboardInterrupt:
+            print("\n갤러리 감시를 종료합니다.")
+        finally:
+            self.dcinside_crawler.close()
+            self.alert_dispatcher.close()
+            self._close_archive()
+            self.quota_allocator.flush()
+            self.watchlist.flush()
+            self.budget_governor.close()
+            self.file_manager.close()
+
+    def run_watch_accounts(self, once=False):
+        """감시 계정 모드 - 위험 글을 쓴 계정의 타임라인/블로그 피드를 우선순위 순으로 폴링"""
+        platforms = ['Naver Blog'] + (['Twitter'] if self.config.has_twitter_config() else [])
+        openai_available = self.openai_analyzer.is_available()
+        for platform, (active, total) in sorted(self.watchlist.summary().items()):
+            print(f"- {platform}: 감시 계정 {active}개 (전체 {total}개)")
+        print(f"계정 감시 시작: {', '.join(platforms)} (주기 {self.config.watch_account_cycle_seconds}초, "
+              f"주기당 최대 {self.watchlist.max_polls_per_cycle}개 계정)")
+
+        try:
+            while True:
+                cycle_started = time.time()
+                requests_before = self.twitter_crawler.request_count + self.naver_crawler.request_count
+                polled, new_posts, risky = self._watch_account_cycle(platforms, openai_available)
+
+                requests = self.twitter_crawler.request_count + self.naver_crawler.request_count - requests_before
+                print(f"감시 주기 완료 - 계정 {polled}개 폴링, 새 게시글 {new_posts}개 (위험 {risky}개), "
+                      f"요청 {requests}회, {time.time() - cycle_started:.1f}초")
+                if self.content_archive is not None:
+                    self.content_archive.flush()
+                if once:
+                    break
+                time.sleep(max(0.0, self.config.watch_account_cycle_seconds - (time.time() - cycle_started)))
+
+        except KeyboardInterrupt:
+            print("\n계정 감시를 종료합니다.")
+        finally:
+            self.alert_dispatcher.close()
+            self._close_archive()
+            self.quota_allocator.flush()
+            self.watchlist.flush()
+            self.budget_governor.close()
+            self.file_manager.close()
+
+    def _watch_account_cycle(self, platforms, openai_available):
+        """폴링할 계정의 새 글만 수집/분석/저장 - (폴링 계정 수, 새 게시글 수, 위험 수)
+
+        계정별 커서는 결과를 저장한 뒤에 옮기므로 도중에 실패하면 다음
+        주기에 같은 구간을 다시 가져온다.
+        """
+        accounts = self.watchlist.due(platforms)
+        lookback = datetime.now() - timedelta(days=self.config.watch_account_lookback_days)
+
+        self.results = []
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        polled = []
+        new_posts = 0
+        for account in accounts:
+            try:
+                if account['platform'] == 'Twitter':
+                    posts, cursor = self.twitter_crawler.user_timeline(
+                        account['account'], WATCH_KEYWORD, since_id=account['cursor'],
+                        start_time=lookback.astimezone(timezone.utc), max_results=self.config.watch_account_max_posts,
+                        max_pages=self.config.watch_account_max_pages
+                    )
                 else:
-                    raise Exception("OpenAI 사용 불가")
+                    posts, cursor = self.naver_crawler.blog_feed(
+                        account['account'], WATCH_KEYWORD, since=account['cursor'] or lookback.strftime("%Y-%m-%d %H:%M:%S"),
+                        max_results=self.config.watch_account_max_posts
+                    )
             except Exception as e:
-                print(f"  OpenAI 분석 실패: {e}")
-                print(f"  키워드 분석기로 대체...")
-                risk_score, is_risky, reason = self.keyword_analyzer.analyze(combined_text)
-                analysis_method = "키워드"
+                print(f"  {account['platform']} {account['account']} 폴링 중 오류: {e}")
+                continue
 
-            # 결과 저장
-            result = self.data_processor.create_result_record(
-                item, risk_score, is_risky, reason
+            polled.append((account, cursor))
+            new_posts += len(posts)
+            for post in posts:
+                if post.content.strip():
+                    scheduler.push(post)
+
+        while len(scheduler):
+            post, priority = scheduler.pop()
+            self.results.append(self._analyze_item(post, openai_available, priority))
+
+        risky = sum(result.analysis_result.is_risky == 'Y' for result in self.results)
+        saved = True
+        if self.results:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            saved = self.file_manager.save_results(
+                self.results,
+                filename=f"results/account_watch_{timestamp}.csv",
+                keywords=[WATCH_KEYWORD],
+                platforms=sorted({result.post_data.platform for result in self.results}),
+                aggregator=self._batch_aggregator(self.results)
             )
-            result['분석방법'] = analysis_method  # 분석 방법 추가
-            self.results.append(result)
+        if saved:
+            for account, cursor in polled:
+                self.watchlist.mark_polled(account, cursor)
+        self.watchlist.flush()
+        return len(accounts), new_posts, risky
+
+    def run_stream(self, keywords=None):
+        """Twitter 필터 스트림 모드 - 도착하는 트윗을 바로 분석하고 주기적으로 저장"""
+        keywords = keywords or self.config.stream_keywords
+        if not keywords:
+            print("스트림 키워드가 없습니다. --stream-twitter 또는 TWITTER_STREAM_KEYWORDS를 설정하세요.")
+            return
+        if not self.config.has_twitter_config():
+            print("Twitter API 설정이 없습니다. 필터 스트림을 시작할 수 없습니다.")
+            return
+
+        openai_available = self.openai_analyzer.is_available()
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        print(f"Twitter 필터 스트림 시작: {', '.join(keywords)}")
 
-            if is_risky == 'Y':
-                print(f"위험 감지: 점수 {risk_score:.2f} (방법: {analysis_method})")
+        # 수신 스레드는 트윗을 큐에 넣기만 하고, 분석은 이 스레드에서 도착 순으로 처리
+        arrivals = Queue()
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._stream_reader, args=(keywords, arrivals, stop), name="twitter-stream", daemon=True
+        )
+        reader.start()
 
-        print(f"분석 완료: {len(self.results)}개 항목이 처리되었습니다.")
+        self.results = []
+        latencies = []
+        last_flush = time.time()
+        try:
+            while reader.is_alive() or not arrivals.empty():
+                try:
+                    post = arrivals.get(timeout=1.0)
+                except Empty:
+                    post = None
+
+                if post is not None and post.content.strip():
+                    result = self._analyze_item(post, openai_available, scheduler.priority(post))
+                    self.results.append(result)
+                    latencies.append((datetime.now() - post.fetched_at).total_seconds())
+
+                if self.results and (len(self.results) >= self.config.stream_flush_size
+                                     or time.time() - last_flush >= self.config.stream_flush_interval):
+                    self._flush_stream_results(keywords)
+                    last_flush = time.time()
+
+        except KeyboardInterrupt:
+            print("\n필터 스트림을 종료합니다.")
+        finally:
+            stop.set()
+            if self.results:
+                self._flush_stream_results(keywords)
+            stats = self.twitter_crawler.stream_stats
+            print(f"필터 스트림: 트윗 {stats['tweets']}개 수신, 연결 {stats['connects']}회 (재연결 {stats['reconnects']}회)")
+            if latencies:
+                latencies.sort()
+                print(f"수신→판정 지연: p50 {latencies[len(latencies) // 2]:.2f}초 / "
+                      f"최대 {latencies[-1]:.2f}초")
+            self.alert_dispatcher.close()
+            self._close_archive()
+            self.quota_allocator.flush()
+            self.watchlist.flush()
+            self.budget_governor.close()
+            self.file_manager.close()
+
+    def _stream_reader(self, keywords, arrivals, stop):
+        """필터 스트림 수신 스레드"""
+        try:
+            self.twitter_crawler.stream(keywords, arrivals.put, should_stop=stop.is_set)
+        except Exception as e:
+            print(f"필터 스트림 중단: {e}")
+
+    def _flush_stream_results(self, keywords):
+        """스트림으로 분석한 결과 저장"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.file_manager.save_results(
+            self.results,
+            filename=f"results/twitter_stream_{timestamp}.csv",
+            keywords=keywords,
+            platforms=['X(Twitter)'],
+            aggregator=self._batch_aggregator(self.results)
+        )
+        if self.content_archive is not None:
+            self.content_archive.flush()
+        self.results = []
+
+    def _watch_gallery_cycle(self, gallery, store, openai_available):
+        """갤러리 1개 감시 주기 - 결과를 저장한 뒤에 기준점을 옮김"""
+        last_no = store.get_gallery_cursor(gallery)
+        posts, new_last_no = self.dcinside_crawler.watch_gallery(
+            gallery, last_no,
+            max_pages=self.config.watch_max_pages,
+            max_posts=self.config.watch_max_posts
+        )
+
+        self.results = []
+        scheduler = AnalysisScheduler.from_config(self.config, self.keyword_analyzer)
+        for post in posts:
+            if post.content.strip():
+                scheduler.push(post)
+
+        while len(scheduler):
+            post, priority = scheduler.pop()
+            self.results.append(self._analyze_item(post, openai_available, priority))
+
+        print(f"- {gallery}: 새 게시글 {len(posts)}개 (마지막 번호 {last_no} → {new_last_no})")
+        if self.results:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.file_manager.save_results(
+                self.results,
+                filename=f"results/gallery_watch_{gallery.replace('/', '_')}_{timestamp}.csv",
+                keywords=[posts[0].keyword],
+                platforms=['디시인사이드'],
+                aggregator=self._batch_aggregator(self.results)
+            )
+        if new_last_no is not None:
+            store.set_gallery_cursor(gallery, new_last_no)
+
+    def _batch_aggregator(self, results):
+        """이번 주기/묶음의 결과만 담은 집계기 - 반복 저장하는 모드에서 실행별 통계가 누적되지 않게 함"""
+        aggregator = StatsAggregator(window_hours=self.config.stats_window_hours)
+        for result in results:
+            aggregator.add(result)
+        return aggregator
 
     def print_collection_summary(self):
         """수집 요약 정보 출력 - 수집량 정보 추가"""
@@ -334,14 +1073,20 @@ class SuicideMonitoringSystem:
         print(f"총 목표 수집량: {total_target}개")
         print("=" * 50)
 
-    def run(self):
+    def run(self, resume=False):
         """메인 실행 함수"""
         try:
             print("자살유발정보 모니터링 시스템을 시작합니다.")
 
-            # 사용자 입력 받기
-            if not self.get_user_input():
-                return
+            if resume:
+                # 중단된 실행 재개
+                if not self.resume_from_journal():
+                    return
+            else:
+                # 사용자 입력 받기
+                if not self.get_user_input():
+                    return
+                self.start_journal()
 
             # 수집 요약 출력
             self.print_collection_summary()
@@ -354,25 +1099,315 @@ class SuicideMonitoringSystem:
 
             print(f"\n총 {len(collected_data)}개의 게시글이 수집되었습니다.")
 
-            # 데이터 분석
-            self.analyze_data(collected_data)
-
-            # 결과 저장
-            self.file_manager.save_results(self.results)
+            # 데이터 분석 (표본 모드면 층화 표본만 LLM으로 분석)
+            if self.sampling:
+                self.analyze_sampled(collected_data)
+            else:
+                self.analyze_data(collected_data)
+
+            # 결과 저장 - 저장에 실패하면 저널을 남겨 --resume으로 다시 저장할 수 있게 함
+            saved = self.file_manager.save_results(
+                self.results,
+                keywords=self.keywords,
+                platforms=[p['name'] for p in self.selected_platforms],
+                aggregator=self.stats_aggregator
+            )
+            if saved:
+                self.journal.mark_complete()
+            else:
+                print("결과 저장소 기록에 실패했습니다. 'python main.py --resume'으로 저장을 다시 시도할 수 있습니다.")
 
         except KeyboardInterrupt:
             print("\n사용자에 의해 중단되었습니다.")
+            if self.journal is not None:
+                print("'python main.py --resume'으로 중단된 지점부터 다시 실행할 수 있습니다.")
         except Exception as e:
             print(f"예상치 못한 오류 발생: {e}")
             import traceback
             traceback.print_exc()
         finally:
             # 리소스 정리
+            if self.journal is not None:
+                self.journal.close()
+            self.alert_dispatcher.close()
+            self._close_archive()
+            self.quota_allocator.flush()
+            self.watchlist.flush()
+            self.budget_governor.close()
+            self.file_manager.close()
             for platform in self.selected_platforms:
                 if platform['name'] == '디시인사이드':
                     self.dcinside_crawler.close()
 
 
-if __name__ == "__main__":
+def parse_args():
+    """명령행 인자 처리"""
+    parser = argparse.ArgumentParser(description="자살유발정보 모니터링 시스템")
+    parser.add_argument('--resume', action='store_true',
+                        help="중단된 마지막 실행을 체크포인트부터 재개")
+    parser.add_argument('--sample', action='store_true',
+                        help="층화 표본만 LLM으로 분석하고 플랫폼/키워드별 위험비율을 신뢰구간과 함께 추정")
+    parser.add_argument('--sample-full-top', action='store_true',
+                        help="표본 모드에서 사전 점수가 가장 높은 층은 전수 LLM 분석")
+    parser.add_argument('--adaptive-quota', action='store_true',
+                        help="과거 위험 수율/비용에 따라 키워드·플랫폼별 수집량을 재배분 (총비용은 유지)")
+    parser.add_argument('--lazy-fetch', action='store_true',
+                        help="디시인사이드 검색 결과의 제목/요약 점수가 기준 미만이면 본문 요청 생략")
+    parser.add_argument('--enqueue', action='store_true',
+                        help="수집 작업을 작업 큐에 등록만 하고 종료")
+    parser.add_argument('--worker', action='store_true',
+                        help="작업 큐의 수집/분석 작업을 처리하는 워커 모드")
+    parser.add_argument('--workers', type=int,
+                        help="워커 모드에서 실행할 프로세스 수 (기본값: 1) / 재분석 동시 처리 수")
+    parser.add_argument('--watch-gallery', nargs='*', metavar='GALLERY',
+                        help="디시인사이드 갤러리 새 글 감시 모드 (ID 생략 시 DCINSIDE_WATCH_GALLERIES 사용)")
+    parser.add_argument('--watch-accounts', action='store_true',
+                        help="위험 글을 쓴 Twitter 계정/네이버 블로그의 새 글을 우선순위 순으로 폴링")
+    parser.add_argument('--watch-once', action='store_true',
+                        help="갤러리/계정 감시를 한 주기만 실행하고 종료")
+    parser.add_argument('--stream-twitter', nargs='*', metavar='KEYWORD',
+                        help="Twitter 필터 스트림 모드 (키워드 생략 시 TWITTER_STREAM_KEYWORDS 사용)")
+    parser.add_argument('--report', action='store_true',
+                        help="결과 저장소의 누적 결과로 추이/판정 리포트 생성")
+    parser.add_argument('--since', help="리포트/재분석/검색 시작일 (YYYY-MM-DD)")
+    parser.add_argument('--until', help="리포트/재분석/검색 종료일 (YYYY-MM-DD, 해당일 포함)")
+    parser.add_argument('--keyword', help="리포트/재분석/검색 대상 키워드")
+    parser.add_argument('--platform', help="리포트/재분석/검색 대상 플랫폼")
+    parser.add_argument('--report-format', choices=['html', 'csv', 'both'], default='html',
+                        help="리포트 형식 (기본값: html)")
+    parser.add_argument('--import-csv', nargs='+', metavar='CSV',
+                        help="리포트 전에 과거 결과 CSV를 결과 저장소로 가져오기")
+    parser.add_argument('--reanalyze', action='store_true',
+                        help="원문 아카이브의 게시글을 크롤링 없이 다시 분석 (--since/--until/--keyword/--platform 적용)")
+    parser.add_argument('--search', metavar='QUERY',
+                        help="수집한 게시글 제목/본문 전문 검색 (--since/--until/--keyword/--platform 적용)")
+    parser.add_argument('--verdict', choices=['Y', 'N'],
+                        help="검색 결과를 위험(Y)/비위험(N) 판정으로 제한")
+    parser.add_argument('--limit', type=int, default=50,
+                        help="검색 결과 최대 출력 수 (기본값: 50)")
+    parser.add_argument('--rescore-lexicon', action='store_true',
+                        help="키워드 사전에서 바뀐 용어가 들어 있는 게시글만 다시 채점")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="재채점 결과를 저장하지 않고 바뀔 건수만 출력")
+    parser.add_argument('--profile', action='store_true',
+                        help="단계별(수집/파싱/정리/분석/저장) CPU·메모리 프로파일을 logs/profiles/에 저장")
+    parser.add_argument('--analyzer', choices=['keyword', 'openai'], default='keyword',
+                        help="재분석에 사용할 분석기 (기본값: keyword)")
+    return parser.parse_args()
+
+
+def report_main(args):
+    """누적 결과 리포트 생성"""
+    config = Config()
+    store = ResultStore(config.db_path)
+    try:
+        if args.import_csv:
+            print("과거 결과 CSV 가져오는 중...")
+            import_csv_results(store, args.import_csv)
+
+        since = datetime.strptime(args.since, "%Y-%m-%d") if args.since else None
+        until = datetime.strptime(args.until, "%Y-%m-%d") + timedelta(days=1) if args.until else None
+
+        started = time.perf_counter()
+        generator = ReportGenerator(store)
+        report = generator.build(since=since, until=until, keyword=args.keyword, platform=args.platform)
+
+        prefix = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        description = f"기간: {args.since or '처음'} ~ {args.until or '현재'}"
+        if args.keyword:
+            description += f", 키워드: {args.keyword}"
+        if args.platform:
+            description += f", 플랫폼: {args.platform}"
+
+        if args.report_format in ('html', 'both'):
+            path = generator.write_html(report, os.path.join(config.output_dir, f"{prefix}.html"), description)
+            print(f"HTML 리포트 저장: {path}")
+        if args.report_format in ('csv', 'both'):
+            for path in generator.write_csv(report, config.output_dir, prefix):
+                print(f"CSV 리포트 저장: {path}")
+
+        print(f"리포트 생성 완료 ({time.perf_counter() - started:.2f}초)")
+    finally:
+        store.close()
+
+
+def reanalyze_main(args):
+    """원문 아카이브의 게시글을 크롤링 없이 다시 분석"""
+    config = Config()
+    archive = ContentArchive.from_config(config)
+    store = ResultStore(config.db_path)
+    try:
+        posts, blobs = archive.count()
+        print(f"원문 아카이브: 게시글 {posts:,}건 (고유 본문 {blobs:,}건)")
+
+        reanalyzer = Reanalyzer(
+            archive, store, workers=args.workers or config.reanalyze_workers, batch_size=config.reanalyze_batch_size
+        )
+        filters = {
+            'since': datetime.strptime(args.since, "%Y-%m-%d") if args.since else None,
+            'until': datetime.strptime(args.until, "%Y-%m-%d") + timedelta(days=1) if args.until else None,
+            'keyword': args.keyword,
+            'platform': args.platform
+        }
+
+        if args.analyzer == 'openai':
+            openai_analyzer = OpenAIAnalyzer(config)
+            if not openai_analyzer.is_available():
+                print("OpenAI 분석기를 사용할 수 없습니다. 재분석을 건너뜁니다.")
+                return
+            keyword_analyzer = KeywordAnalyzer()
+            governor = BudgetGovernor.from_config(config)
+
+            def analyze(text):
+                ticket = governor.acquire(openai_analyzer.estimate_tokens(text))
+                if ticket is None:
+                    return (*keyword_analyzer.analyze(text), "키워드(예산초과)")
+                try:
+                    return (*openai_analyzer.analyze(text), "OpenAI(재분석)")
+                except Exception:
+                    return (*keyword_analyzer.analyze(text), "키워드")
+                finally:
+                    # last_usage는 스레드별 값이라 풀의 다른 스레드 호출과 섞이지 않음
+                    governor.settle(ticket, openai_analyzer.last_usage)
+
+            try:
+                stats = reanalyzer.run(analyze, **filters)
+            finally:
+                governor.close()
+        else:
+            stats = reanalyzer.run_keyword(**filters)
+
+        rate = stats['total'] / stats['seconds'] if stats['seconds'] else 0
+        print(f"재분석 완료: {stats['total']:,}건 ({stats['seconds']:.1f}초, 초당 {rate:,.0f}건)")
+        print(f"- 위험 판정 {stats['risky']:,}건 (새로 위험 {stats['newly_risky']:,}건, 위험 해제 {stats['cleared']:,}건)")
+    finally:
+        archive.close()
+        store.close()
+
+
+def search_main(args):
+    """결과 저장소 게시글 전문 검색"""
+    config = Config()
+    store = ResultStore(config.db_path)
+    try:
+        since = datetime.strptime(args.since, "%Y-%m-%d") if args.since else None
+        until = datetime.strptime(args.until, "%Y-%m-%d") + timedelta(days=1) if args.until else None
+
+        started = time.perf_counter()
+        rows = store.search_posts(
+            args.search, since=since, until=until, platform=args.platform, keyword=args.keyword,
+            verdict=args.verdict, limit=args.limit
+        )
+        elapsed = time.perf_counter() - started
+
+        print(f"'{args.search}' 검색 결과: {len(rows)}건 ({elapsed * 1000:.0f}ms"
+              f"{', 최대 ' + str(args.limit) + '건' if args.limit and len(rows) >= args.limit else ''})")
+        for row in rows:
+            posted = row['created_at'] or '날짜 없음'
+            print(f"- [{row['is_risky']} {row['risk_score']:.2f}] {posted} {row['platform']} - {(row['title'] or '')[:50]}")
+            print(f"  {row['url']} ({row['method']})")
+    finally:
+        store.close()
+
+
+def rescore_main(args):
+    """키워드 사전 변경분 재채점"""
+    config = Config()
+    store = ResultStore(config.db_path)
+    try:
+        rescorer = LexiconRescorer(store, KeywordAnalyzer())
+        stats = rescorer.run(dry_run=args.dry_run)
+
+        if stats['baseline']:
+            print("기록된 키워드 사전이 없어 현재 사전을 기준으로 기록했습니다. 다음 사전 변경부터 재채점합니다.")
+            return
+        if not stats['terms']:
+            print("키워드 사전에 바뀐 용어가 없습니다.")
+            return
+
+        print(f"바뀐 용어 {len(stats['terms'])}개: {', '.join(stats['terms'])}")
+        print(f"{'재채점 예정' if args.dry_run else '재채점 완료'}: 대상 {stats['candidates']:,}건 중 "
+              f"{stats['updated']:,}건 변경 ({stats['seconds']:.2f}초)")
+        print(f"- 새로 위험 {stats['newly_risky']:,}건, 위험 해제 {stats['cleared']:,}건")
+    finally:
+        store.close()
+
+
+def worker_main():
+    """워커 프로세스 진입점"""
+    # --profile로 fork된 워커는 부모 프로파일러 대신 자기 프로파일을 따로 저장
+    profiler = restart_after_fork()
     system = SuicideMonitoringSystem()
-    system.run()
+    setup_logging(system.config)
+    try:
+        system.run_worker()
+    finally:
+        if profiler is not None:
+            profiler.finish()
+        shutdown_logging()
+
+
+def run_workers(count):
+    """워커 프로세스 여러 개 실행"""
+    if count <= 1:
+        worker_main()
+        return
+
+    processes = [multiprocessing.Process(target=worker_main) for _ in range(count)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+def main(args):
+    """실행 모드 선택"""
+    if args.lazy_fetch:
+        # 이후 생성되는 모든 Config(워커 프로세스 포함)에 적용
+        os.environ['DCINSIDE_LAZY_FETCH'] = '1'
+
+    if args.worker:
+        run_workers(args.workers or 1)
+    elif args.report:
+        report_main(args)
+    elif args.reanalyze:
+        reanalyze_main(args)
+    elif args.search:
+        search_main(args)
+    elif args.rescore_lexicon:
+        rescore_main(args)
+    elif args.stream_twitter is not None:
+        SuicideMonitoringSystem().run_stream(args.stream_twitter)
+    elif args.watch_accounts:
+        SuicideMonitoringSystem().run_watch_accounts(once=args.watch_once)
+    elif args.watch_gallery is not None:
+        SuicideMonitoringSystem().run_watch(args.watch_gallery, once=args.watch_once)
+    elif args.enqueue:
+        system = SuicideMonitoringSystem()
+        system.adaptive_quota = args.adaptive_quota
+        if system.get_user_input():
+            system.publish_jobs()
+    else:
+        system = SuicideMonitoringSystem()
+        system.adaptive_quota = args.adaptive_quota
+        if args.sample_full_top:
+            system.sampling = 'sample_full_top'
+        elif args.sample:
+            system.sampling = 'sample'
+        system.run(resume=args.resume)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config = Config()
+    setup_logging(config)
+    profiler = StageProfiler.from_config(config).start() if args.profile else None
+    try:
+        main(args)
+    finally:
+        if profiler is not None:
+            profiler.finish()
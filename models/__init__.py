@@ -1 +1 @@
-from .data_models import PostData, AnalysisResult, MonitoringResult
+from .data_models import PostData, AnalysisResult, MonitoringResult, post_to_dict, post_from_dict
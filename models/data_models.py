@@ -4,12 +4,29 @@
 데이터 모델 정의
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+def slotted(cls):
+    """__slots__를 사용하는 dataclass 생성 (Python 3.8 호환)
+
+    인스턴스별 __dict__가 생기지 않으므로 대량의 게시글을 메모리에 보관할 때
+    레코드당 메모리 사용량이 크게 줄어든다.
+    """
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@slotted
 class PostData:
     """게시글 데이터 모델"""
     platform: str
@@ -19,19 +36,69 @@ class PostData:
     keyword: str
     created_at: Optional[datetime] = None
     crawl_success: bool = True
+    author: str = ''
+    author_link: str = ''
+    fetch_status: str = 'fetched'  # 'fetched' 또는 본문 요청을 생략한 'deferred'
+    fetched_at: Optional[datetime] = None  # 크롤러가 게시글을 수집한 시각
 
+    def __post_init__(self):
+        # 반복되는 플랫폼/키워드 문자열은 하나의 객체를 공유
+        self.platform = sys.intern(self.platform)
+        self.keyword = sys.intern(self.keyword)
+        self.fetch_status = sys.intern(self.fetch_status)
 
-@dataclass
+
+@slotted
 class AnalysisResult:
     """분석 결과 데이터 모델"""
     risk_score: float
     is_risky: str  # 'Y' or 'N'
     reason: str
+    method: str = ''
+
+    def __post_init__(self):
+        self.method = sys.intern(self.method)
 
 
-@dataclass
+@slotted
 class MonitoringResult:
     """모니터링 결과 데이터 모델"""
     post_data: PostData
     analysis_result: AnalysisResult
     collected_at: datetime
+
+
+def post_to_dict(post):
+    """PostData를 JSON 직렬화 가능한 딕셔너리로 변환"""
+    created_at = post.created_at
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    fetched_at = post.fetched_at.isoformat() if post.fetched_at else None
+    return {
+        'platform': post.platform,
+        'url': post.url,
+        'title': post.title,
+        'content': post.content,
+        'keyword': post.keyword,
+        'created_at': created_at,
+        'crawl_success': post.crawl_success,
+        'author': post.author,
+        'author_link': post.author_link,
+        'fetch_status': post.fetch_status,
+        'fetched_at': fetched_at
+    }
+
+
+def post_from_dict(data):
+    """딕셔너리에서 PostData 복원"""
+    data = dict(data)
+    if data.get('fetched_at'):
+        data['fetched_at'] = datetime.fromisoformat(data['fetched_at'])
+    # post_to_dict()가 isoformat으로 바꾼 작성일시만 되돌림 (네이버 postdate 같은 원본 문자열은 그대로)
+    created_at = data.get('created_at')
+    if isinstance(created_at, str) and 'T' in created_at:
+        created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone().replace(tzinfo=None)
+        data['created_at'] = created_at
+    return PostData(**data)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+고위험 게시글 즉시 알림 발송기
+"""
+
+import json
+import os
+import queue
+import socket
+import threading
+import time
+import urllib.request
+from datetime import datetime
+
+from .result_store import ResultStore, canonicalize_url
+
+
+class WebhookSink:
+    """JSON POST로 알림을 보내는 웹훅 발송처"""
+
+    def __init__(self, url, timeout=5):
+        self.name = f"webhook({url})"
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alerts):
+        """알림 묶음 전송 - 2xx가 아니면 예외"""
+        body = json.dumps({'alerts': alerts}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(
+            self.url, data=body, headers={'Content-Type': 'application/json; charset=utf-8'}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            if not 200 <= response.status < 300:
+                raise IOError(f"HTTP {response.status}")
+
+
+class FileSink:
+    """알림을 JSONL 파일에 한 줄씩 추가하는 발송처 (다른 프로세스가 tail로 소비)"""
+
+    def __init__(self, path):
+        self.name = f"file({path})"
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def send(self, alerts):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for alert in alerts:
+                f.write(json.dumps(alert, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class AlertDispatcher:
+    """위험 점수가 기준 이상인 결과를 백그라운드 스레드에서 발송처로 전달
+
+    submit()은 큐에 넣기만 하므로 분석 루프를 막지 않는다. 발송 스레드는
+    batch_size개가 모이거나 flush_interval초가 지나면 묶어서 보내고, 실패한
+    발송처는 지수 백오프로 max_retries번까지 다시 시도한다. 같은 게시글
+    (정규화 URL 기준)은 한 번만 알린다. 수집 시각부터 발송 완료까지의
+    지연을 기록해 slo_seconds 초과 건수를 집계한다.
+
+    store(발송기 전용 연결의 ResultStore)가 주어지면 알림을 제출할 때 이
+    발송기가 발송 중인 상태(임대 lease_seconds초)로 기록하고, 같은 URL의
+    알림이 이미 기록되어 있으면 다시 알리지 않는다. 끝내 보내지 못한 알림과
+    죽은 프로세스가 발송 중으로 남긴 알림은 다음에 시작하는 발송기가 한
+    트랜잭션으로 가져가 먼저 보낸다(max_deliveries번 실패하면 포기).
+    """
+
+    def __init__(self, sinks, threshold=0.7, batch_size=20, flush_interval=2.0,
+                 max_retries=3, slo_seconds=60.0, store=None, max_deliveries=10, lease_seconds=300):
+        self.sinks = list(sinks)
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.slo_seconds = slo_seconds
+        self.store = store
+        self.max_deliveries = max_deliveries
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{id(self):x}"
+
+        self._queue = queue.Queue()
+        self._sent_urls = set()
+        self._latencies = []
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()  # 제출하는 스레드와 발송 스레드가 store 연결을 공유
+        self.stats = {'submitted': 0, 'duplicates': 0, 'sent': 0, 'failed': 0, 'slo_breaches': 0, 'redelivered': 0}
+
+        self._thread = None
+        if self.sinks:
+            self._thread = threading.Thread(target=self._run, name="alert-dispatcher", daemon=True)
+            self._thread.start()
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성 - 웹훅 URL이 있으면 웹훅, 파일 경로가 있으면 파일 발송처 추가"""
+        sinks = []
+        if config.alert_webhook_url:
+            sinks.append(WebhookSink(config.alert_webhook_url, timeout=config.timeout))
+        if config.alert_file_path:
+            sinks.append(FileSink(config.alert_file_path))
+        return cls(
+            sinks,
+            threshold=config.alert_threshold,
+            batch_size=config.alert_batch_size,
+            flush_interval=config.alert_flush_interval,
+            max_retries=config.alert_max_retries,
+            slo_seconds=config.alert_slo_seconds,
+            store=ResultStore(config.db_path) if sinks and config.db_path else None,
+            max_deliveries=config.alert_max_deliveries,
+            lease_seconds=config.alert_lease_seconds
+        )
+
+    def submit(self, result):
+        """분석 결과 제출 - 기준 이상이면 발송 대기열에 추가"""
+        if self._thread is None or result.analysis_result.risk_score < self.threshold:
+            return False
+
+        url = canonicalize_url(result.post_data.url)
+        with self._lock:
+            if url in self._sent_urls:
+                self.stats['duplicates'] += 1
+                return False
+            self._sent_urls.add(url)
+
+        alert = self._to_alert(result)
+        if self.store is not None:
+            with self._store_lock:
+                is_new = self.store.add_alert(url, alert, self.owner, self.lease_seconds)
+            if not is_new:
+                with self._lock:
+                    self.stats['duplicates'] += 1
+                return False
+
+        with self._lock:
+            self.stats['submitted'] += 1
+        self._queue.put((alert, result.post_data.fetched_at or result.collected_at))
+        return True
+
+    def _run(self):
+        """발송 스레드 - 이전 실행의 미발송 알림을 먼저 보내고, 이후 묶음 단위로 모아 전송"""
+        if self.store is not None:
+            with self._store_lock:
+                pending = self.store.claim_pending_alerts(self.owner, self.lease_seconds)
+            for index in range(0, len(pending), self.batch_size):
+                self._dispatch([(alert, None) for alert in pending[index:index + self.batch_size]])
+
+        closing = False
+        while not closing:
+            batch = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch:
+                self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        """묶음을 모든 발송처로 전송하고 발송 결과/지연 시간 기록
+
+        batch: (알림, 수집 시각) 목록 - 수집 시각이 None이면 이전 실행의 재발송
+        """
+        alerts = [alert for alert, _ in batch]
+        delivered = False
+        errors = []
+        for sink in self.sinks:
+            error = self._send_with_retry(sink, alerts)
+            if error is None:
+                delivered = True
+            else:
+                errors.append(f"{sink.name}: {error}")
+
+        if self.store is not None:
+            with self._store_lock:
+                self.store.mark_alerts(
+                    [alert['url'] for alert in alerts], delivered,
+                    error="; ".join(errors)[:500] or None, max_deliveries=self.max_deliveries
+                )
+
+        sent_at = datetime.now()
+        with self._lock:
+            if not delivered:
+                self.stats['failed'] += len(batch)
+                return
+            self.stats['sent'] += len(batch)
+            for _, fetched_at in batch:
+                if fetched_at is None:
+                    self.stats['redelivered'] += 1
+                    continue
+                latency = (sent_at - fetched_at).total_seconds()
+                self._latencies.append(latency)
+                if latency > self.slo_seconds:
+                    self.stats['slo_breaches'] += 1
+
+    def _send_with_retry(self, sink, alerts):
+        """발송처 1곳 전송 - 실패 시 지수 백오프 재시도, 끝내 실패하면 마지막 오류 반환"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                sink.send(alerts)
+                return None
+            except Exception as e:
+                if attempt == self.max_retries:
+                    print(f"  알림 발송 실패 ({sink.name}): {e}")
+                    return str(e)
+                time.sleep(min(30.0, 0.5 * (2 ** attempt)))
+        return "발송 실패"
+
+    def _to_alert(self, result):
+        """알림 메시지 본문"""
+        post = result.post_data
+        analysis = result.analysis_result
+        return {
+            'url': post.url,
+            'platform': post.platform,
+            'keyword': post.keyword,
+            'title': post.title,
+            'risk_score': analysis.risk_score,
+            'reason': analysis.reason,
+            'method': analysis.method,
+            'fetched_at': post.fetched_at.isoformat() if post.fetched_at else None,
+            'analyzed_at': result.collected_at.isoformat()
+        }
+
+    def slo_summary(self):
+        """수집→알림 지연 요약 (p50/p95/최대, SLO 초과 건수)"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            summary = dict(self.stats)
+        if latencies:
+            summary['p50'] = latencies[len(latencies) // 2]
+            summary['p95'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            summary['max'] = latencies[-1]
+        return summary
+
+    def close(self, timeout=30):
+        """남은 알림을 모두 보내고 발송 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        if self.store is not None:
+            with self._store_lock:
+                self.store.close()
+
+        summary = self.slo_summary()
+        if summary['redelivered']:
+            print(f"이전 실행에서 보내지 못한 알림 {summary['redelivered']}건 재발송")
+        if summary['submitted']:
+            line = f"알림 발송: {summary['sent'] - summary['redelivered']}건 성공, {summary['failed']}건 실패"
+            if 'p95' in summary:
+                line += (f", 수집→알림 지연 p50 {summary['p50']:.1f}초 / p95 {summary['p95']:.1f}초 "
+                         f"(SLO {self.slo_seconds:.0f}초 초과 {summary['slo_breaches']}건)")
+            print(line)
+        if summary['failed'] and self.store is not None:
+            print("발송하지 못한 알림은 다음 실행에서 다시 보냅니다.")
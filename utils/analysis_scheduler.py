@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사전 점수 기반 분석 우선순위 큐
+"""
+
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+
+
+class AnalysisScheduler:
+    """위험 가능성이 높은 게시글부터 분석하도록 순서를 정하는 우선순위 큐
+
+    우선순위 = 키워드 사전 점수 + 최신 글 가산점 + 플랫폼 가중치.
+    큐에서 기다린 시간만큼 aging_per_minute씩 우선순위가 올라가므로 새 글이
+    계속 들어와도 먼저 들어온 글이 무한정 밀리지 않는다. 대기 가산점은 모든
+    항목에 같은 속도로 붙으므로 힙 키는 (aging * 등록시각 - 우선순위)로
+    고정할 수 있다.
+    """
+
+    def __init__(self, prescorer, aging_per_minute=0.05, recency_hours=24, recency_bonus=0.2,
+                 platform_weights=None, high_priority=0.4):
+        self.prescorer = prescorer
+        self.aging_per_second = aging_per_minute / 60.0
+        self.recency_hours = recency_hours
+        self.recency_bonus = recency_bonus
+        self.platform_weights = platform_weights or {}
+        self.high_priority = high_priority
+        self._heap = []
+        self._counter = itertools.count()
+        self.stats = {'high_priority': 0, 'high_priority_wait': 0.0, 'high_priority_max_wait': 0.0}
+
+    @classmethod
+    def from_config(cls, config, prescorer):
+        """설정 객체로부터 생성"""
+        return cls(
+            prescorer,
+            aging_per_minute=config.priority_aging_per_minute,
+            recency_hours=config.priority_recency_hours,
+            recency_bonus=config.priority_recency_bonus,
+            platform_weights=config.priority_platform_weights,
+            high_priority=config.priority_high_threshold
+        )
+
+    def priority(self, post, now=None):
+        """게시글 사전 우선순위"""
+        score, _, _ = self.prescorer.analyze(f"{post.title} {post.content}")
+
+        posted_at = post.created_at if isinstance(post.created_at, datetime) else post.fetched_at
+        if posted_at is not None and posted_at.tzinfo is not None:
+            posted_at = posted_at.astimezone().replace(tzinfo=None)  # Twitter 검색 결과는 UTC 시각
+        if posted_at is not None and (now or datetime.now()) - posted_at <= timedelta(hours=self.recency_hours):
+            score += self.recency_bonus
+
+        return score + self.platform_weights.get(post.platform, 0.0)
+
+    def push(self, post):
+        """게시글 등록"""
+        enqueued = time.monotonic()
+        priority = self.priority(post)
+        key = self.aging_per_second * enqueued - priority
+        heapq.heappush(self._heap, (key, next(self._counter), enqueued, priority, post))
+
+    def pop(self):
+        """현재 가장 우선순위가 높은 게시글 - (게시글, 사전 우선순위)"""
+        _, _, enqueued, priority, post = heapq.heappop(self._heap)
+        if priority >= self.high_priority:
+            waited = time.monotonic() - enqueued
+            self.stats['high_priority'] += 1
+            self.stats['high_priority_wait'] += waited
+            self.stats['high_priority_max_wait'] = max(self.stats['high_priority_max_wait'], waited)
+        return post, priority
+
+    def __len__(self):
+        return len(self._heap)
+
+    def summary(self):
+        """고위험 후보 대기 시간 요약 문자열 - 고위험 후보가 없으면 None"""
+        count = self.stats['high_priority']
+        if not count:
+            return None
+        return (f"고위험 후보 {count}건 - 분석 시작까지 평균 {self.stats['high_priority_wait'] / count:.1f}초, "
+                f"최대 {self.stats['high_priority_max_wait']:.1f}초 대기")
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+게시글 원문 압축 아카이브
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+from .result_store import canonicalize_url
+from .stage_profiler import profiled
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    segment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    segment_id INTEGER NOT NULL REFERENCES segments(segment_id),
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    raw_length INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    platform TEXT NOT NULL,
+    keyword TEXT,
+    title TEXT,
+    author TEXT,
+    created_at TEXT,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_archive_posts_fetched_at ON posts(fetched_at);
+"""
+
+POST_UPSERT = """
+INSERT INTO posts (url, digest, platform, keyword, title, author, created_at, fetched_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    digest = excluded.digest,
+    platform = excluded.platform,
+    keyword = excluded.keyword,
+    title = excluded.title,
+    author = excluded.author,
+    created_at = COALESCE(excluded.created_at, posts.created_at),
+    fetched_at = excluded.fetched_at
+"""
+
+RECORD_COLUMNS = """
+SELECT p.url, p.platform, p.keyword, p.title, p.author, p.created_at, p.fetched_at,
+       s.path, b.offset, b.length
+FROM posts p JOIN blobs b ON b.digest = p.digest JOIN segments s ON s.segment_id = b.segment_id
+"""
+
+
+def content_digest(text):
+    """본문 내용 해시 (같은 본문은 한 번만 저장)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def read_contents(directory, locations):
+    """(세그먼트 경로, 위치, 길이) 목록의 본문을 순서대로 읽어 압축 해제
+
+    아카이브 인덱스 연결 없이 동작하므로 프로세스 풀 작업에서 그대로 쓸 수
+    있다. 같은 세그먼트는 한 번만 연다.
+    """
+    texts = []
+    handle = None
+    current = None
+    try:
+        for path, offset, length in locations:
+            if path != current:
+                if handle is not None:
+                    handle.close()
+                handle = open(os.path.join(directory, path), 'rb')
+                current = path
+            handle.seek(offset)
+            texts.append(zlib.decompress(handle.read(length)).decode('utf-8'))
+    finally:
+        if handle is not None:
+            handle.close()
+    return texts
+
+
+class ContentArchive:
+    """수집한 게시글 본문을 해시 기준으로 중복 제거해 압축 보관하는 아카이브
+
+    본문은 zlib으로 압축해 추가 전용 세그먼트 파일에 이어 쓰고, 위치는 SQLite
+    인덱스에 기록한다. 세그먼트 파일은 프로세스마다 따로 만들므로 여러 워커가
+    동시에 써도 위치가 겹치지 않는다. 세그먼트를 fsync한 뒤 인덱스를
+    커밋하므로 인덱스가 가리키는 본문은 항상 파일에 있다.
+    """
+
+    def __init__(self, directory, segment_bytes=256 * 1024 * 1024, level=6, batch_size=200):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.level = level
+        self.batch_size = batch_size
+        self._pending = []
+        self._segment = None  # (segment_id, 파일 객체)
+        self._lock = threading.Lock()
+        self.stats = {'posts': 0, 'stored': 0, 'deduplicated': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.conn = sqlite3.connect(os.path.join(directory, "index.db"), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성"""
+        return cls(
+            config.archive_dir,
+            segment_bytes=config.archive_segment_bytes,
+            level=config.archive_compress_level
+        )
+
+    def add(self, post):
+        """게시글 본문 보관 (batch_size건마다 기록)"""
+        if not post.content:
+            return
+        with self._lock:
+            self._pending.append(post)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        """대기 중인 게시글 기록"""
+        with self._lock:
+            self._flush()
+
+    @profiled('persist')
+    def _flush(self):
+        if not self._pending:
+            return
+        posts, self._pending = self._pending, []
+
+        digests = [content_digest(post.content) for post in posts]
+        known = self._existing_digests(set(digests))
+
+        blob_rows = []
+        for post, digest in zip(posts, digests):
+            if digest in known:
+                self.stats['deduplicated'] += 1
+                continue
+            known.add(digest)
+            raw = post.content.encode('utf-8')
+            compressed = zlib.compress(raw, self.level)
+            segment_id, handle = self._writable_segment()
+            offset = handle.tell()
+            handle.write(compressed)
+            blob_rows.append((digest, segment_id, offset, len(compressed), len(raw)))
+            self.stats['stored'] += 1
+            self.stats['raw_bytes'] += len(raw)
+            self.stats['stored_bytes'] += len(compressed)
+
+        if blob_rows:
+            handle = self._segment[1]
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        now = datetime.now()
+        post_rows = [
+            (
+                canonicalize_url(post.url), digest, post.platform, post.keyword, post.title,
+                post.author, self._format_time(post.created_at), self._format_time(post.fetched_at or now)
+            )
+            for post, digest in zip(posts, digests)
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO blobs (digest, segment_id, offset, length, raw_length) VALUES (?, ?, ?, ?, ?)",
+                blob_rows
+            )
+            self.conn.executemany(POST_UPSERT, post_rows)
+        self.stats['posts'] += len(posts)
+
+    def _existing_digests(self, digests):
+        """이미 보관된 본문 해시"""
+        found = set()
+        digests = list(digests)
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT digest FROM blobs WHERE digest IN ({','.join('?' * len(chunk))})", chunk
+            )
+            found.update(row['digest'] for row in rows)
+        return found
+
+    def _writable_segment(self):
+        """현재 세그먼트 (크기 상한에 도달하면 새 세그먼트 생성)"""
+        if self._segment is not None and self._segment[1].tell() >= self.segment_bytes:
+            handle = self._segment[1]
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+            self._segment = None
+
+        if self._segment is None:
+            path = f"segment_{datetime.now().strftime('%Y%m%d%H%M%S%f')}_{os.getpid()}.bin"
+            with self.conn:
+                segment_id = self.conn.execute("INSERT INTO segments (path) VALUES (?)", (path,)).lastrowid
+            self._segment = (segment_id, open(os.path.join(self.directory, path), 'ab'))
+        return self._segment
+
+    def iter_records(self, since=None, until=None, keyword=None, platform=None, batch_size=1000):
+        """보관된 게시글 메타데이터와 본문 위치를 묶음 단위로 반환
+
+        본문은 읽지 않으며, 세그먼트 파일을 순차로 읽도록 (세그먼트, 위치) 순으로
+        정렬한다. 각 레코드는 dict이고 'location'은 read_contents()에 넘길 값이다.
+        """
+        clauses = []
+        params = []
+        if since:
+            clauses.append("p.fetched_at >= ?")
+            params.append(self._format_time(since))
+        if until:
+            clauses.append("p.fetched_at < ?")
+            params.append(self._format_time(until))
+        if keyword:
+            clauses.append("p.keyword = ?")
+            params.append(keyword)
+        if platform:
+            clauses.append("p.platform = ?")
+            params.append(platform)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+
+        cursor = self.conn.execute(RECORD_COLUMNS + where + " ORDER BY b.segment_id, b.offset", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [
+                {
+                    'url': row['url'],
+                    'platform': row['platform'],
+                    'keyword': row['keyword'],
+                    'title': row['title'],
+                    'author': row['author'],
+                    'created_at': row['created_at'],
+                    'fetched_at': row['fetched_at'],
+                    'location': (row['path'], row['offset'], row['length'])
+                }
+                for row in rows
+            ]
+
+    def read(self, records):
+        """레코드 목록의 본문 읽기"""
+        return read_contents(self.directory, [record['location'] for record in records])
+
+    def count(self):
+        """보관된 게시글 수와 고유 본문 수"""
+        posts = self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        blobs = self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return posts, blobs
+
+    def close(self):
+        """대기 중인 게시글 기록 후 파일/인덱스 닫기"""
+        with self._lock:
+            self._flush()
+            if self._segment is not None:
+                self._segment[1].close()
+                self._segment = None
+        self.conn.close()
+
+    def _format_time(self, value):
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        return value or None
@@ -5,26 +5,51 @@
 """
 
 from datetime import datetime
+from models.data_models import AnalysisResult, MonitoringResult
 
 
 class DataProcessor:
     """데이터 처리 관련 유틸리티"""
 
-    def create_result_record(self, item, risk_score, is_risky, reason):
+    def create_result_record(self, item, risk_score, is_risky, reason, method=''):
         """분석 결과 레코드 생성"""
+        return MonitoringResult(
+            post_data=item,
+            analysis_result=AnalysisResult(risk_score, is_risky, reason, method),
+            collected_at=datetime.now()
+        )
+
+    def to_output_record(self, result):
+        """결과 레코드를 CSV 출력용 한글 컬럼 딕셔너리로 변환"""
+        post = result.post_data
+        analysis = result.analysis_result
         return {
-            '수집일시': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            '플랫폼': item['platform'],
-            '게시글_URL': item['url'],
-            '게시글_제목': item.get('title', ''),
-            '게시글_내용': self._truncate_content(item.get('content', '')),
-            'AI_분석_점수': risk_score,
-            '자살유발정보_여부': is_risky,
-            'AI_분석_근거': reason,
-            '검색키워드': item['keyword'],
-            '크롤링_성공': item.get('crawl_success', True)
+            '수집일시': result.collected_at.strftime("%Y-%m-%d %H:%M:%S"),
+            '플랫폼': post.platform,
+            '게시글_URL': post.url,
+            '작성일시': self._format_created_at(post.created_at),
+            '게시글_제목': post.title,
+            '게시글_내용': self._truncate_content(post.content),
+            'AI_분석_점수': analysis.risk_score,
+            '자살유발정보_여부': analysis.is_risky,
+            'AI_분석_근거': analysis.reason,
+            '검색키워드': post.keyword,
+            '크롤링_성공': post.crawl_success,
+            '본문_수집': '지연' if post.fetch_status == 'deferred' else '수집',
+            '분석방법': analysis.method
         }
 
+    def iter_output_records(self, results):
+        """출력용 레코드를 하나씩 생성"""
+        for result in results:
+            yield self.to_output_record(result)
+
+    def _format_created_at(self, created_at):
+        """게시글 작성일시 문자열 변환"""
+        if isinstance(created_at, datetime):
+            return created_at.strftime("%Y-%m-%d %H:%M:%S")
+        return created_at or ''
+
     def _truncate_content(self, content):
         """내용 길이 제한"""
         if len(content) > 500:
@@ -37,17 +62,17 @@ class DataProcessor:
         risky_count = 0
 
         for result in results:
-            platform = result['플랫폼']
+            platform = result.post_data.platform
             if platform not in platform_stats:
                 platform_stats[platform] = {'total': 0, 'risky': 0, 'success': 0}
 
             platform_stats[platform]['total'] += 1
 
-            if result['자살유발정보_여부'] == 'Y':
+            if result.analysis_result.is_risky == 'Y':
                 platform_stats[platform]['risky'] += 1
                 risky_count += 1
 
-            if result.get('크롤링_성공', True):
+            if result.post_data.crawl_success:
                 platform_stats[platform]['success'] += 1
 
         return platform_stats, risky_count
@@ -8,15 +8,18 @@ import os
 import pandas as pd
 from datetime import datetime
 from .data_processor import DataProcessor
+from .result_store import ResultStore
+from .stage_profiler import profiled
 
 
 class FileManager:
     """파일 저장 및 관리"""
 
-    def __init__(self):
+    def __init__(self, db_path="results/monitoring.db"):
         """파일 매니저 초기화"""
         self.data_processor = DataProcessor()
         self._ensure_directories()
+        self.result_store = ResultStore(db_path) if db_path else None
 
     def _ensure_directories(self):
         """필요한 디렉토리 생성"""
@@ -24,30 +27,62 @@ class FileManager:
             if not os.path.exists(directory):
                 os.makedirs(directory)
 
-    def save_results(self, results, filename=None):
-        """결과를 CSV 파일로 저장"""
+    @profiled('persist')
+    def save_results(self, results, filename=None, keywords=None, platforms=None, aggregator=None):
+        """결과를 CSV 파일 및 결과 저장소에 저장 - 결과 저장소 반영에 실패하면 False"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"results/suicide_monitoring_result_{timestamp}.csv"
 
         if not results:
             print("저장할 데이터가 없습니다.")
-            return
+            return True
 
         # CSV 저장
-        df = pd.DataFrame(results)
+        df = pd.DataFrame(list(self.data_processor.iter_output_records(results)))
         df.to_csv(filename, index=False, encoding='utf-8-sig')
 
+        # 결과 저장소 반영
+        stored = True
+        if self.result_store:
+            stored = self._save_to_store(results, filename, keywords, platforms, aggregator)
+
         # 통계 출력
-        self._print_statistics(results, filename)
+        self._print_statistics(results, filename, aggregator)
+        return stored
+
+    def _save_to_store(self, results, filename, keywords, platforms, aggregator=None):
+        """결과 저장소에 실행 이력과 결과 저장"""
+        try:
+            run_id = self.result_store.start_run(keywords, platforms)
+            saved = self.result_store.upsert_results(results, run_id)
+            if aggregator:
+                risky = aggregator.risky_count
+                aggregator.flush(self.result_store)
+            else:
+                risky = len([r for r in results if r.analysis_result.is_risky == 'Y'])
+            self.result_store.finish_run(run_id, filename, saved, risky)
+            print(f"결과 저장소에 {saved}개 항목 반영 완료 (실행 ID: {run_id})")
+            return True
+        except Exception as e:
+            print(f"결과 저장소 저장 중 오류: {e}")
+            return False
+
+    def close(self):
+        """결과 저장소 연결 종료"""
+        if self.result_store:
+            self.result_store.close()
 
-    def _print_statistics(self, results, filename):
+    def _print_statistics(self, results, filename, aggregator=None):
         """통계 정보 출력"""
         print(f"\n결과가 '{filename}' 파일로 저장되었습니다.")
         print(f"총 {len(results)}개의 게시글이 분석되었습니다.")
 
-        # 플랫폼별 통계
-        platform_stats, risky_count = self.data_processor.calculate_platform_stats(results)
+        # 플랫폼별 통계 (집계기가 있으면 미리 계산된 값 사용)
+        if aggregator:
+            platform_stats, risky_count = aggregator.platform_stats()
+        else:
+            platform_stats, risky_count = self.data_processor.calculate_platform_stats(results)
 
         print(f"\n=== 플랫폼별 수집 결과 ===")
         for platform, stats in platform_stats.items():
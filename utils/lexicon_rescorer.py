@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 사전 변경분 재채점기
+"""
+
+import time
+
+
+class LexiconRescorer:
+    """키워드 사전에서 추가/삭제/등급이 바뀐 용어가 들어 있는 게시글만 다시 채점
+
+    마지막 재채점 때의 사전을 결과 저장소에 기록해 두고 현재
+    KeywordAnalyzer의 사전과 비교한다. 바뀐 용어로 전문 검색 인덱스를 조회해
+    영향을 받는 게시글만 찾고, 키워드 분석으로 판정된 결과만 제자리에서
+    갱신한다(OpenAI 판정은 사전과 무관하므로 그대로 둔다). 처음 실행하면
+    현재 사전을 기준으로 기록만 한다.
+    """
+
+    METHOD_PREFIX = "키워드"
+
+    def __init__(self, result_store, keyword_analyzer, batch_size=500):
+        self.store = result_store
+        self.analyzer = keyword_analyzer
+        self.batch_size = batch_size
+
+    def current_lexicon(self):
+        """분석기의 현재 사전 - {종류: 용어 집합}"""
+        return {
+            'suicide': set(self.analyzer.suicide_keywords),
+            'high_risk': set(self.analyzer.high_risk_keywords)
+        }
+
+    def changed_terms(self, previous, current):
+        """두 사전에서 채점 결과가 달라질 수 있는 용어 집합"""
+        changed = set()
+        for kind in current.keys() | previous.keys():
+            changed |= current.get(kind, set()) ^ previous.get(kind, set())
+        return changed
+
+    def run(self, dry_run=False):
+        """변경분 재채점 - 통계 dict 반환
+
+        통계: baseline(처음 실행 여부), terms(바뀐 용어 목록), candidates(대상 게시글),
+        updated(점수/판정이 바뀐 결과), newly_risky, cleared, seconds
+        """
+        started = time.perf_counter()
+        stats = {'baseline': False, 'terms': [], 'candidates': 0, 'updated': 0, 'newly_risky': 0, 'cleared': 0}
+        current = self.current_lexicon()
+        previous = self.store.get_lexicon()
+
+        if previous is None:
+            stats['baseline'] = True
+            if not dry_run:
+                self.store.save_lexicon(current)
+            stats['seconds'] = time.perf_counter() - started
+            return stats
+
+        stats['terms'] = sorted(self.changed_terms(previous, current))
+        if stats['terms']:
+            for batch in self.store.iter_term_matches(
+                stats['terms'], method_prefix=self.METHOD_PREFIX, batch_size=self.batch_size
+            ):
+                updates = self._rescore(batch, stats)
+                if updates and not dry_run:
+                    self.store.update_verdicts(updates)
+
+        if not dry_run:
+            self.store.save_lexicon(current)
+        stats['seconds'] = time.perf_counter() - started
+        return stats
+
+    def _rescore(self, batch, stats):
+        """묶음 재채점 - 바뀐 결과의 갱신 행 목록"""
+        updates = []
+        for row in batch:
+            stats['candidates'] += 1
+            text = f"{row['title'] or ''} {(row['content'] or '').strip()}"
+            risk_score, is_risky, reason = self.analyzer.analyze(text)
+            if risk_score == row['risk_score'] and is_risky == row['is_risky'] and reason == row['reason']:
+                continue
+
+            updates.append((risk_score, is_risky, reason, int(is_risky == 'Y'), row['url']))
+            stats['updated'] += 1
+            stats['newly_risky'] += is_risky == 'Y' and row['is_risky'] != 'Y'
+            stats['cleared'] += is_risky == 'N' and row['is_risky'] == 'Y'
+        return updates
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 로깅 설정 (진입점에서 한 번 호출)
+"""
+
+import atexit
+import itertools
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """레코드를 큐에 넣기만 하는 핸들러 - 큐가 가득 차면 기다리지 않고 버림
+
+    기본 QueueHandler는 큐에 넣기 전에 호출한 스레드에서 메시지를 포맷하지만,
+    같은 프로세스 안의 큐이므로 포맷은 리스너 스레드에 맡긴다.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SampleFilter(logging.Filter):
+    """게시글마다 남기는 로그를 every건 중 1건만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = max(1, every)
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or next(self._counter) % self.every == 0
+
+
+_handler = None
+_listener = None
+_pid = None
+
+
+def setup_logging(config):
+    """루트 로거를 큐 핸들러로 교체하고 콘솔/파일 출력은 백그라운드 스레드에서 처리
+
+    모듈별 수준(config.log_levels)과 게시글 단위 로거 샘플링을 적용한다. 같은
+    프로세스에서 다시 호출하면 아무것도 하지 않고, fork된 워커 프로세스에서
+    호출하면 그 프로세스의 리스너를 새로 만든다.
+    """
+    global _handler, _listener, _pid
+    if _listener is not None and _pid == os.getpid():
+        return _handler
+
+    log_queue = queue.Queue(maxsize=config.log_queue_size)
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setLevel(config.log_console_level)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    handlers = [console]
+
+    if config.log_file:
+        directory = os.path.dirname(config.log_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        file_handler = RotatingFileHandler(
+            config.log_file, maxBytes=config.log_file_max_bytes, backupCount=config.log_file_backups, encoding='utf-8'
+        )
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s [%(threadName)s] %(message)s'))
+        handlers.append(file_handler)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    _handler = NonBlockingQueueHandler(log_queue)
+    root.addHandler(_handler)
+    root.setLevel(config.log_level)
+
+    for name, level in config.log_levels.items():
+        logging.getLogger(name).setLevel(level)
+    for name in config.log_sampled_loggers:
+        sampled = logging.getLogger(name)
+        sampled.filters = [f for f in sampled.filters if not isinstance(f, SampleFilter)]
+        sampled.addFilter(SampleFilter(config.log_sample_every))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _pid = os.getpid()
+    atexit.register(shutdown_logging)
+    return _handler
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is None or _pid != os.getpid():
+        return
+    _listener.stop()
+    _listener = None
+    if _handler.dropped:
+        print(f"로그 큐가 가득 차 {_handler.dropped}건의 로그를 버렸습니다.")
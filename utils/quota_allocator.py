@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+위험 게시글 수율 기반 수집량 배분기
+"""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+
+class QuotaAllocator:
+    """(키워드, 플랫폼)별 수집량을 위험 게시글 수율에 맞춰 배분하는 밴딧
+
+    각 쌍의 게시글당 위험 비율은 Beta 사후분포로 보고(사전분포는 같은 플랫폼
+    전체 수율을 prior_weight건 관측한 것으로 봄),
+    게시글당 비용(요청 수 + 초 + 토큰에 가중치를 준 합)으로 나눈 "비용당
+    위험 게시글"이 가장 큰 쌍일 확률을 톰슨 샘플링으로 구해 예산을 나눈다.
+    예산 중 min_share는 모든 쌍에 똑같이 나눠 결과가 적은 쌍도 계속 탐색한다.
+    전체 예산은 사용자가 정한 플랫폼별 수집량에 게시글당 비용을 곱한 합이므로
+    총 지출은 그대로 두고 배분만 바뀐다.
+    """
+
+    def __init__(self, result_store, min_share=0.2, history_days=30, cost_weights=None,
+                 cost_decay=0.8, max_per_pair=1000, min_per_pair=5, prior_weight=10, draws=500, seed=None):
+        self.store = result_store
+        self.min_share = min_share
+        self.history_days = history_days
+        self.cost_weights = cost_weights or {'requests': 1.0, 'seconds': 0.0, 'tokens': 0.0}
+        self.cost_decay = cost_decay
+        self.max_per_pair = max_per_pair
+        self.min_per_pair = min_per_pair
+        self.prior_weight = prior_weight
+        self.draws = draws
+        self.random = random.Random(seed)
+        self._tokens = defaultdict(lambda: [0, 0])  # (키워드, 플랫폼) → [분석 건수, 토큰]
+
+    @classmethod
+    def from_config(cls, config, result_store):
+        """설정 객체로부터 생성"""
+        return cls(
+            result_store,
+            min_share=config.quota_min_share,
+            history_days=config.quota_history_days,
+            cost_weights=config.quota_cost_weights,
+            cost_decay=config.quota_cost_decay,
+            max_per_pair=config.quota_max_per_pair,
+            min_per_pair=config.quota_min_per_pair
+        )
+
+    def allocate(self, base_counts):
+        """{(키워드, 플랫폼): 기본 수집량}을 같은 총비용의 {(키워드, 플랫폼): 수집량}으로 재배분"""
+        pairs = list(base_counts)
+        if not pairs:
+            return {}
+
+        since = datetime.now() - timedelta(days=self.history_days) if self.history_days else None
+        yields = self.store.pair_yields(since)
+        costs = self._costs_per_post(pairs)
+        budget = sum(base_counts[pair] * costs[pair] for pair in pairs)
+
+        wins = self._win_rates(pairs, yields, costs)
+        explore = budget * self.min_share / len(pairs)
+        exploit = budget * (1 - self.min_share)
+
+        counts = {}
+        for pair in pairs:
+            share = explore + exploit * wins[pair]
+            counts[pair] = max(self.min_per_pair, min(self.max_per_pair, int(share / costs[pair])))
+        return counts
+
+    def _win_rates(self, pairs, yields, costs):
+        """각 쌍이 비용당 위험 게시글 수가 가장 클 확률 (톰슨 샘플링)"""
+        platform_yields = defaultdict(lambda: [0, 0])
+        for (_, platform), (total, risky) in yields.items():
+            platform_yields[platform][0] += total
+            platform_yields[platform][1] += risky
+
+        posteriors = []
+        for pair in pairs:
+            total, risky = yields.get(pair, (0, 0))
+            pooled_total, pooled_risky = platform_yields.get(pair[1], (0, 0))
+            prior = pooled_risky / pooled_total if pooled_total else 0.5
+            alpha = risky + 1 + prior * self.prior_weight
+            beta = total - risky + 1 + (1 - prior) * self.prior_weight
+            posteriors.append((pair, alpha, beta))
+
+        wins = dict.fromkeys(pairs, 0)
+        for _ in range(self.draws):
+            best = max(
+                posteriors,
+                key=lambda entry: self.random.betavariate(entry[1], entry[2]) / costs[entry[0]]
+            )
+            wins[best[0]] += 1
+        return {pair: count / self.draws for pair, count in wins.items()}
+
+    def _costs_per_post(self, pairs):
+        """게시글당 비용 - 기록이 없는 쌍은 같은 플랫폼 합계로, 그것도 없으면 1로 봄
+
+        요청 수/초는 수집 게시글당, 토큰은 LLM 분석 게시글당 평균을 쓴다.
+        """
+        history = self.store.get_pair_costs()
+        platform_totals = defaultdict(lambda: defaultdict(float))
+        for (_, platform), cost in history.items():
+            for key, value in cost.items():
+                platform_totals[platform][key] += value
+
+        costs = {}
+        for pair in pairs:
+            cost = history.get(pair)
+            if not cost or cost['posts'] <= 0:
+                cost = platform_totals.get(pair[1])
+            if not cost or cost['posts'] <= 0:
+                costs[pair] = 1.0
+                continue
+
+            weighted = (cost['requests'] * self.cost_weights.get('requests', 0.0)
+                        + cost['seconds'] * self.cost_weights.get('seconds', 0.0)) / cost['posts']
+            if cost['analyzed'] > 0:
+                weighted += cost['tokens'] / cost['analyzed'] * self.cost_weights.get('tokens', 0.0)
+            costs[pair] = max(weighted, 1e-3)
+        return costs
+
+    def record_collection(self, keyword, platform, posts, requests, seconds):
+        """수집 1회 비용 기록 (이전 기록은 cost_decay만큼 줄여 최근 비용을 반영)"""
+        self.store.record_pair_cost(keyword, platform, posts, requests, seconds, decay=self.cost_decay)
+
+    def add_tokens(self, keyword, platform, tokens):
+        """LLM 분석 1건의 토큰 사용량 누적 (flush()에서 기록)"""
+        entry = self._tokens[(keyword, platform)]
+        entry[0] += 1
+        entry[1] += tokens or 0
+
+    def flush(self):
+        """누적한 LLM 분석 건수/토큰 기록"""
+        for (keyword, platform), (analyzed, tokens) in self._tokens.items():
+            self.store.record_pair_tokens(keyword, platform, analyzed, tokens, decay=self.cost_decay)
+        self._tokens.clear()
+
+    def describe(self, base_counts, counts):
+        """배분 결과 출력용 줄 목록"""
+        lines = []
+        yields = self.store.pair_yields(
+            datetime.now() - timedelta(days=self.history_days) if self.history_days else None
+        )
+        for pair in sorted(counts, key=counts.get, reverse=True):
+            total, risky = yields.get(pair, (0, 0))
+            rate = f"{risky / total * 100:.1f}% ({risky}/{total})" if total else "기록 없음"
+            lines.append(f"- {pair[0]} / {pair[1]}: {base_counts[pair]} → {counts[pair]}개 (위험 수율 {rate})")
+        return lines
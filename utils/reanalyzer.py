@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+아카이브 기반 오프라인 재분석기
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+from models.data_models import PostData
+from .content_archive import read_contents
+from .data_processor import DataProcessor
+
+
+_keyword_analyzer = None
+
+
+def keyword_score_batch(directory, locations, titles):
+    """프로세스 풀 작업 - 본문 묶음을 읽어 키워드 분석 결과 목록 반환"""
+    global _keyword_analyzer
+    if _keyword_analyzer is None:
+        from analyzers.keyword_analyzer import KeywordAnalyzer
+        _keyword_analyzer = KeywordAnalyzer()
+
+    texts = read_contents(directory, locations)
+    return [
+        (*_keyword_analyzer.analyze(f"{title} {text}"), "키워드(재분석)")
+        for title, text in zip(titles, texts)
+    ]
+
+
+class Reanalyzer:
+    """아카이브에 보관된 본문을 네트워크 요청 없이 다시 분석해 결과 저장소 갱신
+
+    키워드 분석은 CPU 작업이므로 프로세스 풀에 본문 위치만 넘기고, 각
+    프로세스가 본문 읽기/압축 해제/분석을 모두 한 뒤 판정만 돌려준다. OpenAI
+    처럼 응답 대기가 긴 분석 함수는 스레드 풀에서 실행한다. 동시에 처리하는
+    묶음을 workers * 2개로 제한하므로 아카이브 크기와 관계없이 메모리
+    사용량이 일정하다.
+    """
+
+    def __init__(self, archive, result_store, workers=None, batch_size=500):
+        self.archive = archive
+        self.store = result_store
+        self.workers = workers or os.cpu_count() or 2
+        self.batch_size = batch_size
+        self.data_processor = DataProcessor()
+
+    def run_keyword(self, **filters):
+        """키워드 분석기로 재분석 (프로세스 풀)"""
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            def submit(batch):
+                future = executor.submit(
+                    keyword_score_batch, self.archive.directory,
+                    [record['location'] for record in batch], [record['title'] for record in batch]
+                )
+                return future.result
+
+            return self._run(submit, filters)
+
+    def run(self, analyze, **filters):
+        """analyze(text) -> (점수, 판정, 근거, 분석방법) 함수로 재분석 (스레드 풀)"""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def submit(batch):
+                texts = self.archive.read(batch)
+                futures = [
+                    executor.submit(analyze, f"{record['title']} {text}")
+                    for record, text in zip(batch, texts)
+                ]
+                return lambda: [future.result() for future in futures]
+
+            return self._run(submit, filters)
+
+    def _run(self, submit, filters):
+        """아카이브를 묶음 단위로 흘려보내며 분석 결과 저장 - 통계 dict 반환"""
+        started = time.perf_counter()
+        stats = {'total': 0, 'risky': 0, 'newly_risky': 0, 'cleared': 0}
+        run_id = self.store.start_run(keywords=[filters.get('keyword') or '*'], platforms=['재분석'])
+
+        in_flight = deque()
+        for batch in self.archive.iter_records(batch_size=self.batch_size, **filters):
+            in_flight.append((batch, submit(batch)))
+            if len(in_flight) >= self.workers * 2:
+                self._save(*in_flight.popleft(), run_id, stats)
+        while in_flight:
+            self._save(*in_flight.popleft(), run_id, stats)
+
+        self.store.finish_run(run_id, total=stats['total'], risky=stats['risky'])
+        stats['seconds'] = time.perf_counter() - started
+        return stats
+
+    def _save(self, batch, collect, run_id, stats):
+        """묶음 분석 결과를 저장하고 이전 판정과 비교"""
+        verdicts = collect()
+        previous = self.store.get_verdicts([record['url'] for record in batch])
+
+        results = []
+        for record, (risk_score, is_risky, reason, method) in zip(batch, verdicts):
+            post = PostData(
+                platform=record['platform'],
+                url=record['url'],
+                title=record['title'] or '',
+                content='',
+                keyword=record['keyword'] or '',
+                created_at=record['created_at'],
+                author=record['author'] or '',
+                fetched_at=datetime.strptime(record['fetched_at'], "%Y-%m-%d %H:%M:%S")
+            )
+            results.append(self.data_processor.create_result_record(post, risk_score, is_risky, reason, method))
+
+            before = previous.get(record['url'])
+            stats['risky'] += is_risky == 'Y'
+            stats['newly_risky'] += is_risky == 'Y' and before == 'N'
+            stats['cleared'] += is_risky == 'N' and before == 'Y'
+
+        self.store.upsert_reanalysis(results, run_id)
+        stats['total'] += len(results)
+        if stats['total'] % (self.batch_size * 20) < len(results):
+            print(f"- {stats['total']:,}건 재분석")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+누적 결과 분석 리포트 생성기
+"""
+
+import html
+import os
+import urllib.parse
+from datetime import datetime
+
+import pandas as pd
+
+from models.data_models import PostData, AnalysisResult, MonitoringResult
+
+
+# 과거 CSV에서 읽을 컬럼 (게시글 본문 등 나머지 컬럼은 읽지 않음)
+CSV_COLUMNS = {
+    '수집일시', '플랫폼', '게시글_URL', '작성일시', '게시글_제목',
+    'AI_분석_점수', '자살유발정보_여부', 'AI_분석_근거', '검색키워드', '크롤링_성공', '분석방법'
+}
+
+REPORT_TITLES = {
+    'daily_trend': '일별 키워드/플랫폼 추이',
+    'verdicts': '플랫폼별 판정 분포',
+    'score_histogram': '위험 점수 분포',
+    'top_sources': '위험 게시글 상위 출처'
+}
+
+
+def source_of(url):
+    """게시글 URL의 출처 (디시인사이드 갤러리, 블로그 ID, 트위터 계정, 그 외 호스트)"""
+    if not url:
+        return ''
+    parts = urllib.parse.urlsplit(url)
+    host = parts.netloc
+    segments = [segment for segment in parts.path.split('/') if segment]
+
+    if host.endswith('dcinside.com'):
+        gallery = urllib.parse.parse_qs(parts.query).get('id')
+        if gallery:
+            return f"dcinside:{gallery[0]}"
+    elif host.endswith('blog.naver.com') and segments:
+        return f"naver:{segments[0]}"
+    elif host.endswith(('twitter.com', 'x.com')) and segments:
+        return f"twitter:{segments[0]}"
+    return host
+
+
+class ReportGenerator:
+    """결과 저장소 집계 쿼리 기반 추이/판정 리포트
+
+    기간/키워드/플랫폼 필터와 집계는 모두 SQLite에서 수행하고 집계된 행만
+    가져오므로, 기간이 길어도 게시글 전체를 메모리에 올리지 않는다.
+    """
+
+    def __init__(self, result_store):
+        self.store = result_store
+        self.conn = result_store.conn
+        self.conn.create_function('source_of', 1, source_of)
+
+    def build(self, since=None, until=None, keyword=None, platform=None, top_n=20):
+        """리포트 표 생성 - {이름: DataFrame}
+
+        추이/판정/점수 분포는 (날짜, 키워드, 플랫폼, 판정, 분석방법, 점수구간)
+        단위로 한 번만 집계한 뒤 그 작은 표에서 나눠 만든다.
+        """
+        where, params = self._filters(since, until, keyword, platform)
+
+        cube = self._query(
+            "SELECT substr(a.analyzed_at, 1, 10) AS 날짜, p.keyword AS 키워드, p.platform AS 플랫폼, "
+            "a.is_risky AS 판정, COALESCE(a.method, '') AS 분석방법, "
+            "MIN(CAST(a.risk_score * 10 AS INTEGER), 9) / 10.0 AS 점수구간, "
+            "COUNT(*) AS 건수, SUM(a.risk_score) AS 점수합",
+            where, params, "GROUP BY 1, 2, 3, 4, 5, 6"
+        )
+        cube['위험'] = cube['건수'].where(cube['판정'] == 'Y', 0)
+
+        daily_trend = cube.groupby(['날짜', '키워드', '플랫폼'], as_index=False)[['건수', '위험', '점수합']].sum()
+        daily_trend = daily_trend.rename(columns={'건수': '전체'})
+        daily_trend['평균점수'] = (daily_trend['점수합'] / daily_trend['전체']).round(3)
+        daily_trend['위험비율'] = (daily_trend['위험'] / daily_trend['전체']).round(3)
+        daily_trend = daily_trend.drop(columns='점수합')
+
+        verdicts = (
+            cube.groupby(['플랫폼', '판정', '분석방법'], as_index=False)['건수'].sum()
+            .sort_values(['플랫폼', '판정', '건수'], ascending=[True, True, False])
+        )
+        score_histogram = cube.groupby('점수구간', as_index=False)['건수'].sum()
+
+        risky_where = where + (" AND " if where else " WHERE ") + "a.is_risky = 'Y'"
+        top_sources = self._query(
+            "SELECT source_of(p.url) AS 출처, p.platform AS 플랫폼, COUNT(*) AS 위험게시글, "
+            "ROUND(MAX(a.risk_score), 3) AS 최고점수, MAX(a.analyzed_at) AS 최근분석",
+            risky_where, params + [int(top_n)],
+            "GROUP BY 출처, 플랫폼 ORDER BY 위험게시글 DESC, 최고점수 DESC LIMIT ?"
+        )
+
+        return {
+            'daily_trend': daily_trend,
+            'verdicts': verdicts,
+            'score_histogram': score_histogram,
+            'top_sources': top_sources
+        }
+
+    def _filters(self, since=None, until=None, keyword=None, platform=None):
+        """WHERE 절과 파라미터 생성"""
+        clauses = []
+        params = []
+        if since:
+            clauses.append("a.analyzed_at >= ?")
+            params.append(self.store._format_time(since))
+        if until:
+            clauses.append("a.analyzed_at < ?")
+            params.append(self.store._format_time(until))
+        if keyword:
+            clauses.append("p.keyword = ?")
+            params.append(keyword)
+        if platform:
+            clauses.append("p.platform = ?")
+            params.append(platform)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, params
+
+    def _query(self, select, where, params, tail):
+        """분석 결과/게시글 조인 집계 쿼리 실행"""
+        query = f"{select} FROM analyses a JOIN posts p ON p.url = a.url{where} {tail}"
+        return pd.read_sql_query(query, self.conn, params=params)
+
+    def write_csv(self, report, output_dir, prefix):
+        """표별 CSV 파일 저장 - 저장한 파일 경로 목록 반환"""
+        paths = []
+        for name, frame in report.items():
+            path = os.path.join(output_dir, f"{prefix}_{name}.csv")
+            frame.to_csv(path, index=False, encoding='utf-8-sig')
+            paths.append(path)
+        return paths
+
+    def write_html(self, report, path, description=''):
+        """모든 표를 하나의 HTML 파일로 저장"""
+        sections = []
+        for name, frame in report.items():
+            table = frame.to_html(index=False, border=0, classes='report') if not frame.empty else "<p>데이터 없음</p>"
+            sections.append(f"<h2>{html.escape(REPORT_TITLES.get(name, name))}</h2>\n{table}")
+
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        document = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>자살유발정보 모니터링 리포트</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table.report {{ border-collapse: collapse; margin-bottom: 2em; }}
+table.report th, table.report td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+table.report th {{ background: #f0f0f0; }}
+</style>
+</head>
+<body>
+<h1>자살유발정보 모니터링 리포트</h1>
+<p>{html.escape(description)} (생성: {generated_at})</p>
+{chr(10).join(sections)}
+</body>
+</html>
+"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(document)
+        return path
+
+
+def import_csv_results(result_store, paths, chunksize=50000):
+    """과거 결과 CSV를 결과 저장소로 가져오기 - 필요한 컬럼만 청크 단위로 읽음
+
+    이미 저장소에 있는 게시글은 덮어쓰지 않는다. 가져온 행 수 반환.
+    """
+    imported = 0
+    for path in paths:
+        reader = pd.read_csv(
+            path, encoding='utf-8-sig', usecols=lambda column: column in CSV_COLUMNS,
+            dtype=str, keep_default_na=False, chunksize=chunksize
+        )
+        for chunk in reader:
+            results = [_row_to_result(row) for row in chunk.to_dict('records')]
+            imported += result_store.import_results([result for result in results if result is not None])
+        print(f"- {path}: 누적 {imported}건 가져옴")
+    return imported
+
+
+def _row_to_result(row):
+    """CSV 행을 MonitoringResult로 변환 - URL이나 수집일시가 없으면 None"""
+    if not row.get('게시글_URL') or not row.get('수집일시'):
+        return None
+    try:
+        collected_at = datetime.strptime(row['수집일시'], "%Y-%m-%d %H:%M:%S")
+        score = float(row.get('AI_분석_점수') or 0.0)
+    except ValueError:
+        return None
+
+    post = PostData(
+        platform=row.get('플랫폼', ''),
+        url=row['게시글_URL'],
+        title=row.get('게시글_제목', ''),
+        content='',
+        keyword=row.get('검색키워드', ''),
+        created_at=row.get('작성일시') or None,
+        crawl_success=row.get('크롤링_성공', 'True') == 'True'
+    )
+    analysis = AnalysisResult(score, row.get('자살유발정보_여부', 'N'), row.get('AI_분석_근거', ''),
+                              row.get('분석방법', ''))
+    return MonitoringResult(post, analysis, collected_at)
@@ -0,0 +1,797 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 기반 결과 저장소
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from datetime import datetime
+
+
+# URL 정규화 시 제거할 쿼리 파라미터
+NOISE_QUERY_PARAMS = {'page', 'exception_mode', 'search_head', 'search_pos', 's_type', 's_keyword'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    keywords TEXT,
+    platforms TEXT,
+    result_file TEXT,
+    total INTEGER DEFAULT 0,
+    risky INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    url TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    title TEXT,
+    content TEXT,
+    keyword TEXT,
+    created_at TEXT,
+    crawl_success INTEGER,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    url TEXT PRIMARY KEY REFERENCES posts(url),
+    run_id INTEGER REFERENCES runs(run_id),
+    risk_score REAL,
+    is_risky TEXT,
+    reason TEXT,
+    method TEXT,
+    analyzed_at TEXT NOT NULL,
+    ever_flagged INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS hourly_rollups (
+    hour TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    total INTEGER DEFAULT 0,
+    risky INTEGER DEFAULT 0,
+    success INTEGER DEFAULT 0,
+    PRIMARY KEY (hour, platform, keyword)
+);
+
+CREATE TABLE IF NOT EXISTS gallery_cursors (
+    gallery TEXT PRIMARY KEY,
+    last_no INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pair_costs (
+    keyword TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    posts REAL DEFAULT 0,
+    requests REAL DEFAULT 0,
+    seconds REAL DEFAULT 0,
+    analyzed REAL DEFAULT 0,
+    tokens REAL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (keyword, platform)
+);
+
+CREATE TABLE IF NOT EXISTS watch_accounts (
+    platform TEXT NOT NULL,
+    account TEXT NOT NULL,
+    link TEXT,
+    score REAL NOT NULL,
+    scored_at TEXT NOT NULL,
+    hits INTEGER DEFAULT 0,
+    last_flagged_url TEXT,
+    cursor TEXT,
+    last_polled TEXT,
+    polls INTEGER DEFAULT 0,
+    PRIMARY KEY (platform, account)
+);
+
+CREATE TABLE IF NOT EXISTS watch_flags (
+    url TEXT PRIMARY KEY,  -- 계정 점수에 이미 반영한 위험 게시글 (다시 수집돼도 한 번만 반영)
+    platform TEXT NOT NULL,
+    account TEXT NOT NULL,
+    flagged_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS alert_outbox (
+    url TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending/sending/sent/failed
+    owner TEXT,  -- 발송 중인 발송기
+    lease_until REAL,  -- 발송 중 상태가 유효한 시각 (지나면 다른 발송기가 다시 가져감)
+    deliveries INTEGER DEFAULT 0,
+    last_error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS lexicon_terms (
+    kind TEXT NOT NULL,
+    term TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (kind, term)
+);
+
+CREATE INDEX IF NOT EXISTS idx_posts_platform ON posts(platform);
+CREATE INDEX IF NOT EXISTS idx_posts_keyword ON posts(keyword);
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_verdict ON analyses(is_risky, analyzed_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_analyzed_at ON analyses(analyzed_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_run ON analyses(run_id);
+CREATE INDEX IF NOT EXISTS idx_analyses_report ON analyses(analyzed_at, is_risky, risk_score, method, url);
+"""
+
+POST_UPSERT = """
+INSERT INTO posts (url, platform, title, content, keyword, created_at, crawl_success, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    platform = excluded.platform,
+    title = excluded.title,
+    content = excluded.content,
+    keyword = excluded.keyword,
+    created_at = COALESCE(excluded.created_at, posts.created_at),
+    crawl_success = excluded.crawl_success,
+    last_seen = excluded.last_seen
+"""
+
+ANALYSIS_UPSERT = """
+INSERT INTO analyses (url, run_id, risk_score, is_risky, reason, method, analyzed_at, ever_flagged)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    run_id = excluded.run_id,
+    risk_score = excluded.risk_score,
+    is_risky = excluded.is_risky,
+    reason = excluded.reason,
+    method = excluded.method,
+    analyzed_at = excluded.analyzed_at,
+    ever_flagged = MAX(analyses.ever_flagged, excluded.ever_flagged)
+"""
+
+POST_IMPORT = """
+INSERT OR IGNORE INTO posts (url, platform, title, content, keyword, created_at, crawl_success, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+ANALYSIS_IMPORT = """
+INSERT OR IGNORE INTO analyses (url, run_id, risk_score, is_risky, reason, method, analyzed_at, ever_flagged)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 게시글 제목/본문 전문 검색 인덱스 - trigram 토크나이저는 형태소 분석 없이 3글자 단위로
+# 색인하므로 띄어쓰기/조사와 관계없이 한국어 부분 문자열을 찾을 수 있다.
+# posts 테이블을 원본으로 쓰는 외부 콘텐츠 테이블이며 트리거로 증분 갱신한다.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE posts_fts USING fts5(title, content, content='posts', tokenize='trigram');
+
+CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN
+    INSERT INTO posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+
+CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN
+    INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+END;
+
+CREATE TRIGGER posts_fts_update AFTER UPDATE OF title, content ON posts
+WHEN old.title IS NOT new.title OR old.content IS NOT new.content BEGIN
+    INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+
+INSERT INTO posts_fts (posts_fts) VALUES ('rebuild');
+"""
+
+TRIGRAM_MIN_LENGTH = 3  # 이보다 짧은 검색어는 색인을 쓸 수 없어 LIKE로 찾음
+
+PAIR_COST_UPSERT = """
+INSERT INTO pair_costs (keyword, platform, posts, requests, seconds, updated_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(keyword, platform) DO UPDATE SET
+    posts = pair_costs.posts * ? + excluded.posts,
+    requests = pair_costs.requests * ? + excluded.requests,
+    seconds = pair_costs.seconds * ? + excluded.seconds,
+    updated_at = excluded.updated_at
+"""
+
+PAIR_TOKENS_UPSERT = """
+INSERT INTO pair_costs (keyword, platform, analyzed, tokens, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(keyword, platform) DO UPDATE SET
+    analyzed = pair_costs.analyzed * ? + excluded.analyzed,
+    tokens = pair_costs.tokens * ? + excluded.tokens,
+    updated_at = excluded.updated_at
+"""
+
+ROLLUP_UPSERT = """
+INSERT INTO hourly_rollups (hour, platform, keyword, total, risky, success)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(hour, platform, keyword) DO UPDATE SET
+    total = hourly_rollups.total + excluded.total,
+    risky = hourly_rollups.risky + excluded.risky,
+    success = hourly_rollups.success + excluded.success
+"""
+
+RESULT_COLUMNS = """
+SELECT p.url, p.platform, p.title, p.content, p.keyword, p.created_at, p.crawl_success,
+       a.risk_score, a.is_risky, a.reason, a.method, a.analyzed_at, a.run_id, a.ever_flagged
+FROM posts p JOIN analyses a ON a.url = p.url
+"""
+
+
+def canonicalize_url(url):
+    """URL 정규화 - 중복 저장 방지용 키 생성"""
+    if not url:
+        return ""
+
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = (parts.scheme or 'https').lower()
+    if scheme == 'http':
+        scheme = 'https'
+    netloc = parts.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+
+    query = [
+        (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key not in NOISE_QUERY_PARAMS and not key.startswith('utm_')
+    ]
+    query.sort()
+
+    path = parts.path.rstrip('/') or '/'
+    return urllib.parse.urlunsplit((scheme, netloc, path, urllib.parse.urlencode(query), ''))
+
+
+class ResultStore:
+    """게시글/분석결과/실행이력 저장소"""
+
+    def __init__(self, db_path, batch_size=500):
+        """저장소 초기화"""
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # 여러 워커 프로세스가 동시에 쓰는 경우를 위해 잠금 대기 시간 설정
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._normalize_post_dates()
+        self.search_enabled = self._init_search_index()
+
+    def _normalize_post_dates(self):
+        """이전 버전이 그대로 저장한 네이버 postdate('YYYYMMDD')를 'YYYY-MM-DD 00:00:00'으로 변환"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE posts SET created_at = substr(created_at, 1, 4) || '-' || substr(created_at, 5, 2) || '-' "
+                "|| substr(created_at, 7, 2) || ' 00:00:00' "
+                "WHERE length(created_at) = 8 AND created_at GLOB '[12][0-9][0-9][0-9][01][0-9][0-3][0-9]'"
+            )
+
+    def _init_search_index(self):
+        """전문 검색 인덱스 생성 (처음 한 번 기존 게시글 색인) - FTS5/trigram 미지원이면 False"""
+        if self._has_search_index():
+            return True
+        try:
+            with self._lock:
+                self.conn.executescript("BEGIN IMMEDIATE;" + SEARCH_SCHEMA + "COMMIT;")
+            return True
+        except sqlite3.OperationalError as e:
+            self.conn.rollback()
+            # 다른 워커 프로세스가 먼저 만든 경우
+            if self._has_search_index():
+                return True
+            print(f"전문 검색 인덱스를 만들 수 없어 LIKE 검색을 사용합니다: {e}")
+            return False
+
+    def _has_search_index(self):
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+        ).fetchone() is not None
+
+    def start_run(self, keywords=None, platforms=None):
+        """실행 이력 생성"""
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, keywords, platforms) VALUES (?, ?, ?)",
+                (self._now(), ','.join(keywords or []), ','.join(platforms or []))
+            )
+            return cursor.lastrowid
+
+    def finish_run(self, run_id, result_file=None, total=0, risky=0):
+        """실행 이력 종료 기록"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE runs SET finished_at = ?, result_file = ?, total = ?, risky = ? WHERE run_id = ?",
+                (self._now(), result_file, total, risky, run_id)
+            )
+
+    def upsert_results(self, results, run_id=None):
+        """분석 결과 일괄 저장 (정규화 URL 기준 upsert)"""
+        saved = 0
+        for start in range(0, len(results), self.batch_size):
+            batch = results[start:start + self.batch_size]
+            post_rows = []
+            analysis_rows = []
+
+            for result in batch:
+                post_row, analysis_row = self._to_rows(result, run_id)
+                post_rows.append(post_row)
+                analysis_rows.append(analysis_row)
+
+            with self._lock, self.conn:
+                self.conn.executemany(POST_UPSERT, post_rows)
+                self.conn.executemany(ANALYSIS_UPSERT, analysis_rows)
+            saved += len(batch)
+
+        return saved
+
+    def import_results(self, results):
+        """과거 결과 가져오기 - 이미 저장된 게시글/분석은 유지"""
+        rows = [self._to_rows(result, None) for result in results]
+        with self._lock, self.conn:
+            self.conn.executemany(POST_IMPORT, [post_row for post_row, _ in rows])
+            cursor = self.conn.executemany(ANALYSIS_IMPORT, [analysis_row for _, analysis_row in rows])
+        return cursor.rowcount
+
+    def upsert_reanalysis(self, results, run_id=None):
+        """재분석 결과 저장 - 분석 결과만 갱신하고 저장된 게시글 본문은 유지
+
+        저장소에 없던 게시글은 본문 없이 추가한다.
+        """
+        rows = [self._to_rows(result, run_id) for result in results]
+        with self._lock, self.conn:
+            self.conn.executemany(POST_IMPORT, [post_row for post_row, _ in rows])
+            self.conn.executemany(ANALYSIS_UPSERT, [analysis_row for _, analysis_row in rows])
+        return len(rows)
+
+    def get_verdicts(self, urls):
+        """URL 목록의 현재 판정 - {정규화 URL: 'Y'/'N'}"""
+        urls = [canonicalize_url(url) for url in urls]
+        verdicts = {}
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT url, is_risky FROM analyses WHERE url IN ({','.join('?' * len(chunk))})", chunk
+            )
+            verdicts.update((row['url'], row['is_risky']) for row in rows)
+        return verdicts
+
+    def _to_rows(self, result, run_id):
+        """결과 레코드를 테이블 행으로 변환"""
+        post = result.post_data
+        analysis = result.analysis_result
+        url = canonicalize_url(post.url)
+        analyzed_at = self._format_time(result.collected_at) or self._now()
+
+        post_row = (
+            url,
+            post.platform,
+            post.title,
+            post.content,
+            post.keyword,
+            self._format_time(post.created_at),
+            int(bool(post.crawl_success)),
+            analyzed_at,
+            analyzed_at
+        )
+        analysis_row = (
+            url,
+            run_id,
+            analysis.risk_score,
+            analysis.is_risky,
+            analysis.reason,
+            analysis.method,
+            analyzed_at,
+            int(analysis.is_risky == 'Y')
+        )
+        return post_row, analysis_row
+
+    def was_flagged(self, url):
+        """해당 URL이 과거에 위험 판정을 받은 적이 있는지 확인"""
+        row = self.conn.execute(
+            "SELECT ever_flagged FROM analyses WHERE url = ?", (canonicalize_url(url),)
+        ).fetchone()
+        return bool(row and row['ever_flagged'])
+
+    def get_result(self, url):
+        """URL의 최신 분석 결과 조회"""
+        row = self.conn.execute(RESULT_COLUMNS + " WHERE p.url = ?", (canonicalize_url(url),)).fetchone()
+        return dict(row) if row else None
+
+    def find_results(self, keyword=None, platform=None, verdict=None, since=None, until=None, limit=None):
+        """조건별 분석 결과 조회"""
+        clauses = []
+        params = []
+
+        if keyword:
+            clauses.append("p.keyword = ?")
+            params.append(keyword)
+        if platform:
+            clauses.append("p.platform = ?")
+            params.append(platform)
+        if verdict:
+            clauses.append("a.is_risky = ?")
+            params.append(verdict)
+        if since:
+            clauses.append("a.analyzed_at >= ?")
+            params.append(self._format_time(since))
+        if until:
+            clauses.append("a.analyzed_at < ?")
+            params.append(self._format_time(until))
+
+        query = RESULT_COLUMNS
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY a.analyzed_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def count_by_platform(self, verdict=None, since=None):
+        """플랫폼별 결과 건수 조회"""
+        clauses = []
+        params = []
+        if verdict:
+            clauses.append("a.is_risky = ?")
+            params.append(verdict)
+        if since:
+            clauses.append("a.analyzed_at >= ?")
+            params.append(self._format_time(since))
+
+        query = "SELECT p.platform, COUNT(*) AS cnt FROM posts p JOIN analyses a ON a.url = p.url"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " GROUP BY p.platform"
+
+        return {row['platform']: row['cnt'] for row in self.conn.execute(query, params)}
+
+    def pair_yields(self, since=None):
+        """(키워드, 플랫폼)별 분석 건수와 위험 판정 건수 - {(키워드, 플랫폼): (전체, 위험)}"""
+        query = ("SELECT p.keyword, p.platform, COUNT(*) AS total, SUM(a.is_risky = 'Y') AS risky "
+                 "FROM posts p JOIN analyses a ON a.url = p.url")
+        params = []
+        if since:
+            query += " WHERE a.analyzed_at >= ?"
+            params.append(self._format_time(since))
+        query += " GROUP BY p.keyword, p.platform"
+        return {(row['keyword'], row['platform']): (row['total'], row['risky'] or 0)
+                for row in self.conn.execute(query, params)}
+
+    def record_pair_cost(self, keyword, platform, posts, requests, seconds, decay=1.0):
+        """(키워드, 플랫폼) 수집 비용 누적 - 기존 값에 decay를 곱한 뒤 더함"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                PAIR_COST_UPSERT, (keyword, platform, posts, requests, seconds, self._now(), decay, decay, decay)
+            )
+
+    def record_pair_tokens(self, keyword, platform, analyzed, tokens, decay=1.0):
+        """(키워드, 플랫폼) LLM 분석 건수/토큰 누적 - 기존 값에 decay를 곱한 뒤 더함"""
+        with self._lock, self.conn:
+            self.conn.execute(PAIR_TOKENS_UPSERT, (keyword, platform, analyzed, tokens, self._now(), decay, decay))
+
+    def get_pair_costs(self):
+        """(키워드, 플랫폼)별 누적 비용 - {(키워드, 플랫폼): {posts, requests, seconds, analyzed, tokens}}"""
+        rows = self.conn.execute(
+            "SELECT keyword, platform, posts, requests, seconds, analyzed, tokens FROM pair_costs"
+        )
+        return {
+            (row['keyword'], row['platform']): {
+                'posts': row['posts'], 'requests': row['requests'], 'seconds': row['seconds'],
+                'analyzed': row['analyzed'], 'tokens': row['tokens']
+            }
+            for row in rows
+        }
+
+    def search_posts(self, query, since=None, until=None, platform=None, keyword=None, verdict=None, limit=100):
+        """제목/본문에 query가 포함된 게시글의 분석 결과 (게시일 최신순)
+
+        기간은 게시일(없으면 처음 수집한 시각) 기준이다.
+        """
+        clause, params = self._term_clause([query])
+        clauses = [clause]
+        if since:
+            clauses.append("COALESCE(p.created_at, p.first_seen) >= ?")
+            params.append(self._format_time(since))
+        if until:
+            clauses.append("COALESCE(p.created_at, p.first_seen) < ?")
+            params.append(self._format_time(until))
+        if platform:
+            clauses.append("p.platform = ?")
+            params.append(platform)
+        if keyword:
+            clauses.append("p.keyword = ?")
+            params.append(keyword)
+        if verdict:
+            clauses.append("a.is_risky = ?")
+            params.append(verdict)
+
+        sql = RESULT_COLUMNS + " WHERE " + " AND ".join(clauses) + " ORDER BY COALESCE(p.created_at, p.first_seen) DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def iter_term_matches(self, terms, method_prefix=None, batch_size=500):
+        """terms 중 하나라도 제목/본문에 포함된 게시글을 묶음 단위로 반환
+
+        method_prefix를 주면 분석 방법이 그 값으로 시작하는 결과만 대상으로 한다.
+        """
+        clause, params = self._term_clause(terms)
+        sql = ("SELECT p.url, p.title, p.content, a.risk_score, a.is_risky, a.reason "
+               "FROM posts p JOIN analyses a ON a.url = p.url WHERE " + clause)
+        if method_prefix:
+            sql += " AND a.method LIKE ? ESCAPE '\\'"
+            params.append(_like_escape(method_prefix) + '%')
+
+        cursor = self.conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [dict(row) for row in rows]
+
+    def _term_clause(self, terms):
+        """검색어 목록의 OR 조건 - 3글자 이상은 trigram 인덱스, 짧은 검색어는 LIKE"""
+        terms = [term for term in dict.fromkeys(terms) if term]
+        indexed = [term for term in terms if self.search_enabled and len(term) >= TRIGRAM_MIN_LENGTH]
+        scanned = [term for term in terms if term not in indexed]
+
+        clauses = []
+        params = []
+        if indexed:
+            clauses.append("p.rowid IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)")
+            params.append(" OR ".join('"' + term.replace('"', '""') + '"' for term in indexed))
+        for term in scanned:
+            clauses.append("(p.title LIKE ? ESCAPE '\\' OR p.content LIKE ? ESCAPE '\\')")
+            pattern = '%' + _like_escape(term) + '%'
+            params.extend([pattern, pattern])
+
+        return "(" + (" OR ".join(clauses) or "0") + ")", params
+
+    def update_verdicts(self, rows):
+        """분석 결과를 제자리에서 갱신 - (위험 점수, 판정, 근거, 위험 여부 0/1, URL) 목록
+
+        분석 방법과 분석 시각은 그대로 두므로 기간별 리포트의 위치가 바뀌지 않는다.
+        """
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "UPDATE analyses SET risk_score = ?, is_risky = ?, reason = ?, "
+                "ever_flagged = MAX(ever_flagged, ?) WHERE url = ?",
+                rows
+            )
+
+    def get_lexicon(self):
+        """마지막으로 재채점에 쓴 키워드 사전 - {종류: 용어 집합}, 기록이 없으면 None"""
+        rows = self.conn.execute("SELECT kind, term FROM lexicon_terms").fetchall()
+        if not rows:
+            return None
+        lexicon = {}
+        for row in rows:
+            lexicon.setdefault(row['kind'], set()).add(row['term'])
+        return lexicon
+
+    def save_lexicon(self, lexicon):
+        """키워드 사전 기록 ({종류: 용어 목록})"""
+        now = self._now()
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM lexicon_terms")
+            self.conn.executemany(
+                "INSERT INTO lexicon_terms (kind, term, updated_at) VALUES (?, ?, ?)",
+                [(kind, term, now) for kind, terms in lexicon.items() for term in set(terms)]
+            )
+
+    def get_watch_accounts(self):
+        """감시 계정 목록 (dict)"""
+        return [dict(row) for row in self.conn.execute("SELECT * FROM watch_accounts")]
+
+    def add_watch_flags(self, flags, decay):
+        """위험 게시글을 작성 계정 점수에 반영 - (URL, 플랫폼, 계정, 링크, 위험 점수) 목록
+
+        이미 반영한 URL은 건너뛰고, 기존 점수는 decay(점수, 점수 시각)로 줄인
+        뒤 더한다. 읽기와 쓰기를 한 트랜잭션에서 하므로 여러 프로세스가 같은
+        계정을 동시에 갱신해도 점수가 유실되지 않는다. 새로 반영한 건수 반환
+        """
+        now = self._now()
+        added = 0
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for url, platform, account, link, score in flags:
+                    inserted = self.conn.execute(
+                        "INSERT OR IGNORE INTO watch_flags (url, platform, account, flagged_at) VALUES (?, ?, ?, ?)",
+                        (canonicalize_url(url), platform, account, now)
+                    )
+                    if inserted.rowcount == 0:
+                        continue
+                    row = self.conn.execute(
+                        "SELECT score, scored_at FROM watch_accounts WHERE platform = ? AND account = ?",
+                        (platform, account)
+                    ).fetchone()
+                    if row is not None:
+                        score += decay(row['score'], row['scored_at'])
+                    self.conn.execute(
+                        "INSERT INTO watch_accounts (platform, account, link, score, scored_at, hits, last_flagged_url) "
+                        "VALUES (?, ?, ?, ?, ?, 1, ?) "
+                        "ON CONFLICT(platform, account) DO UPDATE SET "
+                        "link = COALESCE(NULLIF(excluded.link, ''), watch_accounts.link), "
+                        "score = excluded.score, scored_at = excluded.scored_at, "
+                        "hits = watch_accounts.hits + 1, last_flagged_url = excluded.last_flagged_url",
+                        (platform, account, link, score, now, url)
+                    )
+                    added += 1
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return added
+
+    def set_watch_cursor(self, platform, account, cursor):
+        """감시 계정 폴링 기록 - cursor가 None이면 기존 값 유지"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE watch_accounts SET cursor = COALESCE(?, cursor), last_polled = ?, polls = polls + 1 "
+                "WHERE platform = ? AND account = ?",
+                (cursor, self._now(), platform, account)
+            )
+
+    def add_rollups(self, rows):
+        """시간별 집계 증분 반영 (hour, platform, keyword, total, risky, success)"""
+        with self._lock, self.conn:
+            self.conn.executemany(ROLLUP_UPSERT, rows)
+
+    def get_rollups(self, platform=None, keyword='*', since=None, until=None):
+        """시간별 집계 조회 - keyword='*'는 플랫폼 전체 합계"""
+        clauses = ["keyword = ?"]
+        params = [keyword]
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if since:
+            clauses.append("hour >= ?")
+            params.append(self._format_time(since))
+        if until:
+            clauses.append("hour < ?")
+            params.append(self._format_time(until))
+
+        query = "SELECT * FROM hourly_rollups WHERE " + " AND ".join(clauses) + " ORDER BY hour"
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def add_alert(self, url, alert, owner, lease_seconds=300):
+        """발송할 알림을 owner가 발송 중인 상태로 기록 - 같은 URL의 알림이 이미 있으면 False"""
+        now = self._now()
+        with self._lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO alert_outbox (url, payload, status, owner, lease_until, created_at, updated_at) "
+                "VALUES (?, ?, 'sending', ?, ?, ?, ?)",
+                (canonicalize_url(url), json.dumps(alert, ensure_ascii=False), owner, time.time() + lease_seconds,
+                 now, now)
+            )
+        return cursor.rowcount > 0
+
+    def claim_pending_alerts(self, owner, lease_seconds=300):
+        """발송하지 못한 알림과 임대가 만료된 발송 중 알림을 owner 몫으로 가져옴 (오래된 순)
+
+        한 트랜잭션에서 상태를 바꾸므로 여러 프로세스가 동시에 호출해도 같은
+        알림을 두 곳에서 가져가지 않는다.
+        """
+        now = time.time()
+        lease_until = now + lease_seconds
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute(
+                    "UPDATE alert_outbox SET status = 'sending', owner = ?, lease_until = ?, updated_at = ? "
+                    "WHERE status = 'pending' OR (status = 'sending' AND lease_until < ?)",
+                    (owner, lease_until, self._now(), now)
+                )
+                rows = self.conn.execute(
+                    "SELECT payload FROM alert_outbox WHERE status = 'sending' AND owner = ? AND lease_until = ? "
+                    "ORDER BY created_at",
+                    (owner, lease_until)
+                ).fetchall()
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return [json.loads(row['payload']) for row in rows]
+
+    def mark_alerts(self, urls, delivered, error=None, max_deliveries=10):
+        """알림 발송 결과 기록 - 실패가 max_deliveries번 쌓이면 'failed'로 남기고 더 보내지 않음"""
+        now = self._now()
+        rows = [(now, error, canonicalize_url(url)) for url in urls]
+        with self._lock, self.conn:
+            if delivered:
+                self.conn.executemany(
+                    "UPDATE alert_outbox SET status = 'sent', owner = NULL, lease_until = NULL, "
+                    "deliveries = deliveries + 1, updated_at = ?, last_error = ? WHERE url = ?", rows
+                )
+            else:
+                self.conn.executemany(
+                    "UPDATE alert_outbox SET owner = NULL, lease_until = NULL, "
+                    "deliveries = deliveries + 1, updated_at = ?, last_error = ?, "
+                    f"status = CASE WHEN deliveries + 1 >= {int(max_deliveries)} THEN 'failed' ELSE 'pending' END "
+                    "WHERE url = ?", rows
+                )
+
+    def get_gallery_cursor(self, gallery):
+        """갤러리 감시 모드에서 마지막으로 처리한 게시글 번호 - 없으면 None"""
+        row = self.conn.execute(
+            "SELECT last_no FROM gallery_cursors WHERE gallery = ?", (gallery,)
+        ).fetchone()
+        return row['last_no'] if row else None
+
+    def set_gallery_cursor(self, gallery, last_no):
+        """갤러리 마지막 처리 게시글 번호 저장"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO gallery_cursors (gallery, last_no, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(gallery) DO UPDATE SET last_no = MAX(gallery_cursors.last_no, excluded.last_no), "
+                "updated_at = excluded.updated_at",
+                (gallery, last_no, self._now())
+            )
+
+    def recent_runs(self, limit=10):
+        """최근 실행 이력 조회"""
+        rows = self.conn.execute("SELECT * FROM runs ORDER BY run_id DESC LIMIT ?", (limit,))
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def _now(self):
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def _format_time(self, value):
+        """시간 값을 저장용 문자열('YYYY-MM-DD HH:MM:SS')로 변환
+
+        datetime이 아닌 값(네이버 postdate 'YYYYMMDD', isoformat 문자열 등)도
+        같은 형식으로 맞춰 문자열 비교로 기간을 거를 수 있게 한다. 해석할 수
+        없는 값은 그대로 저장한다.
+        """
+        if value is None or value == '':
+            return None
+        if not isinstance(value, datetime):
+            value = _parse_time(str(value).strip())
+            if isinstance(value, str):
+                return value
+        if value.tzinfo is not None:
+            value = value.astimezone().replace(tzinfo=None)
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+TIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y%m%d", "%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y.%m.%d %H:%M:%S", "%Y.%m.%d %H:%M",
+                "%Y.%m.%d")
+
+
+def _parse_time(text):
+    """알려진 형식의 시간 문자열을 datetime으로 - 해석할 수 없으면 원래 문자열"""
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        return text
+
+
+def _like_escape(text):
+    """LIKE 패턴 특수 문자 이스케이프 (ESCAPE '\\')"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
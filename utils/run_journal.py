@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 저널 - 중단된 실행의 체크포인트/재개 지원
+"""
+
+import json
+import os
+from datetime import datetime
+from models.data_models import AnalysisResult, MonitoringResult, post_to_dict, post_from_dict
+
+
+class RunJournal:
+    """수집 페이지와 분석 완료 게시글을 기록하는 추가 전용(append-only) 저널
+
+    각 항목은 JSON 한 줄로 기록되고 즉시 fsync되므로 프로세스가 중간에
+    종료되더라도 마지막으로 완료된 페이지/분석까지는 보존된다.
+    """
+
+    def __init__(self, path):
+        """저널 초기화"""
+        self.path = path
+        self.run_info = None
+        self.pages = {}  # (keyword, platform, page) -> (items, cursor)
+        self.analyses = {}  # url -> MonitoringResult
+        self.completed = False
+        self._file = None
+
+    @classmethod
+    def start(cls, path, run_info):
+        """새 실행 저널 생성 (기존 저널은 덮어씀)"""
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        journal = cls(path)
+        journal._file = open(path, 'w', encoding='utf-8')
+        journal.run_info = run_info
+        journal._append({'type': 'run', **run_info})
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        """기존 저널 로드 - 없거나 이미 완료된 실행이면 None"""
+        if not os.path.exists(path):
+            return None
+
+        journal = cls(path)
+        valid_size = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete line")
+                    entry = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    # 기록 도중 중단된 마지막 줄 이후는 무시
+                    break
+                journal._apply(entry)
+                valid_size += len(line)
+
+        if journal.run_info is None or journal.completed:
+            return None
+
+        # 손상된 꼬리 부분을 잘라내고 이어서 기록
+        journal._file = open(path, 'a', encoding='utf-8')
+        journal._file.truncate(valid_size)
+        return journal
+
+    def _apply(self, entry):
+        """저널 항목을 메모리 상태에 반영"""
+        entry_type = entry.pop('type', None)
+        if entry_type == 'run':
+            self.run_info = entry
+        elif entry_type == 'page':
+            key = (entry['keyword'], entry['platform'], entry['page'])
+            items = [post_from_dict(item) for item in entry['items']]
+            self.pages[key] = (items, entry.get('cursor'))
+        elif entry_type == 'analysis':
+            post = post_from_dict(entry['post'])
+            self.analyses[post.url] = MonitoringResult(
+                post_data=post,
+                analysis_result=AnalysisResult(
+                    entry['risk_score'], entry['is_risky'], entry['reason'], entry.get('method', '')
+                ),
+                collected_at=datetime.strptime(entry['collected_at'], "%Y-%m-%d %H:%M:%S")
+            )
+        elif entry_type == 'complete':
+            self.completed = True
+
+    def _append(self, entry):
+        """항목 1건을 기록하고 디스크에 동기화"""
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def get_page(self, keyword, platform, page):
+        """완료된 페이지면 (items, cursor) 반환, 아니면 None"""
+        return self.pages.get((keyword, platform, page))
+
+    def record_page(self, keyword, platform, page, items, cursor=None):
+        """수집 완료된 페이지 기록"""
+        self.pages[(keyword, platform, page)] = (items, cursor)
+        self._append({
+            'type': 'page',
+            'keyword': keyword,
+            'platform': platform,
+            'page': page,
+            'cursor': cursor,
+            'items': [post_to_dict(item) for item in items]
+        })
+
+    def get_analysis(self, url):
+        """분석 완료된 게시글이면 결과 반환"""
+        return self.analyses.get(url)
+
+    def record_analysis(self, result):
+        """분석 완료된 게시글 기록"""
+        analysis = result.analysis_result
+        self.analyses[result.post_data.url] = result
+        self._append({
+            'type': 'analysis',
+            'post': post_to_dict(result.post_data),
+            'risk_score': analysis.risk_score,
+            'is_risky': analysis.is_risky,
+            'reason': analysis.reason,
+            'method': analysis.method,
+            'collected_at': result.collected_at.strftime("%Y-%m-%d %H:%M:%S")
+        })
+
+    def mark_complete(self):
+        """결과 저장까지 끝난 실행으로 표시"""
+        self.completed = True
+        self._append({'type': 'complete'})
+        self.close()
+
+    def close(self):
+        """저널 파일 닫기"""
+        if self._file:
+            self._file.close()
+            self._file = None
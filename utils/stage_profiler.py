@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 CPU/메모리 프로파일러 (--profile)
+"""
+
+import cProfile
+import contextlib
+import functools
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+
+_active = None  # 실행 중인 StageProfiler (프로파일링을 켜지 않으면 None)
+_NULL = contextlib.nullcontext()
+_OWN_FILES = (__file__, contextlib.__file__)
+
+
+def profile_stage(name):
+    """name 단계 구간 - 프로파일링이 꺼져 있으면 아무것도 하지 않는 컨텍스트"""
+    if _active is None:
+        return _NULL
+    return _active.stage(name)
+
+
+def profiled(name):
+    """함수 전체를 name 단계로 측정하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profiling_active():
+    """프로파일링 중인지 여부"""
+    return _active is not None
+
+
+def restart_after_fork():
+    """fork된 자식 프로세스에서 부모에게 물려받은 프로파일러를 버리고 새로 시작
+
+    부모의 단계 기록과 tracemalloc 추적 내용이 복사되어 오므로 그대로 두면
+    자식의 측정이 부모 값에 섞이고 결과도 저장되지 않는다. 자식 전용
+    프로파일러를 반환하며(호출한 쪽에서 finish()), 프로파일링 중이 아니거나
+    같은 프로세스에서 호출하면 None.
+    """
+    global _active
+    parent = _active
+    if parent is None or parent._pid == os.getpid():
+        return None
+    _active = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return StageProfiler(
+        parent.output_dir, top=parent.top, trace_frames=parent.trace_frames, label=f"pid{os.getpid()}"
+    ).start()
+
+
+class StageStats:
+    """단계별 호출 수/소요 시간/메모리"""
+
+    __slots__ = ('calls', 'wall', 'cpu', 'allocated', 'peak')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.allocated = 0  # 단계가 끝날 때 남아 있는 할당 증가량 합계
+        self.peak = 0  # 단계 진입 시점 대비 최대 추가 사용량
+
+
+class _Frame:
+    __slots__ = ('name', 'profile', 'peak')
+
+    def __init__(self, name, profile):
+        self.name = name
+        self.profile = profile
+        self.peak = 0
+
+
+class StageProfiler:
+    """실행 단계(수집/파싱/정리/분석/저장)별 cProfile + tracemalloc 측정
+
+    단계마다 cProfile.Profile을 따로 두고, 단계 안에서 다른 단계에 들어가면
+    바깥 단계의 프로파일을 멈췄다가 나올 때 다시 켠다. 따라서 각 단계의
+    프로파일에는 그 단계 고유의 호출만 남고, 소요 시간/메모리 표는 안쪽
+    단계를 포함한 값이다. cProfile은 스레드별로 동작하므로 start()를 호출한
+    스레드의 단계만 측정하고, 다른 스레드(알림 전송 등)의 구간은 건너뛴다.
+    """
+
+    def __init__(self, output_dir, top=15, trace_frames=1, label=None):
+        self.output_dir = output_dir
+        self.top = top
+        self.trace_frames = trace_frames
+        self.label = label  # 저장 디렉토리 이름에 붙임 (워커 프로세스 구분)
+        self.stages = {}
+        self.overall_peak = 0
+        self._profiles = {}
+        self._stack = []
+        self._owner = None
+        self._pid = None
+        self._started = None
+
+    @classmethod
+    def from_config(cls, config):
+        """설정 객체로부터 생성"""
+        return cls(config.profile_dir, top=config.profile_top, trace_frames=config.profile_trace_frames)
+
+    def start(self):
+        """메모리 추적을 시작하고 전역 프로파일러로 등록"""
+        global _active
+        self._owner = threading.get_ident()
+        self._pid = os.getpid()
+        self._started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+        _active = self
+        return self
+
+    def stage(self, name):
+        """name 단계 구간 컨텍스트"""
+        if threading.get_ident() != self._owner or any(frame.name == name for frame in self._stack):
+            return _NULL
+        return self._measure(name)
+
+    @contextlib.contextmanager
+    def _measure(self, name):
+        outer = self._stack[-1] if self._stack else None
+        if outer is not None:
+            outer.profile.disable()
+            outer.peak = max(outer.peak, tracemalloc.get_traced_memory()[1])
+
+        profile = self._profiles.get(name)
+        if profile is None:
+            profile = self._profiles[name] = cProfile.Profile()
+        frame = _Frame(name, profile)
+        self._stack.append(frame)
+
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        wall_before = time.perf_counter()
+        cpu_before = time.thread_time()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            cpu = time.thread_time() - cpu_before
+            wall = time.perf_counter() - wall_before
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame.peak)
+            self._stack.pop()
+
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            stats.allocated += current - memory_before
+            stats.peak = max(stats.peak, peak - memory_before)
+            self.overall_peak = max(self.overall_peak, peak)
+
+            tracemalloc.reset_peak()
+            if outer is not None:
+                outer.peak = max(outer.peak, peak)
+                outer.profile.enable()
+
+    def finish(self):
+        """프로파일 파일/요약 저장 후 출력 - 저장 디렉토리 반환"""
+        global _active
+        _active = None
+        if not self.stages:
+            tracemalloc.stop()
+            return None
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__)
+        ])
+        self.overall_peak = max(self.overall_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        name = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}" + (f"_{self.label}" if self.label else "")
+        directory = os.path.join(self.output_dir, name)
+        os.makedirs(directory, exist_ok=True)
+        for name, profile in self._profiles.items():
+            profile.dump_stats(os.path.join(directory, f"{name.replace(':', '_').replace(' ', '_')}.prof"))
+
+        lines = self.summary_lines(snapshot)
+        with open(os.path.join(directory, "summary.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+        print("\n" + "\n".join(lines))
+        print(f"\n프로파일 저장: {directory} (snakeviz/pstats로 *.prof 확인)")
+        return directory
+
+    def summary_lines(self, snapshot=None):
+        """단계별 표 + 단계별/전체 상위 함수 + 메모리 상위 위치"""
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        lines = [
+            f"단계별 프로파일 (전체 {elapsed:.1f}초, 최대 추적 메모리 {self.overall_peak / 1024 / 1024:.1f}MB)",
+            f"{'단계':<24}{'호출':>8}{'경과(초)':>11}{'CPU(초)':>10}{'순증(KB)':>12}{'최대(KB)':>12}"
+        ]
+        for name, stats in sorted(self.stages.items(), key=lambda item: item[1].wall, reverse=True):
+            lines.append(
+                f"{name:<24}{stats.calls:>8}{stats.wall:>11.2f}{stats.cpu:>10.2f}"
+                f"{stats.allocated / 1024:>12.0f}{stats.peak / 1024:>12.0f}"
+            )
+
+        combined = None
+        for name, profile in self._profiles.items():
+            stats = pstats.Stats(profile)
+            hotspots = self._hotspots(stats, 5)
+            if hotspots:
+                lines.append(f"\n[{name}] 상위 함수 (자체 시간)")
+                lines.extend(hotspots)
+            if combined is None:
+                combined = stats
+            else:
+                combined.add(profile)
+
+        if combined is not None:
+            lines.append(f"\n전체 상위 {self.top}개 함수 (자체 시간)")
+            lines.extend(self._hotspots(combined, self.top))
+
+        if snapshot is not None:
+            lines.append(f"\n종료 시점 메모리 상위 {self.top}개 위치")
+            for statistic in snapshot.statistics('lineno')[:self.top]:
+                frame = statistic.traceback[0]
+                lines.append(f"- {statistic.size / 1024:,.0f}KB ({statistic.count}개) "
+                             f"{_short_path(frame.filename)}:{frame.lineno}")
+        return lines
+
+    def _hotspots(self, stats, limit):
+        """자체 시간(tottime) 기준 상위 함수 줄 목록 (프로파일러 자체 호출 제외)"""
+        entries = sorted(
+            (item for item in stats.stats.items() if item[0][0] not in _OWN_FILES),
+            key=lambda item: item[1][2], reverse=True
+        )
+        lines = []
+        for (filename, lineno, function), (_, calls, tottime, cumtime, _) in entries[:limit]:
+            if tottime <= 0:
+                break
+            location = f" {_short_path(filename)}:{lineno}" if lineno else ""
+            lines.append(f"- {tottime:8.3f}초 (누적 {cumtime:8.3f}초, {calls}회) {function}{location}")
+        return lines
+
+
+def _short_path(filename):
+    """표시용 경로 - 현재 디렉토리 기준 상대 경로, 외부 모듈은 마지막 두 단계만"""
+    if filename.startswith(os.getcwd()):
+        return os.path.relpath(filename)
+    parts = filename.replace('\\', '/').split('/')
+    return '/'.join(parts[-2:])
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실시간 통계 집계 엔진
+"""
+
+from collections import deque
+from datetime import datetime
+
+
+TOTAL, RISKY, SUCCESS = 0, 1, 2
+
+# 플랫폼 전체 집계용 키워드 자리표시자
+ALL_KEYWORDS = '*'
+
+
+def hour_index(dt):
+    """datetime을 시간 단위 정수 인덱스로 변환"""
+    return int(dt.timestamp()) // 3600
+
+
+def hour_label(index):
+    """시간 인덱스를 'YYYY-MM-DD HH:00' 문자열로 변환"""
+    return datetime.fromtimestamp(index * 3600).strftime("%Y-%m-%d %H:00")
+
+
+class SlidingWindow:
+    """시간 버킷 기반 슬라이딩 윈도우 (최근 N시간 합계 유지)"""
+
+    __slots__ = ('window_hours', 'buckets', 'totals')
+
+    def __init__(self, window_hours):
+        self.window_hours = window_hours
+        self.buckets = deque()  # (hour, [total, risky, success])
+        self.totals = [0, 0, 0]
+
+    def add(self, hour, risky, success):
+        """카운터 증가 - 최신 시간 버킷에 누적"""
+        if self.buckets and self.buckets[-1][0] == hour:
+            counts = self.buckets[-1][1]
+        elif not self.buckets or hour > self.buckets[-1][0]:
+            counts = [0, 0, 0]
+            self.buckets.append((hour, counts))
+        else:
+            counts = self._find_bucket(hour)
+            if counts is None:
+                return
+
+        counts[TOTAL] += 1
+        self.totals[TOTAL] += 1
+        if risky:
+            counts[RISKY] += 1
+            self.totals[RISKY] += 1
+        if success:
+            counts[SUCCESS] += 1
+            self.totals[SUCCESS] += 1
+
+        self.advance(self.buckets[-1][0])
+
+    def advance(self, current_hour):
+        """윈도우 밖으로 벗어난 버킷 제거"""
+        while self.buckets and self.buckets[0][0] <= current_hour - self.window_hours:
+            _, counts = self.buckets.popleft()
+            for i in (TOTAL, RISKY, SUCCESS):
+                self.totals[i] -= counts[i]
+
+    def _find_bucket(self, hour):
+        """늦게 도착한 레코드의 버킷 검색 (윈도우 밖이면 None)"""
+        if hour <= self.buckets[-1][0] - self.window_hours:
+            return None
+        for index, (bucket_hour, counts) in enumerate(self.buckets):
+            if bucket_hour == hour:
+                return counts
+            if bucket_hour > hour:
+                counts = [0, 0, 0]
+                self.buckets.insert(index, (hour, counts))
+                return counts
+        return None
+
+
+class StatsAggregator:
+    """플랫폼/키워드/시간별 증분 통계 집계기
+
+    분석 결과가 생성될 때마다 add()로 O(1) 갱신하며, 시간 단위 고정 윈도우
+    (tumbling)와 최근 N시간 슬라이딩 윈도우를 함께 유지한다.
+    """
+
+    def __init__(self, window_hours=24):
+        """집계기 초기화"""
+        self.window_hours = window_hours
+        self.platform_totals = {}
+        self.risky_count = 0
+        self.record_count = 0
+        self.hourly = {}  # (hour, platform, keyword) -> [total, risky, success]
+        self.sliding = {}  # (platform, keyword) -> SlidingWindow
+        self._dirty = {}  # 마지막 flush 이후 증가분
+
+    def add(self, result):
+        """분석 결과 1건 반영"""
+        post = result.post_data
+        risky = result.analysis_result.is_risky == 'Y'
+        success = bool(post.crawl_success)
+        hour = hour_index(result.collected_at)
+
+        totals = self.platform_totals.get(post.platform)
+        if totals is None:
+            totals = self.platform_totals[post.platform] = {'total': 0, 'risky': 0, 'success': 0}
+        totals['total'] += 1
+        self.record_count += 1
+        if risky:
+            totals['risky'] += 1
+            self.risky_count += 1
+        if success:
+            totals['success'] += 1
+
+        for keyword in (post.keyword, ALL_KEYWORDS):
+            key = (hour, post.platform, keyword)
+            self._increment(self.hourly, key, risky, success)
+            self._increment(self._dirty, key, risky, success)
+
+            window = self.sliding.get((post.platform, keyword))
+            if window is None:
+                window = self.sliding[(post.platform, keyword)] = SlidingWindow(self.window_hours)
+            window.add(hour, risky, success)
+
+    def _increment(self, buckets, key, risky, success):
+        counts = buckets.get(key)
+        if counts is None:
+            counts = buckets[key] = [0, 0, 0]
+        counts[TOTAL] += 1
+        if risky:
+            counts[RISKY] += 1
+        if success:
+            counts[SUCCESS] += 1
+
+    def platform_stats(self):
+        """calculate_platform_stats()와 같은 형식의 누적 통계 반환"""
+        return self.platform_totals, self.risky_count
+
+    def window_stats(self, platform, keyword=None, now=None):
+        """최근 window_hours 시간 동안의 집계 반환"""
+        window = self.sliding.get((platform, keyword or ALL_KEYWORDS))
+        if window is None:
+            return {'total': 0, 'risky': 0, 'success': 0}
+
+        window.advance(hour_index(now or datetime.now()))
+        return {
+            'total': window.totals[TOTAL],
+            'risky': window.totals[RISKY],
+            'success': window.totals[SUCCESS]
+        }
+
+    def hourly_series(self, platform, keyword=None):
+        """시간별 집계 목록 반환 (오래된 순)"""
+        keyword = keyword or ALL_KEYWORDS
+        series = [
+            (hour_label(hour), counts[TOTAL], counts[RISKY], counts[SUCCESS])
+            for (hour, p, k), counts in self.hourly.items()
+            if p == platform and k == keyword
+        ]
+        series.sort()
+        return series
+
+    def flush(self, result_store):
+        """마지막 flush 이후 증가분을 결과 저장소 롤업 테이블에 반영"""
+        if not self._dirty:
+            return 0
+
+        rows = [
+            (hour_label(hour), platform, keyword, counts[TOTAL], counts[RISKY], counts[SUCCESS])
+            for (hour, platform, keyword), counts in self._dirty.items()
+        ]
+        result_store.add_rollups(rows)
+        self._dirty = {}
+
+        # 저장이 끝난 오래된 시간 버킷은 메모리에서 제거
+        if self.hourly:
+            oldest = max(hour for hour, _, _ in self.hourly) - self.window_hours
+            self.hourly = {key: counts for key, counts in self.hourly.items() if key[0] > oldest}
+
+        return len(rows)
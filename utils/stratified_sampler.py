@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+층화 표본 기반 유병률 추정기
+"""
+
+import csv
+import math
+import random
+from collections import OrderedDict
+from statistics import NormalDist
+
+
+def sample_size(population, margin=0.05, z=1.96, p=0.5):
+    """비율 추정에 필요한 표본 수 (유한 모집단 보정 포함)"""
+    if population <= 0:
+        return 0
+    n0 = z * z * p * (1 - p) / (margin * margin)
+    return min(population, math.ceil(n0 / (1 + (n0 - 1) / population)))
+
+
+def wilson_interval(p_hat, n, z=1.96):
+    """Wilson 점수 신뢰구간 (n은 유효 표본 수)"""
+    if n <= 0:
+        return 0.0, 1.0
+    denominator = 1 + z * z / n
+    center = (p_hat + z * z / (2 * n)) / denominator
+    half = z * math.sqrt(p_hat * (1 - p_hat) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class Stratum:
+    """(플랫폼, 키워드, 사전 점수 구간) 층"""
+
+    __slots__ = ('platform', 'keyword', 'band', 'population', 'target', 'analyzed', 'risky')
+
+    def __init__(self, platform, keyword, band):
+        self.platform = platform
+        self.keyword = keyword
+        self.band = band
+        self.population = 0
+        self.target = 0  # 분석할 표본 수
+        self.analyzed = 0
+        self.risky = 0
+
+
+class StratifiedSampler:
+    """수집 게시글을 층화 추출해 일부만 LLM으로 분석하고 유병률을 추정
+
+    층은 (플랫폼, 키워드, 키워드 사전 점수 구간)이다. (플랫폼, 키워드) 셀마다
+    오차 한계 margin을 만족하는 표본 수를 구해 점수 구간별 모집단 크기에
+    비례해 나누고(구간마다 최소 min_per_stratum건), census_top이면 가장 높은
+    점수 구간은 전수 분석한다. 표본은 층을 번갈아 가며 내보내므로 분석이
+    진행되는 동안에도 모든 층의 추정치가 고르게 갱신된다.
+
+    셀 추정치는 층별 비율의 가중 평균이고, 신뢰구간은 층화 분산으로 구한
+    유효 표본 수에 Wilson 구간을 적용한다.
+    """
+
+    def __init__(self, prescorer, score_bands=(0.1, 0.3), margin=0.05, confidence=0.95,
+                 min_per_stratum=10, census_top=False, seed=None):
+        self.prescorer = prescorer
+        self.score_bands = sorted(score_bands)
+        self.margin = margin
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.confidence = confidence
+        self.min_per_stratum = min_per_stratum
+        self.census_top = census_top
+        self.random = random.Random(seed)
+        self.strata = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config, prescorer, census_top=False, seed=None):
+        """설정 객체로부터 생성 - 같은 seed면 같은 게시글 목록에서 같은 표본을 뽑음"""
+        return cls(
+            prescorer,
+            score_bands=config.sampling_score_bands,
+            margin=config.sampling_margin,
+            confidence=config.sampling_confidence,
+            min_per_stratum=config.sampling_min_per_stratum,
+            census_top=census_top,
+            seed=seed
+        )
+
+    def band_of(self, score):
+        """사전 점수 구간 번호 (0이 가장 낮음)"""
+        band = 0
+        for boundary in self.score_bands:
+            if score >= boundary:
+                band += 1
+        return band
+
+    def split(self, posts):
+        """게시글을 층에 배정하고 (표본 목록, 나머지 목록) 반환
+
+        표본 목록은 (게시글, 층 키, 사전 점수)를 층별로 번갈아 담고, 나머지는
+        (게시글, 사전 점수) 목록이다.
+        """
+        members = OrderedDict()
+        for post in posts:
+            score = self.prescorer.analyze(f"{post.title} {post.content}")[0]
+            key = (post.platform, post.keyword, self.band_of(score))
+            if key not in self.strata:
+                self.strata[key] = Stratum(*key)
+                members[key] = []
+            self.strata[key].population += 1
+            members[key].append((post, score))
+
+        self._allocate()
+
+        queues = []
+        rest = []
+        for key, entries in members.items():
+            self.random.shuffle(entries)
+            target = self.strata[key].target
+            queues.append([(post, key, score) for post, score in entries[:target]])
+            rest.extend(entries[target:])
+
+        sample = []
+        for round_items in _round_robin(queues):
+            sample.extend(round_items)
+        return sample, rest
+
+    def _allocate(self):
+        """(플랫폼, 키워드) 셀별 표본 수를 점수 구간에 비례 배분"""
+        top_band = len(self.score_bands)
+        cells = OrderedDict()
+        for stratum in self.strata.values():
+            cells.setdefault((stratum.platform, stratum.keyword), []).append(stratum)
+
+        for strata in cells.values():
+            population = sum(stratum.population for stratum in strata)
+            cell_target = sample_size(population, self.margin, self.z)
+            for stratum in strata:
+                if self.census_top and stratum.band == top_band:
+                    stratum.target = stratum.population
+                    continue
+                share = math.ceil(cell_target * stratum.population / population)
+                stratum.target = min(stratum.population, max(self.min_per_stratum, share))
+
+    def record(self, key, is_risky):
+        """표본 1건의 LLM 판정 반영"""
+        stratum = self.strata[key]
+        stratum.analyzed += 1
+        stratum.risky += is_risky == 'Y'
+
+    @property
+    def analyzed(self):
+        return sum(stratum.analyzed for stratum in self.strata.values())
+
+    @property
+    def target(self):
+        return sum(stratum.target for stratum in self.strata.values())
+
+    def estimates(self):
+        """(플랫폼, 키워드)별 및 전체 유병률 추정치 목록
+
+        아직 표본이 하나도 분석되지 않은 층은 제외하고 추정하며, 그런 층이
+        있으면 '완료' 값이 False이다.
+        """
+        cells = OrderedDict()
+        for stratum in self.strata.values():
+            cells.setdefault((stratum.platform, stratum.keyword), []).append(stratum)
+
+        rows = [self._estimate(platform, keyword, strata) for (platform, keyword), strata in cells.items()]
+        if len(cells) > 1:
+            rows.append(self._estimate('전체', '전체', list(self.strata.values())))
+        return rows
+
+    def _estimate(self, platform, keyword, strata):
+        """층화 추정 - 가중 비율, 층화 분산 기반 유효 표본 수, Wilson 구간"""
+        population = sum(stratum.population for stratum in strata)
+        observed = [stratum for stratum in strata if stratum.analyzed]
+        covered = sum(stratum.population for stratum in observed)
+
+        p_hat = 0.0
+        variance = 0.0
+        for stratum in observed:
+            weight = stratum.population / covered
+            p_h = stratum.risky / stratum.analyzed
+            p_hat += weight * p_h
+            fpc = 1 - stratum.analyzed / stratum.population
+            variance += weight * weight * fpc * p_h * (1 - p_h) / stratum.analyzed
+
+        analyzed = sum(stratum.analyzed for stratum in observed)
+        if variance > 0:
+            effective = min(covered, p_hat * (1 - p_hat) / variance)
+        else:
+            effective = covered if analyzed >= covered else analyzed
+        low, high = wilson_interval(p_hat, effective, self.z) if analyzed else (0.0, 1.0)
+
+        return {
+            '플랫폼': platform,
+            '키워드': keyword,
+            '모집단': population,
+            '표본': analyzed,
+            '표본_위험': sum(stratum.risky for stratum in observed),
+            '추정_위험비율': round(p_hat, 4),
+            '신뢰구간_하한': round(low, 4),
+            '신뢰구간_상한': round(high, 4),
+            '추정_위험게시글': round(p_hat * population),
+            '완료': len(observed) == len(strata) and all(s.analyzed >= s.target for s in strata)
+        }
+
+    def progress_line(self):
+        """진행 중 전체 추정치 한 줄 요약"""
+        row = self.estimates()[-1]
+        return (f"[표본 {self.analyzed}/{self.target}] 추정 위험비율 {row['추정_위험비율'] * 100:.1f}% "
+                f"({self.confidence * 100:.0f}% 신뢰구간 {row['신뢰구간_하한'] * 100:.1f}~{row['신뢰구간_상한'] * 100:.1f}%)")
+
+    def write_csv(self, path):
+        """추정치 CSV 저장 (셀별 + 층별)"""
+        rows = self.estimates()
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) + ['점수구간', '층_표본목표'])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+            for stratum in self.strata.values():
+                writer.writerow({
+                    '플랫폼': stratum.platform,
+                    '키워드': stratum.keyword,
+                    '점수구간': stratum.band,
+                    '모집단': stratum.population,
+                    '층_표본목표': stratum.target,
+                    '표본': stratum.analyzed,
+                    '표본_위험': stratum.risky,
+                    '추정_위험비율': round(stratum.risky / stratum.analyzed, 4) if stratum.analyzed else '',
+                    '완료': stratum.analyzed >= stratum.target
+                })
+        return path
+
+
+def _round_robin(queues):
+    """각 목록에서 하나씩 번갈아 꺼낸 묶음을 차례로 반환"""
+    for index in range(max((len(queue) for queue in queues), default=0)):
+        yield [queue[index] for queue in queues if index < len(queue)]
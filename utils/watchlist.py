@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+위험 게시글 작성 계정 감시 목록
+"""
+
+import urllib.parse
+from datetime import datetime, timedelta
+
+
+WATCH_KEYWORD = "감시계정"  # 감시 계정 폴링으로 수집한 게시글의 키워드 값
+
+# 계정 단위로 새 글을 직접 조회할 수 있는 플랫폼 (디시인사이드 닉네임은 고유하지 않아 제외)
+WATCHABLE_PLATFORMS = ('Twitter', 'Naver Blog')
+
+
+def source_of(post):
+    """게시글 작성 계정 (계정 ID, 링크) - 감시할 수 없으면 None
+
+    Twitter는 author_id, 네이버 블로그는 bloggerlink의 블로그 ID를 쓴다.
+    """
+    if post.platform == 'Twitter' and post.author:
+        return post.author, f"https://twitter.com/i/user/{post.author}"
+    if post.platform == 'Naver Blog' and post.author_link:
+        link = post.author_link if '://' in post.author_link else f"https://{post.author_link}"
+        blog_id = urllib.parse.urlsplit(link).path.strip('/').split('/')[0]
+        if blog_id:
+            return blog_id, link
+    return None
+
+
+class Watchlist:
+    """위험 판정 게시글의 작성 계정을 감쇠 점수로 관리하고 폴링 순서를 정함
+
+    위험 판정 게시글마다 한 번씩 계정 점수에 위험 점수를 더하고, 점수는 반감기
+    half_life_days로 줄어든다. 폴링 간격은 base_interval_hours / 점수
+    (min~max 범위)이므로 최근 위험 글을 많이 쓴 계정일수록 자주 확인한다.
+    한 주기에 폴링하는 계정은 max_polls_per_cycle개 이하이고 계정당 요청 수도
+    크롤러에서 제한하므로 주기당 요청 수에 상한이 있다.
+    """
+
+    def __init__(self, result_store, half_life_days=30, min_score=0.1, base_interval_hours=24,
+                 min_interval_hours=1, max_interval_hours=168, max_polls_per_cycle=30):
+        self.store = result_store
+        self.half_life_days = half_life_days
+        self.min_score = min_score
+        self.base_interval_hours = base_interval_hours
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.max_polls_per_cycle = max_polls_per_cycle
+        self._pending = {}  # 위험 게시글 URL → (플랫폼, 계정, 링크, 위험 점수)
+
+    @classmethod
+    def from_config(cls, config, result_store):
+        """설정 객체로부터 생성"""
+        return cls(
+            result_store,
+            half_life_days=config.watch_account_half_life_days,
+            min_score=config.watch_account_min_score,
+            base_interval_hours=config.watch_account_base_interval_hours,
+            min_interval_hours=config.watch_account_min_interval_hours,
+            max_interval_hours=config.watch_account_max_interval_hours,
+            max_polls_per_cycle=config.watch_account_max_polls
+        )
+
+    def record(self, result):
+        """분석 결과 반영 - 위험 판정이면 작성 계정 점수 누적 (flush()에서 기록)"""
+        if result.analysis_result.is_risky != 'Y':
+            return
+        post = result.post_data
+        source = source_of(post)
+        if source is None:
+            return
+
+        # 같은 게시글은 다시 수집·분석돼도 한 번만 반영 (저장소에서도 URL 단위로 중복 제거)
+        self._pending[post.url] = (
+            post.platform, source[0], source[1], max(result.analysis_result.risk_score, self.min_score)
+        )
+
+    def flush(self):
+        """누적한 위험 판정을 감쇠 점수로 기록 - 이미 반영한 게시글은 제외"""
+        if not self._pending:
+            return
+        self.store.add_watch_flags(
+            [(url, *entry) for url, entry in self._pending.items()], self.decayed
+        )
+        self._pending.clear()
+
+    def decayed(self, score, scored_at, now=None):
+        """scored_at 이후 반감기만큼 줄어든 점수"""
+        now = now or datetime.now()
+        elapsed = (now - _parse_time(scored_at)).total_seconds() / 86400
+        return score * 0.5 ** (max(0.0, elapsed) / self.half_life_days)
+
+    def interval(self, score):
+        """점수에 따른 폴링 간격"""
+        hours = self.base_interval_hours / max(score, 1e-6)
+        return timedelta(hours=min(self.max_interval_hours, max(self.min_interval_hours, hours)))
+
+    def due(self, platforms=WATCHABLE_PLATFORMS, now=None):
+        """이번 주기에 폴링할 계정 목록 (우선순위 순, 최대 max_polls_per_cycle개)
+
+        우선순위는 감쇠 점수 × 밀린 정도(마지막 폴링 후 경과 시간 / 폴링 간격,
+        최대 10배)이며, 아직 폴링하지 않은 계정은 가장 밀린 것으로 본다. 각
+        계정 dict에는 현재 점수('current_score')가 추가된다.
+        """
+        now = now or datetime.now()
+        candidates = []
+        for account in self.store.get_watch_accounts():
+            if account['platform'] not in platforms:
+                continue
+            score = self.decayed(account['score'], account['scored_at'], now)
+            if score < self.min_score:
+                continue
+
+            if account['last_polled']:
+                overdue = (now - _parse_time(account['last_polled'])) / self.interval(score)
+                if overdue < 1:
+                    continue
+            else:
+                overdue = 10.0
+            account['current_score'] = score
+            candidates.append((score * min(overdue, 10.0), account))
+
+        candidates.sort(key=lambda entry: entry[0], reverse=True)
+        return [account for _, account in candidates[:self.max_polls_per_cycle]]
+
+    def mark_polled(self, account, cursor):
+        """폴링 완료 기록 (cursor: 다음 폴링에서 이보다 새 글만 가져올 기준)"""
+        self.store.set_watch_cursor(account['platform'], account['account'], cursor)
+
+    def summary(self, now=None):
+        """플랫폼별 감시 계정 수 - {플랫폼: (활성 계정, 전체 계정)}"""
+        now = now or datetime.now()
+        counts = {}
+        for account in self.store.get_watch_accounts():
+            active, total = counts.get(account['platform'], (0, 0))
+            is_active = self.decayed(account['score'], account['scored_at'], now) >= self.min_score
+            counts[account['platform']] = (active + is_active, total + 1)
+        return counts
+
+
+def _parse_time(value):
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
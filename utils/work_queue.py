@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 기반 로컬 작업 큐 및 공유 요청 속도 제한기
+"""
+
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT UNIQUE,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    priority REAL NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, kind, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(status, lease_expires);
+
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class Job:
+    """임대(lease)된 작업"""
+
+    __slots__ = ('job_id', 'kind', 'payload', 'attempts')
+
+    def __init__(self, job_id, kind, payload, attempts):
+        self.job_id = job_id
+        self.kind = kind
+        self.payload = payload
+        self.attempts = attempts
+
+
+class WorkQueue:
+    """여러 워커 프로세스가 공유하는 내구성 작업 큐
+
+    작업은 임대 시간(lease) 동안만 한 워커에 배정되며, 시간 내에 완료되지
+    않으면 다른 워커가 다시 가져간다. 실패한 작업은 지수 백오프 후 재시도하고
+    max_attempts를 넘으면 'failed'로 남는다.
+
+    같은 호스트의 프로세스끼리는 WAL 모드로 충분하다. 네트워크 파일시스템으로
+    여러 호스트가 저장소를 공유할 때는 journal_mode='DELETE'를 사용해야 한다.
+    """
+
+    def __init__(self, db_path, journal_mode='WAL', busy_timeout=30):
+        """작업 큐 초기화"""
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.conn = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """이전 버전 큐 저장소에 없는 컬럼 추가"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if 'priority' not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN priority REAL NOT NULL DEFAULT 0")
+
+    def _transaction(self):
+        """쓰기 잠금을 즉시 획득하는 트랜잭션 시작"""
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    def publish(self, kind, payload, job_key=None, max_attempts=3, priority=0.0):
+        """작업 등록 - 같은 job_key가 이미 있으면 무시, priority가 높은 작업부터 임대"""
+        now = time.time()
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO jobs (job_key, kind, payload, max_attempts, priority, available_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_key, kind, json.dumps(payload, ensure_ascii=False), max_attempts, priority, now, now, now)
+        )
+        return cursor.rowcount > 0
+
+    def lease(self, worker_id, kinds=None, lease_seconds=300):
+        """대기 중인 작업 1건 임대 - 없으면 None"""
+        now = time.time()
+        self._transaction()
+        try:
+            # 임대 시간이 지난 작업은 다시 대기 상태로 (재시도 한도를 다 쓴 작업은 'failed')
+            self.conn.execute(
+                "UPDATE jobs SET "
+                "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, last_error = '임대 시간 만료', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ?",
+                (now, now)
+            )
+
+            query = "SELECT job_id, kind, payload, attempts FROM jobs WHERE status = 'pending' AND available_at <= ?"
+            params = [now]
+            if kinds:
+                query += f" AND kind IN ({','.join('?' for _ in kinds)})"
+                params.extend(kinds)
+            query += " ORDER BY priority DESC, available_at, job_id LIMIT 1"
+
+            row = self.conn.execute(query, params).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            self.conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE job_id = ?",
+                (worker_id, now + lease_seconds, now, row['job_id'])
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        return Job(row['job_id'], row['kind'], json.loads(row['payload']), row['attempts'] + 1)
+
+    def extend_lease(self, job, worker_id, lease_seconds=300, conn=None):
+        """장시간 작업의 임대 시간 연장 - 아직 임대 중이면 True"""
+        now = time.time()
+        cursor = (conn or self.conn).execute(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+            "WHERE job_id = ? AND lease_owner = ? AND status = 'leased'",
+            (now + lease_seconds, now, job.job_id, worker_id)
+        )
+        return cursor.rowcount > 0
+
+    def heartbeat(self, job, worker_id, lease_seconds=300):
+        """작업을 처리하는 동안 백그라운드 스레드에서 임대 시간을 주기적으로 연장
+
+        with queue.heartbeat(job, worker_id, lease_seconds): ... 형태로 사용한다.
+        워커가 죽으면 연장이 멈추므로 임대가 만료되어 다른 워커가 가져간다.
+        """
+        return LeaseHeartbeat(self, job, worker_id, lease_seconds)
+
+    def complete(self, job, worker_id):
+        """작업 완료 처리"""
+        self.conn.execute(
+            "UPDATE jobs SET status = 'done', lease_owner = NULL, updated_at = ? "
+            "WHERE job_id = ? AND lease_owner = ?",
+            (time.time(), job.job_id, worker_id)
+        )
+
+    def fail(self, job, worker_id, error, base_delay=5.0):
+        """작업 실패 처리 - 재시도 한도 내면 백오프 후 재등록"""
+        now = time.time()
+        delay = base_delay * (2 ** (job.attempts - 1)) * random.uniform(0.5, 1.5)
+        self.conn.execute(
+            "UPDATE jobs SET "
+            "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, available_at = ?, last_error = ?, updated_at = ? "
+            "WHERE job_id = ? AND lease_owner = ?",
+            (now + delay, str(error)[:500], now, job.job_id, worker_id)
+        )
+
+    def defer(self, job, worker_id, delay):
+        """작업을 실패로 집계하지 않고 delay초 뒤로 미룸"""
+        now = time.time()
+        self.conn.execute(
+            "UPDATE jobs SET status = 'pending', lease_owner = NULL, attempts = attempts - 1, "
+            "available_at = ?, updated_at = ? WHERE job_id = ? AND lease_owner = ?",
+            (now + delay, now, job.job_id, worker_id)
+        )
+
+    def counts(self):
+        """상태별 작업 수"""
+        rows = self.conn.execute("SELECT status, COUNT(*) AS cnt FROM jobs GROUP BY status")
+        return {row['status']: row['cnt'] for row in rows}
+
+    def has_open_jobs(self):
+        """대기/진행 중인 작업이 남아 있는지 확인"""
+        row = self.conn.execute(
+            "SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1"
+        ).fetchone()
+        return row is not None
+
+    def take_token(self, name, rate, burst):
+        """공유 토큰 버킷에서 토큰 1개 획득 - 성공 시 0, 아니면 대기할 초 반환"""
+        now = time.time()
+        self._transaction()
+        try:
+            row = self.conn.execute(
+                "SELECT tokens, updated_at FROM rate_buckets WHERE name = ?", (name,)
+            ).fetchone()
+            tokens = burst if row is None else min(burst, row['tokens'] + (now - row['updated_at']) * rate)
+
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate
+
+            self.conn.execute(
+                "INSERT INTO rate_buckets (name, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (name, tokens, now)
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+
+class LeaseHeartbeat:
+    """임대 시간의 1/3마다 extend_lease()를 호출하는 컨텍스트 (스레드 전용 연결 사용)"""
+
+    def __init__(self, queue, job, worker_id, lease_seconds):
+        self.queue = queue
+        self.job = job
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, name=f"lease-{self.job.job_id}", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+    def _run(self):
+        conn = sqlite3.connect(self.queue.db_path, timeout=self.queue.busy_timeout, isolation_level=None)
+        try:
+            while not self._stop.wait(max(1.0, self.lease_seconds / 3)):
+                try:
+                    if not self.queue.extend_lease(self.job, self.worker_id, self.lease_seconds, conn=conn):
+                        break
+                except sqlite3.Error as e:
+                    print(f"작업 {self.job.job_id} 임대 연장 실패: {e}")
+        finally:
+            conn.close()
+
+
+class SharedRateLimiter:
+    """작업 큐 저장소를 통해 모든 워커가 공유하는 플랫폼별 요청 속도 제한기"""
+
+    def __init__(self, queue, rates, burst=1):
+        """rates: {플랫폼 이름: 초당 허용 요청 수}"""
+        self.queue = queue
+        self.rates = rates
+        self.burst = burst
+
+    def acquire(self, platform):
+        """요청 1회 허용될 때까지 대기"""
+        rate = self.rates.get(platform)
+        if not rate:
+            return
+
+        while True:
+            wait = self.queue.take_token(platform, rate, self.burst)
+            if wait <= 0:
+                return
+            time.sleep(wait)